@@ -0,0 +1,207 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_midi.batch`
+================================================================================
+
+Parallel processing of collections of Standard MIDI Files on a host computer,
+e.g. validation, conversion or statistics jobs over thousands of files.
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* CPython, this uses :mod:`concurrent.futures` which CircuitPython does not have.
+  With ``workers=0`` the files are processed in this process.
+
+Each file is opened and parsed with :class:`~adafruit_midi.smf.SMFReader` in
+a worker process. Only a few files per worker are submitted ahead so results
+stream back in order without a future for every file being held.
+
+It can also be run as a script with a transform given as ``module:function``::
+
+    python -m adafruit_midi.batch mypackage.stats:count_notes songs/ --workers 8
+
+"""
+
+import os
+import sys
+import time
+from collections import deque
+
+try:
+    from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+except ImportError:
+    pass
+
+from .smf import SMFReader
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MIDI.git"
+
+
+def _process(
+    path: str, transform: Callable[[str, SMFReader], Any], buffer_size: int
+) -> Tuple[Any, Optional[BaseException], int]:
+    """Run a transform on one file, in a worker."""
+    size = 0
+    try:
+        size = os.path.getsize(path)
+        with open(path, "rb") as file:
+            return transform(path, SMFReader(file, buffer_size=buffer_size)), None, size
+    except Exception as error:
+        return None, error, size
+
+
+class BatchStats:
+    """The progress of a :class:`BatchProcessor` run."""
+
+    def __init__(self) -> None:
+        self.files = 0
+        """The number of files processed."""
+        self.errors = 0
+        """The number of files which raised an exception."""
+        self.bytes = 0
+        """The total size of the files processed."""
+        self.start = time.monotonic()
+        self.elapsed = 0.0
+        """The seconds since the run started, updated as each result arrives."""
+
+    @property
+    def files_per_second(self) -> float:
+        """The number of files processed per second."""
+        return self.files / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        """The number of bytes processed per second."""
+        return self.bytes / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.files} files ({self.errors} errors), {self.bytes} bytes in "
+            f"{self.elapsed:.2f}s, {self.files_per_second:.1f} files/s, "
+            f"{self.bytes_per_second / 1e6:.2f} MB/s"
+        )
+
+
+class BatchProcessor:
+    """Runs a function on each of many MIDI files across a process pool.
+
+    :param transform: A function taking the path and an
+        :class:`~adafruit_midi.smf.SMFReader` of the file which returns a result.
+        It must be defined at the top level of a module so worker processes
+        can import it and its result must be picklable.
+    :param int workers: The number of worker processes, default None for one
+        per CPU, 0 processes the files in this process.
+    :param int ahead: The number of files per worker submitted ahead of the
+        result being returned, default 4.
+    :param int buffer_size: The read buffer size for each track, default 4096.
+    """
+
+    def __init__(
+        self,
+        transform: Callable[[str, SMFReader], Any],
+        *,
+        workers: Optional[int] = None,
+        ahead: int = 4,
+        buffer_size: int = 4096,
+    ) -> None:
+        if workers is None:
+            workers = os.cpu_count() or 1
+        self.transform = transform
+        self.workers = workers
+        self.ahead = ahead
+        self.buffer_size = buffer_size
+        self.stats = BatchStats()
+        """The :class:`BatchStats` of the current or last run."""
+
+    def _record(self, size: int, error: Optional[BaseException]) -> None:
+        stats = self.stats
+        stats.files += 1
+        stats.bytes += size
+        if error is not None:
+            stats.errors += 1
+        stats.elapsed = time.monotonic() - stats.start
+
+    def run(self, paths: Iterable[str]) -> Iterator[Tuple[str, Any, Optional[BaseException]]]:
+        """Process the files, results are returned in the order of ``paths``.
+
+        :returns: (path, result, error) tuples where error is the exception
+            the file raised, e.g. a ``ValueError`` for a corrupt file, or None.
+        """
+        self.stats = BatchStats()
+        if not self.workers:
+            for path in paths:
+                result, error, size = _process(path, self.transform, self.buffer_size)
+                self._record(size, error)
+                yield path, result, error
+            return
+        # Imported here as it is large and not needed with workers=0
+        from concurrent.futures import ProcessPoolExecutor
+
+        limit = self.workers * self.ahead
+        pending = deque()
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            for path in paths:
+                pending.append(
+                    (path, executor.submit(_process, path, self.transform, self.buffer_size))
+                )
+                if len(pending) >= limit:
+                    yield self._next(pending)
+            while pending:
+                yield self._next(pending)
+
+    def _next(self, pending: deque) -> Tuple[str, Any, Optional[BaseException]]:
+        path, future = pending.popleft()
+        result, error, size = future.result()
+        self._record(size, error)
+        return path, result, error
+
+
+def find_files(paths: Iterable[str]) -> Iterator[str]:
+    """Expand directories to the ``.mid`` and ``.midi`` files in them,
+    recursively and in sorted order. Other paths are returned as they are."""
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                if name.lower().endswith((".mid", ".midi")):
+                    yield os.path.join(root, name)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run a transform over files from the command line, printing each
+    result and the throughput."""
+    import argparse
+    import importlib
+
+    parser = argparse.ArgumentParser(prog="python -m adafruit_midi.batch")
+    parser.add_argument("transform", help="the function to run as module:function")
+    parser.add_argument("paths", nargs="+", help="files and directories of .mid files")
+    parser.add_argument("--workers", type=int, default=None, help="default one per CPU")
+    args = parser.parse_args(argv)
+
+    module_name, _, function_name = args.transform.partition(":")
+    transform = getattr(importlib.import_module(module_name), function_name)
+    processor = BatchProcessor(transform, workers=args.workers)
+    for path, result, error in processor.run(find_files(args.paths)):
+        if error is None:
+            print(f"{path}\t{result!r}")
+        else:
+            print(f"{path}\tERROR {type(error).__name__}: {error}")
+    print(processor.stats, file=sys.stderr)
+    return 1 if processor.stats.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
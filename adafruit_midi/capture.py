@@ -0,0 +1,404 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_midi.capture`
+================================================================================
+
+Compact timestamped capture of received MIDI data to a binary log and replay
+of the log at real time or any speed, for debugging and load testing with
+recorded traffic.
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* ``mmap`` is used to read logs by path where it is available.
+
+The log starts with ``MIDICAP\\x01``. Each read is stored as a varint delta
+time in microseconds from the previous read, a varint length and the bytes
+exactly as read. Every ``index_interval`` reads a checkpoint of zero length
+holding the absolute time is added so replay can start from the middle of
+the log. Closing the writer appends an index of the checkpoints, a log
+without one, e.g. from a device which lost power, is scanned when opened.
+
+"""
+
+import time
+
+try:
+    from typing import BinaryIO, Iterator, Optional, Tuple, Union
+except ImportError:
+    pass
+
+from .midi_message import MIDIMessage
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MIDI.git"
+
+MAGIC = b"MIDICAP\x01"
+"""The first bytes of a capture log."""
+
+_INDEX_MAGIC = b"MIDCAPIX"
+# Index offset and magic at the end of a closed log
+_TRAILER_LENGTH = 16
+
+_ALL_CHANNELS = tuple(range(16))
+
+
+def _append_varint(out: bytearray, value: int) -> None:
+    """Append a variable length value, 7 bits per byte, most significant first."""
+    shift = 7
+    while value >> shift:
+        shift += 7
+    while shift > 7:
+        shift -= 7
+        out.append(value >> shift & 0x7F | 0x80)
+    out.append(value & 0x7F)
+
+
+def _read_varint(data, offset: int) -> Tuple[int, int]:
+    """Read a variable length value, returns the value and the offset after it."""
+    value = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value = value << 7 | byte & 0x7F
+        if not byte & 0x80:
+            return value, offset
+
+
+class CaptureWriter:
+    """Writes a capture log, appending to a buffer which is written to the file
+    when it fills.
+
+    :param file: A binary file open for writing, it does not need to be seekable.
+    :param int buffer_size: Write to the file when this much is buffered, default 4096.
+    :param int index_interval: The number of reads between checkpoints, default 256.
+    """
+
+    def __init__(
+        self, file: BinaryIO, *, buffer_size: int = 4096, index_interval: int = 256
+    ) -> None:
+        if index_interval < 1:
+            raise ValueError("index_interval must be at least 1")
+        self._file = file
+        self.buffer_size = buffer_size
+        self.index_interval = index_interval
+        self.records = 0
+        """The number of reads recorded."""
+        self._buf = bytearray(MAGIC)
+        self._written = 0
+        self._last_us = None
+        self._index = []
+
+    def record(self, data: bytes, now: Optional[float] = None) -> None:
+        """Add data read from a port, empty reads are not recorded.
+
+        :param float now: The time the data was read in seconds, defaults
+            to ``time.monotonic()``.
+        """
+        if not data:
+            return
+        if now is None:
+            now = time.monotonic()
+        now_us = int(now * 1000000)
+        buf = self._buf
+        if self._last_us is None:
+            self._last_us = now_us
+        if self.records % self.index_interval == 0:
+            # The checkpoint is the time of the previous read so the next delta applies
+            self._index.append((self._written + len(buf), self._last_us))
+            buf.append(0)
+            buf.append(0)
+            _append_varint(buf, self._last_us)
+        # A clock which steps backwards is treated as no time passing
+        _append_varint(buf, max(now_us - self._last_us, 0))
+        self._last_us = max(now_us, self._last_us)
+        _append_varint(buf, len(data))
+        buf.extend(data)
+        self.records += 1
+        if len(buf) >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the buffer to the file."""
+        if self._buf:
+            self._file.write(self._buf)
+            self._written += len(self._buf)
+            self._buf = bytearray()
+        if hasattr(self._file, "flush"):
+            self._file.flush()
+
+    def close(self) -> None:
+        """Write the buffer and the index, the file is not closed."""
+        buf = self._buf
+        index_offset = self._written + len(buf)
+        _append_varint(buf, self._last_us or 0)
+        _append_varint(buf, len(self._index))
+        for offset, time_us in self._index:
+            _append_varint(buf, offset)
+            _append_varint(buf, time_us)
+        buf.extend(index_offset.to_bytes(8, "little"))
+        buf.extend(_INDEX_MAGIC)
+        self.flush()
+
+    def __enter__(self) -> "CaptureWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class CapturePort:
+    """Wraps an input port and records everything read from it, use it as the
+    ``midi_in`` of an :class:`adafruit_midi.MIDI` object.
+
+    :param port: The object which implements ``read(length)``,
+        e.g. ``usb_midi.ports[0]``.
+    :param CaptureWriter writer: The log to record to.
+    """
+
+    def __init__(self, port, writer: CaptureWriter) -> None:
+        self._port = port
+        self.writer = writer
+
+    def read(self, length: int) -> bytes:
+        """Read from the port and record the data."""
+        data = self._port.read(length)
+        if data:
+            self.writer.record(data)
+        return data
+
+
+class CaptureReader:
+    """Reads a capture log.
+
+    :param source: The path of the log, which is memory mapped if ``mmap`` is
+        available, or the log as a bytes-like object.
+    """
+
+    def __init__(self, source: Union[str, bytes, bytearray, memoryview]) -> None:
+        self._file = None
+        if isinstance(source, str):
+            self._file = open(source, "rb")
+            try:
+                import mmap
+
+                source = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ImportError, AttributeError, OSError, ValueError):
+                # No mmap or an empty file
+                source = self._file.read()
+        self._data = source
+        if bytes(source[: len(MAGIC)]) != MAGIC:
+            self.close()
+            raise ValueError("Not a capture log")
+        try:
+            # The trailer bytes could also be the end of the data of a log
+            # which was not closed so it is only used if the index is valid
+            if not self._read_index():
+                self._scan()
+        except Exception:
+            self.close()
+            raise
+
+    def _read_index(self) -> bool:
+        """Read the index of a closed log, returns False if there is no valid index."""
+        data = self._data
+        trailer = len(data) - _TRAILER_LENGTH
+        if trailer < len(MAGIC) or bytes(data[trailer + 8 :]) != _INDEX_MAGIC:
+            return False
+        end = int.from_bytes(data[trailer : trailer + 8], "little")
+        if not len(MAGIC) <= end <= trailer:
+            return False
+        try:
+            end_us, offsets, times, offset = self._parse_index(end)
+        except (IndexError, ValueError):
+            return False
+        if offset != trailer:
+            return False
+        self._end = end
+        self._end_us = end_us
+        self._offsets = offsets
+        self._times = times
+        return True
+
+    def _parse_index(self, end: int) -> Tuple[int, list, list, int]:
+        """Parse the index at ``end``, returns it and the offset after it."""
+        data = self._data
+        end_us, offset = _read_varint(data, end)
+        count, offset = _read_varint(data, offset)
+        offsets = []
+        times = []
+        for _ in range(count):
+            position, offset = _read_varint(data, offset)
+            time_us, offset = _read_varint(data, offset)
+            if not len(MAGIC) <= position < end or (times and time_us < times[-1]):
+                raise ValueError("Bad index")
+            offsets.append(position)
+            times.append(time_us)
+        return end_us, offsets, times, offset
+
+    def _scan(self) -> None:
+        data = self._data
+        self._offsets = []
+        self._times = []
+        self._end_us = 0
+        end = len(data)
+        offset = valid_end = len(MAGIC)
+        time_us = 0
+        while offset < end:
+            try:
+                delta, offset = _read_varint(data, offset)
+                length, offset = _read_varint(data, offset)
+                if not length:
+                    checkpoint, offset = _read_varint(data, offset)
+            except IndexError:
+                break
+            if not length:
+                time_us = checkpoint
+                self._offsets.append(valid_end)
+                self._times.append(time_us)
+            elif offset + length > end:
+                break
+            else:
+                time_us += delta
+                offset += length
+            self._end_us = time_us
+            valid_end = offset
+        # Ignore a partly written read at the end
+        self._end = valid_end
+
+    @property
+    def start(self) -> float:
+        """The time of the first read in seconds, from the clock of the recording device."""
+        return self._times[0] / 1000000 if self._times else 0.0
+
+    @property
+    def duration(self) -> float:
+        """The time from the first read to the last in seconds."""
+        return (self._end_us - self._times[0]) / 1000000 if self._times else 0.0
+
+    def records(self, start: float = 0.0) -> Iterator[Tuple[float, bytes]]:
+        """Iterate over the reads from ``start`` seconds after the first.
+
+        :returns: (seconds, data) tuples where seconds is from the first read.
+        """
+        times = self._times
+        if not times:
+            return
+        start_us = times[0] + int(start * 1000000)
+        # The last checkpoint before the start, found by binary search
+        low, high = 0, len(times)
+        while low < high:
+            mid = (low + high) // 2
+            if times[mid] < start_us:
+                low = mid + 1
+            else:
+                high = mid
+        idx = max(low - 1, 0)
+        data = self._data
+        offset = self._offsets[idx]
+        end = self._end
+        time_us = 0
+        while offset < end:
+            delta, offset = _read_varint(data, offset)
+            length, offset = _read_varint(data, offset)
+            if not length:
+                time_us, offset = _read_varint(data, offset)
+                continue
+            time_us += delta
+            if time_us >= start_us:
+                yield (time_us - times[0]) / 1000000, bytes(data[offset : offset + length])
+            offset += length
+
+    def messages(
+        self, start: float = 0.0, channel: Optional[Union[int, Tuple[int, ...]]] = None
+    ) -> Iterator[Tuple[float, MIDIMessage]]:
+        """Parse the reads like :meth:`adafruit_midi.MIDI.receive` does.
+
+        :param int channel: The channel or channels to return messages for,
+            default None for all.
+        :returns: (seconds, message) tuples where seconds is the time of the
+            read which completed the message.
+        """
+        if channel is None:
+            channel = _ALL_CHANNELS
+        buf = bytearray()
+        for seconds, data in self.records(start):
+            buf.extend(data)
+            while buf:
+                msg, endplusone, _ = MIDIMessage.from_message_bytes(buf, channel)
+                if endplusone == 0:
+                    break
+                buf = buf[endplusone:]
+                if msg is not None:
+                    yield seconds, msg
+
+    def close(self) -> None:
+        """Close the file and memory map if the log was opened by path."""
+        if self._file is not None:
+            if hasattr(self._data, "close"):
+                self._data.close()
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "CaptureReader":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class ReplayPort:
+    """An input port which returns the reads of a capture log when they are
+    due, use it as the ``midi_in`` of an :class:`adafruit_midi.MIDI` object.
+
+    :param CaptureReader reader: The log.
+    :param float speed: The playback speed, e.g. 2.0 for twice as fast,
+        default 1.0. 0 returns the data as fast as it is read.
+    :param float start: The time in the log to start from in seconds, default 0.0.
+    """
+
+    def __init__(self, reader: CaptureReader, *, speed: float = 1.0, start: float = 0.0) -> None:
+        self.speed = speed
+        self._start = start
+        self._records = reader.records(start)
+        self._next = next(self._records, None)
+        self._pending = b""
+        self._origin = None
+
+    @property
+    def done(self) -> bool:
+        """True when all of the log has been read."""
+        return self._next is None and not self._pending
+
+    def read(self, length: int, now: Optional[float] = None) -> bytes:
+        """Return up to ``length`` bytes which are due, a long read is split
+        over calls like a real port.
+
+        :param float now: The current time in seconds, defaults to ``time.monotonic()``.
+        """
+        if now is None:
+            now = time.monotonic()
+        if self._origin is None:
+            self._origin = now
+        out = bytearray()
+        while len(out) < length:
+            if not self._pending:
+                if self._next is None:
+                    break
+                seconds, data = self._next
+                if self.speed and (seconds - self._start) / self.speed > now - self._origin:
+                    break
+                self._pending = data
+                self._next = next(self._records, None)
+            take = self._pending[: length - len(out)]
+            out.extend(take)
+            self._pending = self._pending[len(take) :]
+        return bytes(out)
@@ -0,0 +1,284 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_midi.chase`
+================================================================================
+
+Program, controller, pressure and pitch bend chasing so playback can start
+anywhere in a sequence with each channel set up as it would have been.
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+:class:`Chase` keeps the state changing messages of a sequence in three
+bytes each with a snapshot of the state every ``interval`` messages. The
+state at a time is a binary search for the snapshot before it then applying
+at most ``interval`` messages. Each snapshot takes about 2.5KB.
+
+"""
+
+from array import array
+
+try:
+    from typing import Iterable, List, Optional, Tuple
+except ImportError:
+    pass
+
+from .channel_pressure import ChannelPressure
+from .control_change import ControlChange
+from .control_change_values import (
+    ALL_CONTROLLERS_OFF,
+    ALL_NOTES_OFF,
+    ALL_SOUND_OFF,
+    BANK_SELECT,
+    BANK_SELECT_LSB,
+    DATA_DECREMENT,
+    DATA_ENTRY,
+    DATA_ENTRY_LSB,
+    DATA_INCREMENT,
+    NRPN_LSB,
+    NRPN_MSB,
+    RPN_LSB,
+    RPN_MSB,
+)
+from .controller_state import RPN, ControllerState
+from .midi_message import MIDIMessage
+from .pitch_bend import PitchBend
+from .program_change import ProgramChange
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MIDI.git"
+
+# Controllers which are actions or sent in another way rather than as values
+_NOT_CHASED = frozenset(
+    (
+        BANK_SELECT,
+        BANK_SELECT_LSB,
+        DATA_ENTRY,
+        DATA_ENTRY_LSB,
+        DATA_INCREMENT,
+        DATA_DECREMENT,
+        NRPN_LSB,
+        NRPN_MSB,
+        RPN_LSB,
+        RPN_MSB,
+        ALL_SOUND_OFF,
+        ALL_CONTROLLERS_OFF,
+        ALL_NOTES_OFF,
+    )
+)
+
+# Controllers Reset All Controllers leaves alone, from RP-015: bank select,
+# volume, pan, sound controllers, effects depths and parameter selection
+_NOT_RESET = frozenset(
+    (0, 32, 7, 39, 10, 42, *range(70, 80), *range(91, 96), NRPN_LSB, NRPN_MSB, RPN_LSB, RPN_MSB)
+)
+
+_UNSET = -1
+
+
+def _bisect_left(values, value) -> int:
+    """The index of the first item of sorted ``values`` which is >= ``value``."""
+    low, high = 0, len(values)
+    while low < high:
+        mid = (low + high) // 2
+        if values[mid] < value:
+            low = mid + 1
+        else:
+            high = mid
+    return low
+
+
+class ChaseState:
+    """The program, controllers, channel pressure and pitch bend of every channel,
+    only the values which have been set are sent by :meth:`messages`."""
+
+    def __init__(self) -> None:
+        self.controllers = ControllerState()
+        """The :class:`~adafruit_midi.controller_state.ControllerState` of the controller values."""
+        self._set = bytearray(16 * 128 // 8)
+        self._program = array("h", [_UNSET] * 16)
+        self._pressure = array("h", [_UNSET] * 16)
+        self._bend = array("h", [_UNSET] * 16)
+
+    def copy(self) -> "ChaseState":
+        """Return an independent copy of the state."""
+        state = ChaseState()
+        state.controllers = self.controllers.copy()
+        state._set[:] = self._set
+        state._program[:] = self._program
+        state._pressure[:] = self._pressure
+        state._bend[:] = self._bend
+        return state
+
+    def _is_set(self, channel: int, control: int) -> bool:
+        idx = channel << 7 | control
+        return bool(self._set[idx >> 3] & 1 << (idx & 7))
+
+    def _mark(self, channel: int, control: int, is_set: bool) -> None:
+        idx = channel << 7 | control
+        if is_set:
+            self._set[idx >> 3] |= 1 << (idx & 7)
+        else:
+            self._set[idx >> 3] &= ~(1 << (idx & 7)) & 0xFF
+
+    def program(self, channel: int) -> Optional[int]:
+        """The program on ``channel`` or None if it has not been set."""
+        value = self._program[channel]
+        return None if value == _UNSET else value
+
+    def pitch_bend(self, channel: int) -> Optional[int]:
+        """The pitch bend on ``channel`` or None if it has not been set."""
+        value = self._bend[channel]
+        return None if value == _UNSET else value
+
+    def apply(self, status: int, data1: int, data2: int = 0) -> None:
+        """Update the state from a channel message in wire format, messages
+        which do not change the state are ignored."""
+        command = status & 0xF0
+        channel = status & 0x0F
+        if command == 0xB0:
+            self.controllers.control_change(data1, data2, channel)
+            if data1 == ALL_CONTROLLERS_OFF:
+                for control in range(120):
+                    if control not in _NOT_RESET:
+                        self._mark(channel, control, False)
+                self._pressure[channel] = _UNSET
+                self._bend[channel] = _UNSET
+                return
+            self._mark(channel, data1, True)
+            if data1 < 32:
+                # A new MSB clears the LSB
+                self._mark(channel, data1 + 32, False)
+        elif command == 0xC0:
+            self._program[channel] = data1
+        elif command == 0xD0:
+            self._pressure[channel] = data1
+        elif command == 0xE0:
+            self._bend[channel] = data2 << 7 | data1
+
+    def observe(self, msg: Optional[MIDIMessage]) -> None:
+        """Update the state from a message object, see :meth:`apply`."""
+        if msg is None or msg._STATUS is None or not 0xB0 <= msg._STATUS <= 0xE0:
+            return
+        data = msg.__bytes__()
+        self.apply(data[0], data[1], data[2] if len(data) > 2 else 0)
+
+    def messages(self, channel: Optional[int] = None) -> List[MIDIMessage]:
+        """The fewest messages which set up ``channel`` or every channel
+        in this state from power on.
+
+        For each channel these are bank select then program, the other
+        controllers, RPN and NRPN values, the selected parameter, channel
+        pressure and pitch bend.
+        """
+        msgs = []
+        for chan in range(16) if channel is None else (channel,):
+            self._channel_messages(chan, msgs)
+        return msgs
+
+    def _channel_messages(self, channel: int, msgs: List[MIDIMessage]) -> None:
+        controllers = self.controllers
+        for control in (BANK_SELECT, BANK_SELECT_LSB):
+            if self._is_set(channel, control):
+                msgs.append(
+                    ControlChange(control, controllers.value(control, channel), channel=channel)
+                )
+        if self._program[channel] != _UNSET:
+            msgs.append(ProgramChange(self._program[channel], channel=channel))
+        for control in range(128):
+            if control not in _NOT_CHASED and self._is_set(channel, control):
+                msgs.append(
+                    ControlChange(control, controllers.value(control, channel), channel=channel)
+                )
+
+        parameters = controllers.parameters(channel)
+        for kind, number, value in parameters:
+            self._select(kind, number, channel, msgs)
+            msgs.append(ControlChange(DATA_ENTRY, value >> 7, channel=channel))
+            msgs.append(ControlChange(DATA_ENTRY_LSB, value & 0x7F, channel=channel))
+        # Setting the values leaves the last parameter selected
+        selected = controllers.selected(channel)
+        last = parameters[-1][:2] if parameters else None
+        if selected is not None and selected != last:
+            self._select(selected[0], selected[1], channel, msgs)
+        elif selected is None and parameters:
+            # Deselect so later Data Entry does not change the last parameter
+            self._select(RPN, 0x3FFF, channel, msgs)
+
+        if self._pressure[channel] != _UNSET:
+            msgs.append(ChannelPressure(self._pressure[channel], channel=channel))
+        if self._bend[channel] != _UNSET:
+            msgs.append(PitchBend(self._bend[channel], channel=channel))
+
+    @staticmethod
+    def _select(kind: int, number: int, channel: int, msgs: List[MIDIMessage]) -> None:
+        msb, lsb = (RPN_MSB, RPN_LSB) if kind == RPN else (NRPN_MSB, NRPN_LSB)
+        msgs.append(ControlChange(msb, number >> 7, channel=channel))
+        msgs.append(ControlChange(lsb, number & 0x7F, channel=channel))
+
+
+class Chase:
+    """An index of the state changing messages of a sequence for finding
+    the state at any time.
+
+    :param events: (time, message) pairs in time order, the time can be in
+        any unit, e.g. seconds or ticks. Messages which do not change the
+        state are skipped.
+    :param int interval: The number of state changing messages between
+        snapshots, default 256.
+    """
+
+    def __init__(self, events: Iterable[Tuple[float, MIDIMessage]], *, interval: int = 256) -> None:
+        if interval < 1:
+            raise ValueError("interval must be at least 1")
+        self.interval = interval
+        self._times = array("d")
+        self._data = bytearray()
+        self._snapshots = []
+        state = ChaseState()
+        for time, msg in events:
+            if msg._STATUS is None or not 0xB0 <= msg._STATUS <= 0xE0:
+                continue
+            if len(self._times) % interval == 0:
+                self._snapshots.append(state.copy())
+            data = msg.__bytes__()
+            data2 = data[2] if len(data) > 2 else 0
+            state.apply(data[0], data[1], data2)
+            self._times.append(time)
+            self._data.append(data[0])
+            self._data.append(data[1])
+            self._data.append(data2)
+        # So there is a snapshot for the state after every message
+        if len(self._times) % interval == 0:
+            self._snapshots.append(state)
+
+    @classmethod
+    def from_reader(cls, reader, *, interval: int = 256) -> "Chase":
+        """Create a chase index in seconds for a file from
+        :meth:`adafruit_midi.smf.SMFReader.timeline`."""
+        return cls(((seconds, msg) for seconds, _, msg in reader.timeline()), interval=interval)
+
+    def __len__(self) -> int:
+        return len(self._times)
+
+    def state_at(self, time: float) -> ChaseState:
+        """The state after the messages before ``time``, messages at ``time``
+        are not included as they will be played."""
+        count = _bisect_left(self._times, time)
+        start = count // self.interval * self.interval
+        state = self._snapshots[count // self.interval].copy()
+        data = self._data
+        for idx in range(start * 3, count * 3, 3):
+            state.apply(data[idx], data[idx + 1], data[idx + 2])
+        return state
+
+    def messages_at(self, time: float, channel: Optional[int] = None) -> List[MIDIMessage]:
+        """The messages to send before starting playback at ``time``,
+        see :meth:`ChaseState.messages`."""
+        return self.state_at(time).messages(channel)
@@ -0,0 +1,204 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_midi.coalescer`
+================================================================================
+
+Output side thinning of controller streams for slow links.
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+Only the latest value of each pending controller is kept so the backlog is
+bounded by the number of distinct controllers in use rather than the number
+of messages sent. The output rate is limited with a token bucket.
+
+"""
+
+import time
+
+try:
+    from typing import List, Optional, Union
+except ImportError:
+    pass
+
+from .midi_message import MIDIMessage
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MIDI.git"
+
+# Kinds of coalesced message, the slot key is kind << 11 | channel << 7 | number
+_CONTROL_CHANGE = 0
+_POLY_PRESSURE = 1
+_PITCH_BEND = 2
+_CHANNEL_PRESSURE = 3
+
+_STATUS_TO_KIND = {
+    0xB0: _CONTROL_CHANGE,
+    0xA0: _POLY_PRESSURE,
+    0xE0: _PITCH_BEND,
+    0xD0: _CHANNEL_PRESSURE,
+}
+_KIND_TO_STATUS = (0xB0, 0xA0, 0xE0, 0xD0)
+
+
+class MIDICoalescer:
+    """Sends messages through an :class:`adafruit_midi.MIDI` object keeping only
+    the latest value of each pending Control Change, Pitch Bend, Channel Pressure
+    and Polyphonic Key Pressure.
+
+    Other messages are sent immediately, any pending values for the same
+    channel are sent before them so the receiver sees controllers in
+    the state they were in when the message was sent.
+    Call :meth:`poll` frequently to send pending values as the rate limit allows.
+
+    :param midi: The :class:`adafruit_midi.MIDI` object to send with.
+    :param int bytes_per_second: The rate limit, default 3125 which is a
+        31250 baud DIN MIDI link, None for no limit.
+    :param int burst_bytes: The number of bytes which can be sent at once
+        after the link has been idle, default 30.
+    :param int min_delta: Values closer than this to the last value sent
+        for a controller are discarded unless they are the minimum or maximum,
+        default 0 (disabled).
+    """
+
+    def __init__(
+        self,
+        midi,
+        *,
+        bytes_per_second: Optional[int] = 3125,
+        burst_bytes: int = 30,
+        min_delta: int = 0,
+    ) -> None:
+        self._midi = midi
+        self.bytes_per_second = bytes_per_second
+        self.burst_bytes = burst_bytes
+        self.min_delta = min_delta
+        self._tokens = burst_bytes
+        self._last_time = None
+        self._pending = {}
+        self._order = []
+        self._last_sent = {}
+
+    @property
+    def pending(self) -> int:
+        """The number of controller values waiting to be sent."""
+        return len(self._order)
+
+    def send(
+        self, msg: Union[MIDIMessage, List[MIDIMessage]], channel: Optional[int] = None
+    ) -> None:
+        """Send or queue a message or a list of messages.
+
+        :param int channel: Channel number, if not set the ``out_channel``
+            of the :class:`adafruit_midi.MIDI` object will be used.
+        """
+        if channel is None:
+            channel = self._midi.out_channel
+        msgs = (msg,) if isinstance(msg, MIDIMessage) else msg
+        for each_msg in msgs:
+            each_msg.channel = channel
+            kind = _STATUS_TO_KIND.get(each_msg._STATUS)
+            if kind is None:
+                self._send_now(each_msg.__bytes__(), channel)
+            elif kind == _CONTROL_CHANGE:
+                self._queue(kind << 11 | channel << 7 | each_msg.control, each_msg.value, 127)
+            elif kind == _POLY_PRESSURE:
+                self._queue(kind << 11 | channel << 7 | each_msg.note, each_msg.pressure, 127)
+            elif kind == _PITCH_BEND:
+                self._queue(kind << 11 | channel << 7, each_msg.pitch_bend, 16383)
+            else:
+                self._queue(kind << 11 | channel << 7, each_msg.pressure, 127)
+
+    def _queue(self, slot: int, value: int, maximum: int) -> None:
+        if slot not in self._pending:
+            last = self._last_sent.get(slot)
+            if last is not None and abs(value - last) < self.min_delta and 0 < value < maximum:
+                return
+            self._order.append(slot)
+        self._pending[slot] = value
+
+    def _refill(self, now: Optional[float]) -> None:
+        if self.bytes_per_second is None:
+            return
+        if now is None:
+            now = time.monotonic()
+        if self._last_time is not None:
+            self._tokens = min(
+                self._tokens + (now - self._last_time) * self.bytes_per_second, self.burst_bytes
+            )
+        self._last_time = now
+
+    @staticmethod
+    def _encode(slot: int, value: int, out: bytearray) -> None:
+        kind = slot >> 11
+        out.append(_KIND_TO_STATUS[kind] | (slot >> 7) & 0x0F)
+        if kind == _PITCH_BEND:
+            out.append(value & 0x7F)
+            out.append(value >> 7)
+        elif kind == _CHANNEL_PRESSURE:
+            out.append(value)
+        else:
+            out.append(slot & 0x7F)
+            out.append(value)
+
+    def _take(self, slot: int, out: bytearray) -> None:
+        value = self._pending.pop(slot)
+        self._last_sent[slot] = value
+        self._encode(slot, value, out)
+
+    def _send_now(self, data: bytes, channel: int) -> None:
+        out = bytearray()
+        if self._order:
+            if data[0] < 0xF0:
+                # Keep the controllers of this channel in step with the message
+                keep = []
+                for slot in self._order:
+                    if (slot >> 7) & 0x0F == channel:
+                        self._take(slot, out)
+                    else:
+                        keep.append(slot)
+                self._order = keep
+        out.extend(data)
+        self._tokens -= len(out)
+        self._midi._send(out, len(out))
+
+    def poll(self, now: Optional[float] = None) -> int:
+        """Send the pending values which fit within the rate limit, oldest first.
+
+        :param float now: The current time in seconds, defaults to ``time.monotonic()``.
+        :returns int: The number of bytes sent.
+        """
+        self._refill(now)
+        if not self._order:
+            return 0
+        unlimited = self.bytes_per_second is None
+        out = bytearray()
+        order = self._order
+        count = 0
+        for slot in order:
+            if not unlimited and self._tokens < (2 if slot >> 11 == _CHANNEL_PRESSURE else 3):
+                break
+            before = len(out)
+            self._take(slot, out)
+            self._tokens -= len(out) - before
+            count += 1
+        self._order = order[count:]
+        if out:
+            self._midi._send(out, len(out))
+        return len(out)
+
+    def flush(self) -> None:
+        """Send all pending values ignoring the rate limit."""
+        out = bytearray()
+        for slot in self._order:
+            self._take(slot, out)
+        self._order = []
+        if out:
+            self._tokens -= len(out)
+            self._midi._send(out, len(out))
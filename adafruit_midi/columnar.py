@@ -0,0 +1,229 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_midi.columnar`
+================================================================================
+
+Compact column storage for sequences of MIDI messages with conversion to and
+from message objects, wire format bytes and NumPy structured arrays.
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* NumPy is optional, it is only needed for :meth:`MessageColumns.to_numpy`
+  and :meth:`MessageColumns.from_numpy`.
+
+Each message takes four bytes in the ``array`` columns, plus eight with
+timestamps, rather than a Python object. SysEx data does not fit in the
+columns so it is kept in :attr:`MessageColumns.sysex` in order.
+:class:`~adafruit_midi.midi_message.MIDIUnknownEvent` and
+:class:`~adafruit_midi.midi_message.MIDIBadEvent` messages are not stored.
+
+"""
+
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from typing import Iterable, Iterator, List, Optional
+except ImportError:
+    pass
+
+from .midi_message import MIDIBadEvent, MIDIMessage, MIDIUnknownEvent
+from .thru import MESSAGE_LENGTH
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MIDI.git"
+
+NUMPY_DTYPE = [
+    ("time", "f8"),
+    ("status", "u1"),
+    ("channel", "i1"),
+    ("data1", "u1"),
+    ("data2", "u1"),
+]
+"""The fields of the structured array from :meth:`MessageColumns.to_numpy`,
+time is left out for columns without timestamps."""
+
+_ALL_CHANNELS = tuple(range(16))
+
+
+class MessageColumns:
+    """A sequence of MIDI messages stored as columns.
+
+    :param bool timestamps: Store a time for each message, default False.
+    """
+
+    def __init__(self, *, timestamps: bool = False) -> None:
+        self.status = array("B")
+        """The status of each message without the channel, e.g. 0x90 for Note On."""
+        self.channel = array("b")
+        """The channel of each message or -1 for messages without one."""
+        self.data1 = array("B")
+        """The first data byte, 0 for messages without one."""
+        self.data2 = array("B")
+        """The second data byte, 0 for messages without one.
+        Pitch Bend is stored as on the wire, LSB in data1 and MSB in data2."""
+        self.time = array("d") if timestamps else None
+        """The timestamps or None."""
+        self.sysex = []
+        """The wire format bytes of each SysEx message in order."""
+
+    def __len__(self) -> int:
+        return len(self.status)
+
+    def _append_row(self, status: int, channel: int, data1: int, data2: int) -> None:
+        self.status.append(status)
+        self.channel.append(channel)
+        self.data1.append(data1)
+        self.data2.append(data2)
+
+    def append(self, msg: MIDIMessage, time: Optional[float] = None) -> None:
+        """Add a message, ``time`` is required if the columns have timestamps.
+        Unknown and bad messages are ignored."""
+        if isinstance(msg, (MIDIBadEvent, MIDIUnknownEvent)):
+            return
+        if msg._STATUSMASK == 0xF0 and msg.channel is None:
+            raise ValueError("Channel must be set")
+        self.append_bytes(msg.__bytes__(), time)
+
+    def append_bytes(self, data: bytes, time: Optional[float] = None) -> None:
+        """Add one message in wire format."""
+        status = data[0]
+        if status == 0xF0:
+            self.sysex.append(bytes(data))
+            self._append_row(status, -1, 0, 0)
+        elif status < 0xF0:
+            self._append_row(status & 0xF0, status & 0x0F, data[1], data[2] if len(data) > 2 else 0)
+        else:
+            length = len(data)
+            self._append_row(status, -1, data[1] if length > 1 else 0, data[2] if length > 2 else 0)
+        if self.time is not None:
+            self.time.append(time)
+
+    @classmethod
+    def from_messages(
+        cls, msgs: Iterable[MIDIMessage], times: Optional[Iterable[float]] = None
+    ) -> "MessageColumns":
+        """Create columns from message objects, with a timestamp for each
+        if ``times`` is given."""
+        columns = cls(timestamps=times is not None)
+        if times is None:
+            for msg in msgs:
+                columns.append(msg)
+        else:
+            for msg, time in zip(msgs, times):
+                columns.append(msg, time)
+        return columns
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "MessageColumns":
+        """Create columns from a wire format buffer, it is parsed like
+        :meth:`adafruit_midi.MIDI.receive` does so only registered message
+        types are stored with their data."""
+        columns = cls()
+        # A memoryview avoids copying the rest of the buffer for each message
+        view = memoryview(data)
+        offset = 0
+        while offset < len(data):
+            msg, endplusone, _ = MIDIMessage.from_message_bytes(view[offset:], _ALL_CHANNELS)
+            if msg is None and endplusone == 0:
+                break
+            offset += endplusone
+            if msg is not None:
+                columns.append(msg)
+        return columns
+
+    def encode(self, out: Optional[bytearray] = None) -> bytearray:
+        """Encode every message to wire format in one buffer.
+
+        :param bytearray out: An optional bytearray to append to.
+        :returns bytearray: The encoded messages.
+        """
+        if out is None:
+            out = bytearray()
+        status_col, channel_col = self.status, self.channel
+        data1_col, data2_col = self.data1, self.data2
+        sysex = iter(self.sysex)
+        for idx in range(len(status_col)):
+            status = status_col[idx]
+            if status == 0xF0:
+                out.extend(next(sysex))
+                continue
+            channel = channel_col[idx]
+            out.append(status | channel if channel >= 0 else status)
+            length = MESSAGE_LENGTH[status]
+            if length > 1:
+                out.append(data1_col[idx])
+                if length > 2:
+                    out.append(data2_col[idx])
+        return out
+
+    def messages(self) -> Iterator[MIDIMessage]:
+        """Recreate the message objects, one at a time."""
+        sysex = iter(self.sysex)
+        for idx in range(len(self.status)):
+            status = self.status[idx]
+            if status == 0xF0:
+                data = next(sysex)
+            else:
+                channel = self.channel[idx]
+                data = bytes(
+                    (
+                        status | channel if channel >= 0 else status,
+                        self.data1[idx],
+                        self.data2[idx],
+                    )
+                )[: max(MESSAGE_LENGTH[status], 1)]
+            yield MIDIMessage.from_message_bytes(data, _ALL_CHANNELS)[0]
+
+    def to_numpy(self) -> "np.ndarray":
+        """Return the columns as a NumPy structured array with :data:`NUMPY_DTYPE`,
+        the SysEx data stays in :attr:`sysex`."""
+        if np is None:
+            raise ImportError("numpy is required")
+        if self.time is None:
+            result = np.zeros(len(self), dtype=NUMPY_DTYPE[1:])
+        else:
+            result = np.zeros(len(self), dtype=NUMPY_DTYPE)
+            result["time"] = np.frombuffer(self.time, dtype="f8")
+        result["status"] = np.frombuffer(self.status, dtype="u1")
+        result["channel"] = np.frombuffer(self.channel, dtype="i1")
+        result["data1"] = np.frombuffer(self.data1, dtype="u1")
+        result["data2"] = np.frombuffer(self.data2, dtype="u1")
+        return result
+
+    @classmethod
+    def from_numpy(
+        cls, data: "np.ndarray", sysex: Optional[List[bytes]] = None
+    ) -> "MessageColumns":
+        """Create columns from a structured array with the fields of :data:`NUMPY_DTYPE`,
+        the time field is optional.
+
+        :param list sysex: The SysEx messages for the rows with status 0xF0.
+        """
+        if np is None:
+            raise ImportError("numpy is required")
+        names = data.dtype.names
+        columns = cls(timestamps="time" in names)
+        columns.status = array("B", data["status"].astype("u1").tobytes())
+        columns.channel = array("b", data["channel"].astype("i1").tobytes())
+        columns.data1 = array("B", data["data1"].astype("u1").tobytes())
+        columns.data2 = array("B", data["data2"].astype("u1").tobytes())
+        if columns.time is not None:
+            columns.time = array("d", data["time"].astype("f8").tobytes())
+        columns.sysex = list(sysex or ())
+        if columns.status.count(0xF0) != len(columns.sysex):
+            raise ValueError("Need one SysEx message for each row with status 0xF0")
+        return columns
@@ -49,5 +49,31 @@ class ControlChange(MIDIMessage):
     def from_bytes(cls, msg_bytes):
         return cls(msg_bytes[1], msg_bytes[2], channel=msg_bytes[0] & cls.CHANNELMASK)
 
+    @classmethod
+    def many(cls, controls, values, *, channel=None):
+        """Create a list of Control Change messages, the values are validated
+        together which is quicker than creating them one at a time.
+
+        :param controls: The control numbers, 0-127.
+        :param values: The values, 0-127, as a sequence or one value for all.
+        :param channel: A channel, a sequence of channels or None, default None.
+        """
+        from .message_batch import many
+
+        return many(cls, controls, values, channel, False)
+
+    @classmethod
+    def encode_many(cls, controls, values, *, channel=0, out=None):
+        """Encode Control Change messages straight to their wire format in one
+        buffer without creating message objects, see :meth:`many`.
+
+        :param channel: A channel, a sequence of channels or None for 0, default 0.
+        :param bytearray out: An optional bytearray to append to.
+        :returns bytearray: The encoded messages.
+        """
+        from .message_batch import encode_many
+
+        return encode_many(cls, controls, values, channel, out, False)
+
 
 ControlChange.register_message_type()
@@ -38,6 +38,7 @@ Implementation Notes
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MIDI.git"
 
+BANK_SELECT = 0
 MOD_WHEEL = 1
 BREATH_CONTROL = 2
 FOOT_CONTROLLER = 4
@@ -45,6 +46,9 @@ VOLUME = 7
 PAN = 10
 EXPRESSION = 11
 PORTAMENTO_TIME = 5
+DATA_ENTRY = 6
+BANK_SELECT_LSB = 32
+DATA_ENTRY_LSB = 38
 SUSTAIN_PEDAL = 64
 PORTAMENTO = 65
 FILTER_RESONANCE = 71
@@ -56,5 +60,12 @@ VIBRATO_RATE = 76
 VIBRATO_DEPTH = 77
 VIBRATO_DELAY = 78
 CHORUS = 93
+DATA_INCREMENT = 96
+DATA_DECREMENT = 97
+NRPN_LSB = 98
+NRPN_MSB = 99
+RPN_LSB = 100
+RPN_MSB = 101
+ALL_SOUND_OFF = 120
 ALL_CONTROLLERS_OFF = 121
 ALL_NOTES_OFF = 123
@@ -0,0 +1,200 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_midi.controller_state`
+================================================================================
+
+Per-channel Control Change state with 14 bit controller pairing and
+Registered / Non-Registered Parameter Number (RPN / NRPN) assembly.
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+The 7 bit values for all 16 channels by 128 controllers are held in a
+2048 byte ``bytearray``. (N)RPN values are only stored for parameters
+that have been set.
+
+"""
+
+try:
+    from typing import List, Optional, Tuple
+except ImportError:
+    pass
+
+from .control_change_values import (
+    ALL_CONTROLLERS_OFF,
+    DATA_DECREMENT,
+    DATA_ENTRY,
+    DATA_ENTRY_LSB,
+    DATA_INCREMENT,
+    NRPN_LSB,
+    NRPN_MSB,
+    RPN_LSB,
+    RPN_MSB,
+)
+from .midi_message import MIDIMessage
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MIDI.git"
+
+# Kinds of event returned by ControllerState.observe()
+CC = 0
+"""A 7 bit controller, 64-127."""
+CC_14BIT = 1
+"""A 14 bit controller, 0-31, paired with the LSB on 32-63."""
+RPN = 2
+"""A Registered Parameter Number value."""
+NRPN = 3
+"""A Non-Registered Parameter Number value."""
+
+# The RPN "null" value deselects the parameter
+_NULL_PARAMETER = 0x3FFF
+
+
+class ControllerState:
+    """Keeps the current controller values for every channel.
+
+    Pass received messages to :meth:`observe` which returns a
+    ``(kind, channel, number, value)`` tuple for each change where ``kind``
+    is one of ``CC``, ``CC_14BIT``, ``RPN`` or ``NRPN``. For ``CC_14BIT``
+    ``number`` is the MSB controller number, 0-31, and ``value`` is 14 bit.
+    A new MSB value clears the LSB as the MIDI specification requires.
+    Data Entry, Data Increment and Data Decrement are applied to the
+    selected RPN or NRPN, an increment or decrement steps the 14 bit value by one.
+    """
+
+    def __init__(self) -> None:
+        self._values = bytearray(16 * 128)
+        self._param_kind = bytearray(16)
+        self._param = [_NULL_PARAMETER] * 16
+        self._params = {}
+
+    def reset(self, channel: Optional[int] = None) -> None:
+        """Forget the controller values for ``channel`` or all channels."""
+        channels = range(16) if channel is None else (channel,)
+        for chan in channels:
+            base = chan << 7
+            for idx in range(base, base + 128):
+                self._values[idx] = 0
+            self._param_kind[chan] = 0
+            self._param[chan] = _NULL_PARAMETER
+        if channel is None:
+            self._params = {}
+
+    def copy(self) -> "ControllerState":
+        """Return an independent copy of the state."""
+        state = ControllerState()
+        state._values[:] = self._values
+        state._param_kind[:] = self._param_kind
+        state._param = list(self._param)
+        state._params = dict(self._params)
+        return state
+
+    def value(self, control: int, channel: int) -> int:
+        """The last 7 bit value of ``control`` on ``channel``."""
+        return self._values[channel << 7 | control]
+
+    def value14(self, control: int, channel: int) -> int:
+        """The 14 bit value of ``control``, 0-31, combined with its LSB on ``channel``."""
+        base = channel << 7 | control
+        return self._values[base] << 7 | self._values[base + 32]
+
+    def rpn(self, number: int, channel: int) -> Optional[int]:
+        """The 14 bit value of Registered Parameter ``number`` on ``channel``
+        or None if it has not been set."""
+        return self._params.get(RPN << 18 | channel << 14 | number)
+
+    def nrpn(self, number: int, channel: int) -> Optional[int]:
+        """The 14 bit value of Non-Registered Parameter ``number`` on ``channel``
+        or None if it has not been set."""
+        return self._params.get(NRPN << 18 | channel << 14 | number)
+
+    def selected(self, channel: int) -> Optional[Tuple[int, int]]:
+        """The ``(kind, number)`` of the parameter selected on ``channel``
+        where kind is ``RPN`` or ``NRPN``, None if there is none."""
+        kind = self._param_kind[channel]
+        return (kind, self._param[channel]) if kind else None
+
+    def parameters(self, channel: int) -> List[Tuple[int, int, int]]:
+        """The ``(kind, number, value)`` of every parameter set on ``channel``
+        in the order RPN then NRPN by number."""
+        return sorted(
+            (key >> 18, key & 0x3FFF, value)
+            for key, value in self._params.items()
+            if key >> 14 & 0x0F == channel
+        )
+
+    def observe(self, msg: Optional[MIDIMessage]) -> Optional[Tuple[int, int, int, int]]:
+        """Update the state from a message, anything other than a
+        :class:`~adafruit_midi.control_change.ControlChange` is ignored.
+
+        :returns: A ``(kind, channel, number, value)`` tuple or None.
+        """
+        if msg is None or msg._STATUS != 0xB0:
+            return None
+        return self.control_change(msg.control, msg.value, msg.channel)
+
+    def control_change(
+        self, control: int, value: int, channel: int
+    ) -> Optional[Tuple[int, int, int, int]]:
+        """Update the state from the values of a Control Change.
+
+        :returns: A ``(kind, channel, number, value)`` tuple or None.
+        """
+        values = self._values
+        base = channel << 7
+        values[base | control] = value
+
+        if (
+            control in {DATA_ENTRY, DATA_ENTRY_LSB, DATA_INCREMENT, DATA_DECREMENT}
+            and self._param_kind[channel]
+        ):
+            if control == DATA_ENTRY:
+                values[base | DATA_ENTRY_LSB] = 0
+            step = 0
+            if control == DATA_INCREMENT:
+                step = 1
+            elif control == DATA_DECREMENT:
+                step = -1
+            return self._data_entry(channel, step)
+        if control < 64:
+            msb = control & 0x1F
+            if control < 32:
+                values[base | control + 32] = 0
+            return (CC_14BIT, channel, msb, values[base | msb] << 7 | values[base | msb + 32])
+
+        if control in {RPN_MSB, RPN_LSB, NRPN_MSB, NRPN_LSB}:
+            if control in {RPN_MSB, RPN_LSB}:
+                kind, msb_control = RPN, RPN_MSB
+            else:
+                kind, msb_control = NRPN, NRPN_MSB
+            param = values[base | msb_control] << 7 | values[base | msb_control - 1]
+            self._param_kind[channel] = 0 if param == _NULL_PARAMETER else kind
+            self._param[channel] = param
+            return None
+        if control == ALL_CONTROLLERS_OFF:
+            # Reset All Controllers also deselects the parameter
+            self._param_kind[channel] = 0
+            self._param[channel] = _NULL_PARAMETER
+        return (CC, channel, control, value)
+
+    def _data_entry(self, channel: int, step: int) -> Tuple[int, int, int, int]:
+        kind = self._param_kind[channel]
+        number = self._param[channel]
+        key = kind << 18 | channel << 14 | number
+        # The parameter value is kept in the Data Entry controllers
+        msb_idx = channel << 7 | DATA_ENTRY
+        lsb_idx = channel << 7 | DATA_ENTRY_LSB
+        if step:
+            value = min(max(self._params.get(key, 0) + step, 0), 0x3FFF)
+            self._values[msb_idx] = value >> 7
+            self._values[lsb_idx] = value & 0x7F
+        else:
+            value = self._values[msb_idx] << 7 | self._values[lsb_idx]
+        self._params[key] = value
+        return (kind, channel, number, value)
@@ -0,0 +1,162 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_midi.merger`
+================================================================================
+
+MIDI merger which combines several inputs into one output without
+splitting messages.
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+Every call to :meth:`MIDIMerger.process` does one read per input and one
+write to the output. Inputs are served round robin starting from a different
+input each call so a busy input cannot starve the others.
+
+"""
+
+try:
+    from typing import List
+except ImportError:
+    pass
+
+from .thru import MESSAGE_LENGTH
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MIDI.git"
+
+
+class _MergeInput:
+    """Frames the bytes from one input into whole messages."""
+
+    def __init__(self, port) -> None:
+        self.port = port
+        self.pending = bytearray()
+        self.complete = 0  # length of pending which is whole messages
+        self.in_sysex = False
+        self._running_status = 0
+        self._count = 0
+        self._expected = 0
+
+    def frame(self, data: bytes, realtime: bytearray) -> None:
+        pending = self.pending
+        for byte in data:
+            if byte >= 0xF8:
+                realtime.append(byte)
+            elif self.in_sysex and (byte < 0x80 or byte == 0xF7):
+                pending.append(byte)
+                if byte == 0xF7:
+                    self.in_sysex = False
+                    self.complete = len(pending)
+            elif byte & 0x80:
+                if self.in_sysex:
+                    # Terminate a SysEx interrupted by another status byte
+                    pending.append(0xF7)
+                    self.in_sysex = False
+                    self.complete = len(pending)
+                elif self._count:
+                    # Discard an incomplete message
+                    pending = self.pending = pending[: self.complete]
+                self._count = 0
+                self._running_status = byte if byte < 0xF0 else 0
+                if byte == 0xF0:
+                    pending.append(byte)
+                    self.in_sysex = True
+                    self._expected = 0
+                elif byte == 0xF7:
+                    self._expected = 0
+                elif MESSAGE_LENGTH[byte] == 1:
+                    pending.append(byte)
+                    self.complete = len(pending)
+                    self._expected = 0
+                else:
+                    pending.append(byte)
+                    self._count = 1
+                    self._expected = MESSAGE_LENGTH[byte]
+            elif self._expected:
+                if self._count == 0:
+                    if not self._running_status:
+                        continue
+                    # Running status is expanded as other inputs are interleaved
+                    pending.append(self._running_status)
+                    self._count = 1
+                pending.append(byte)
+                self._count += 1
+                if self._count == self._expected:
+                    self._count = 0
+                    self.complete = len(pending)
+                    if not self._running_status:
+                        self._expected = 0
+
+    def take(self, out: bytearray) -> None:
+        """Move the whole messages and any partial SysEx to ``out``."""
+        end = len(self.pending) if self.in_sysex else self.complete
+        if end:
+            out.extend(self.pending[:end] if end != len(self.pending) else self.pending)
+            self.pending = self.pending[end:]
+            self.complete = max(self.complete - end, 0)
+
+
+class MIDIMerger:
+    """Merges what is received on several :class:`adafruit_midi.MIDI` objects
+    into one output.
+
+    Messages are never split, running status is expanded and System Real Time
+    bytes are sent ahead of everything else. Once an input starts a SysEx
+    its bytes are sent as they arrive and the other inputs are held back
+    until it ends.
+
+    :param list inputs: The :class:`adafruit_midi.MIDI` objects to read from.
+    :param midi_out: The :class:`adafruit_midi.MIDI` object to write to.
+    :param int read_size: The maximum number of bytes to read from each input
+        per call to :meth:`process`, default 64.
+    """
+
+    def __init__(self, inputs: List, midi_out, *, read_size: int = 64) -> None:
+        self._inputs = [_MergeInput(midi._midi_in) for midi in inputs]
+        self._midi_out = midi_out
+        self.read_size = read_size
+        self._next = 0
+        self._sysex_owner = None
+
+    def process(self) -> int:
+        """Read from every input and write the merged messages to the output.
+
+        :returns int: The number of bytes written.
+        """
+        out = bytearray()
+        inputs = self._inputs
+        for merge_input in inputs:
+            data = merge_input.port.read(self.read_size)
+            if data:
+                merge_input.frame(data, out)
+
+        owner = self._sysex_owner
+        if owner is not None:
+            owner.take(out)
+            if owner.in_sysex:
+                self._send(out)
+                return len(out)
+            self._sysex_owner = None
+
+        count = len(inputs)
+        start = self._next
+        self._next = (start + 1) % count
+        for offset in range(count):
+            merge_input = inputs[(start + offset) % count]
+            merge_input.take(out)
+            if merge_input.in_sysex:
+                self._sysex_owner = merge_input
+                break
+        self._send(out)
+        return len(out)
+
+    def _send(self, out: bytearray) -> None:
+        if out:
+            self._midi_out._send(out, len(out))
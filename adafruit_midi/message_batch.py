@@ -0,0 +1,118 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_midi.message_batch`
+================================================================================
+
+Batch construction and encoding of the two data byte channel messages, used
+by the ``many()`` and ``encode_many()`` class methods of
+:class:`~adafruit_midi.note_on.NoteOn`, :class:`~adafruit_midi.note_off.NoteOff`,
+:class:`~adafruit_midi.control_change.ControlChange` and
+:class:`~adafruit_midi.polyphonic_key_pressure.PolyphonicKeyPressure`.
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+This is imported the first time a batch method is called so programs which
+do not use them do not pay for the code. The data bytes are the first two
+of ``_message_slots`` and the whole batch is validated at once.
+
+"""
+
+try:
+    from typing import List, Optional, Sequence, Tuple, Type, Union
+except ImportError:
+    pass
+
+from .midi_message import MIDIMessage, note_parser
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MIDI.git"
+
+
+def _validate(
+    data1: Sequence[Union[int, str]],
+    data2: Union[int, Sequence[int]],
+    channel: Optional[Union[int, Sequence[int]]],
+    notes: bool,
+) -> Tuple[Sequence[int], Sequence[int], Optional[Sequence[int]]]:
+    if notes:
+        data1 = [note_parser(note) for note in data1]
+    count = len(data1)
+    if isinstance(data2, int):
+        data2 = (data2,) * count
+    if isinstance(channel, int):
+        channel = (channel,) * count
+    if len(data2) != count or (channel is not None and len(channel) != count):
+        raise ValueError("Sequences must be the same length")
+    if count and (
+        min(data1) < 0
+        or max(data1) > 127
+        or min(data2) < 0
+        or max(data2) > 127
+        or (channel is not None and (min(channel) < 0 or max(channel) > 15))
+    ):
+        MIDIMessage._raise_valueerror_oor()
+    return data1, data2, channel
+
+
+def many(
+    cls: Type[MIDIMessage],
+    data1: Sequence[Union[int, str]],
+    data2: Union[int, Sequence[int]],
+    channel: Optional[Union[int, Sequence[int]]],
+    notes: bool,
+) -> List[MIDIMessage]:
+    """Create a list of ``cls`` messages, see :meth:`adafruit_midi.note_on.NoteOn.many`."""
+    data1, data2, channel = _validate(data1, data2, channel, notes)
+    name1, name2 = cls._message_slots[0], cls._message_slots[1]
+    msgs = []
+    for idx in range(len(data1)):
+        # Already validated so __init__ is skipped
+        msg = object.__new__(cls)
+        setattr(msg, name1, data1[idx])
+        setattr(msg, name2, data2[idx])
+        msg._channel = None if channel is None else channel[idx]
+        msgs.append(msg)
+    return msgs
+
+
+def encode_many(
+    cls: Type[MIDIMessage],
+    data1: Sequence[Union[int, str]],
+    data2: Union[int, Sequence[int]],
+    channel: Optional[Union[int, Sequence[int]]],
+    out: Optional[bytearray],
+    notes: bool,
+) -> bytearray:
+    """Encode ``cls`` messages to one buffer, see
+    :meth:`adafruit_midi.note_on.NoteOn.encode_many`."""
+    if channel is None:
+        # There is no port to take the channel from so use the default
+        channel = 0
+    data1, data2, channels = _validate(data1, data2, channel, notes)
+    count = len(data1)
+    if isinstance(channel, int):
+        status = bytes((cls._STATUS | channel,)) * count
+    else:
+        status = bytes(cls._STATUS | chan for chan in channels)
+    buf = bytearray(count * 3)
+    try:
+        buf[0::3] = status
+        buf[1::3] = bytes(data1)
+        buf[2::3] = bytes(data2)
+    except NotImplementedError:
+        # MicroPython only supports slice assignment with a step of 1
+        for idx in range(count):
+            buf[idx * 3] = status[idx]
+            buf[idx * 3 + 1] = data1[idx]
+            buf[idx * 3 + 2] = data2[idx]
+    if out is None:
+        return buf
+    out.extend(buf)
+    return out
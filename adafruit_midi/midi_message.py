@@ -10,6 +10,8 @@ An abstract class for objects which represent MIDI messages (events).
 When individual messages are imported they register themselves with
 :func:register_message_type which makes them recognised
 by the parser, :func:from_message_bytes.
+Alternatively :func:enable_lazy_registration imports each standard
+message the first time its status is seen.
 
 Large messages like :class:SystemExclusive can only be parsed if they fit
 within the input buffer in :class:MIDI.
@@ -30,6 +32,26 @@ try:
 except ImportError:
     pass
 
+# The modules which define the standard messages by (status, mask)
+# for lazy registration, more specific masks first
+_LAZY_MODULES = (
+    (0xF0, 0xFF, "system_exclusive"),
+    (0xF1, 0xFF, "mtc_quarter_frame"),
+    (0xF8, 0xFF, "timing_clock"),
+    (0xFA, 0xFF, "start"),
+    (0xFB, 0xFF, "midi_continue"),
+    (0xFC, 0xFF, "stop"),
+    (0xFE, 0xFF, "active_sensing"),
+    (0xFF, 0xFF, "midi_reset"),
+    (0x80, 0xF0, "note_off"),
+    (0x90, 0xF0, "note_on"),
+    (0xA0, 0xF0, "polyphonic_key_pressure"),
+    (0xB0, 0xF0, "control_change"),
+    (0xC0, 0xF0, "program_change"),
+    (0xD0, 0xF0, "channel_pressure"),
+    (0xE0, 0xF0, "pitch_bend"),
+)
+
 # From C3 - A and B are above G
 # Semitones     A   B   C   D   E   F   G
 NOTE_OFFSET = [21, 23, 12, 14, 16, 17, 19]
@@ -46,30 +68,70 @@ def channel_filter(channel: int, channel_spec: Optional[Union[int, Tuple[int, ..
     raise ValueError("Incorrect type for channel_spec" + str(type(channel_spec)))
 
 
-def note_parser(note: Union[int, str]) -> int:
+# Note names by semitone for note_name()
+SHARP_NAMES = ("C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B")
+FLAT_NAMES = ("C", "Db", "D", "Eb", "E", "F", "Gb", "G", "Ab", "A", "Bb", "B")
+
+# Parsed note names, filled as names are used so only those an application
+# uses take memory
+_note_numbers = {}
+# Tuples of the 128 note names by (flats, middle_c_octave), built on first use
+_note_names = {}
+
+
+def _parse_note(note: str) -> int:
+    if len(note) < 2:
+        raise ValueError("Bad note format")
+    noteidx = ord(note[0].upper()) - 65  # 65 os ord('A')
+    if not 0 <= noteidx <= 6:
+        raise ValueError("Bad note")
+    sharpen = 0
+    if note[1] == "#":
+        sharpen = 1
+    elif note[1] == "b":
+        sharpen = -1
+    # int may throw exception here
+    return int(note[1 + abs(sharpen) :]) * 12 + NOTE_OFFSET[noteidx] + sharpen
+
+
+def note_parser(note: Union[int, str], *, middle_c_octave: int = 4) -> int:
     """If note is a string then it will be parsed and converted to a MIDI note (key) number, e.g.
     "C4" will return 60, "C#4" will return 61. If note is not a string it will simply be returned.
 
     :param note: Either 0-127 int or a str representing the note, e.g. "C#4"
+    :param int middle_c_octave: The octave number of middle C (60), default 4,
+        some manufacturers use 3.
     """
     if isinstance(note, str):
-        if len(note) < 2:
-            raise ValueError("Bad note format")
-        noteidx = ord(note[0].upper()) - 65  # 65 os ord('A')
-        if not 0 <= noteidx <= 6:
-            raise ValueError("Bad note")
-        sharpen = 0
-        if note[1] == "#":
-            sharpen = 1
-        elif note[1] == "b":
-            sharpen = -1
-        # int may throw exception here
-        midi_note = int(note[1 + abs(sharpen) :]) * 12 + NOTE_OFFSET[noteidx] + sharpen
+        midi_note = _note_numbers.get(note)
+        if midi_note is None:
+            midi_note = _note_numbers[note] = _parse_note(note)
+        if middle_c_octave != 4:
+            midi_note += (4 - middle_c_octave) * 12
     elif isinstance(note, int):
         midi_note = note
     return midi_note
 
 
+def note_name(note: int, *, flats: bool = False, middle_c_octave: int = 4) -> str:
+    """Return the name of a MIDI note (key) number, e.g. 60 is "C4" and 61 is "C#4".
+
+    :param int note: The note number, 0-127.
+    :param bool flats: Use flats rather than sharps, e.g. "Db4", default False.
+    :param int middle_c_octave: The octave number of middle C (60), default 4.
+    """
+    names = _note_names.get((flats, middle_c_octave))
+    if names is None:
+        semitones = FLAT_NAMES if flats else SHARP_NAMES
+        octave_offset = middle_c_octave - 5
+        names = _note_names[(flats, middle_c_octave)] = tuple(
+            semitones[number % 12] + str(number // 12 + octave_offset) for number in range(128)
+        )
+    if not 0 <= note <= 127:
+        MIDIMessage._raise_valueerror_oor()
+    return names[note]
+
+
 class MIDIMessage:
     """
     The parent class for MIDI messages.
@@ -103,6 +165,9 @@ class MIDIMessage:
     # Add better type hints for status, mask, class referenced above
     _statusandmask_to_class: List[Tuple[Tuple[Optional[bytes], Optional[int]], "MIDIMessage"]] = []
 
+    # Entries of _LAZY_MODULES not yet imported, None when lazy registration is off
+    _lazy_modules: Optional[List[Tuple[int, int, str]]] = None
+
     def __init__(self, *, channel: Optional[int] = None) -> None:
         self._channel = channel  # dealing with pylint inadequacy
         self.channel = channel
@@ -136,6 +201,32 @@ class MIDIMessage:
             insert_idx, ((cls._STATUS, cls._STATUSMASK), cls)
         )
 
+    @staticmethod
+    def enable_lazy_registration(enable: bool = True) -> None:
+        """Import the module for each standard message the first time its status
+        is received rather than returning :class:`MIDIUnknownEvent`.
+
+        This means only the messages an application actually receives use memory,
+        the first of each type takes longer to parse while its module is imported.
+        """
+        MIDIMessage._lazy_modules = list(_LAZY_MODULES) if enable else None
+
+    @staticmethod
+    def _import_for_status(status: int) -> bool:
+        """Import the module for ``status`` if it has one which has not been tried,
+        returns True if a module was imported."""
+        for entry in MIDIMessage._lazy_modules:
+            if status & entry[1] == entry[0]:
+                # Only try once, the module may be missing from a small build
+                MIDIMessage._lazy_modules.remove(entry)
+                package = __name__[: __name__.rfind(".")]
+                try:
+                    __import__(package + "." + entry[2])
+                except ImportError:
+                    return False
+                return True
+        return False
+
     @classmethod
     def _search_eom_status(
         cls,
@@ -200,6 +291,9 @@ class MIDIMessage:
                     msgendidxplusone = msgstartidx + msgclass.LENGTH
                 break
 
+        if not known_msg and MIDIMessage._lazy_modules and MIDIMessage._import_for_status(status):
+            return cls._match_message_status(buf, msgstartidx, msgendidxplusone, endidx)
+
         return (
             msgclass,
             status,
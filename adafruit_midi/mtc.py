@@ -0,0 +1,313 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_midi.mtc`
+================================================================================
+
+MIDI Time Code (MTC) reader and generator.
+
+:class:`MtcReader` assembles :class:`~adafruit_midi.mtc_quarter_frame.MtcQuarterFrame`
+messages and Full Frame universal SysEx messages into an hours:minutes:seconds:frames
+timecode. :class:`MtcGenerator` produces the quarter frame messages for a timecode
+source such as a media player position.
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+Based upon the official MMA0001 / RP004 / RP008 v4.2.1 MIDI Time Code Specification
+
+"""
+
+try:
+    from typing import Optional, Tuple, Union
+except ImportError:
+    pass
+
+from .midi_message import MIDIMessage
+from .mtc_quarter_frame import MtcQuarterFrame
+from .system_exclusive import SystemExclusive
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MIDI.git"
+
+# SMPTE types as encoded in quarter frame piece 7 and the Full Frame hours byte
+FPS_24 = 0
+FPS_25 = 1
+FPS_30_DROP = 2
+FPS_30 = 3
+
+# Nominal frames per second for each SMPTE type, drop frame is really 29.97
+FRAME_RATES = (24, 25, 30, 30)
+_FRAMES_PER_SECOND = (24.0, 25.0, 30000 / 1001, 30.0)
+
+# Drop frame (29.97) skips frames 0 and 1 of every minute except each tenth one
+_DROP_FRAMES_PER_10_MINUTES = 17982
+_DROP_FRAMES_PER_MINUTE = 1798
+_FRAMES_PER_DAY = (24 * 3600 * 24, 24 * 3600 * 25, 24 * 6 * 17982, 24 * 3600 * 30)
+
+# Universal Real Time SysEx id and the MTC Full Frame sub-ids
+_UNIVERSAL_REAL_TIME = b"\x7f"
+_FULL_FRAME_SUB_IDS = b"\x01\x01"
+
+
+def timecode_to_frames(
+    hours: int, minutes: int, seconds: int, frames: int, rate: int = FPS_25
+) -> int:
+    """Convert a timecode to the number of frames since 00:00:00:00.
+
+    :param int rate: The SMPTE type, one of ``FPS_24``, ``FPS_25``, ``FPS_30_DROP``
+        or ``FPS_30``.
+    """
+    fps = FRAME_RATES[rate]
+    count = ((hours * 60 + minutes) * 60 + seconds) * fps + frames
+    if rate == FPS_30_DROP:
+        total_minutes = hours * 60 + minutes
+        count -= 2 * (total_minutes - total_minutes // 10)
+    return count
+
+
+def frames_to_timecode(count: int, rate: int = FPS_25) -> Tuple[int, int, int, int]:
+    """Convert a number of frames since 00:00:00:00 to an
+    ``(hours, minutes, seconds, frames)`` tuple, wrapping at 24 hours.
+
+    :param int rate: The SMPTE type, one of ``FPS_24``, ``FPS_25``, ``FPS_30_DROP``
+        or ``FPS_30``.
+    """
+    count %= _FRAMES_PER_DAY[rate]
+    if rate == FPS_30_DROP:
+        tens, rem = divmod(count, _DROP_FRAMES_PER_10_MINUTES)
+        count += 18 * tens
+        if rem > 1:
+            count += 2 * ((rem - 2) // _DROP_FRAMES_PER_MINUTE)
+    fps = FRAME_RATES[rate]
+    count, frames = divmod(count, fps)
+    count, seconds = divmod(count, 60)
+    hours, minutes = divmod(count, 60)
+    return (hours, minutes, seconds, frames)
+
+
+def full_frame_message(
+    hours: int,
+    minutes: int,
+    seconds: int,
+    frames: int,
+    rate: int = FPS_25,
+    device_id: int = 0x7F,
+) -> SystemExclusive:
+    """Create a Full Frame universal real time SysEx message for a timecode.
+
+    :param int device_id: The target device id, 0x7F (the default) is all devices.
+    """
+    if (
+        not 0 <= rate <= 3
+        or not 0 <= hours <= 23
+        or not 0 <= minutes <= 59
+        or not 0 <= seconds <= 59
+        or not 0 <= frames < FRAME_RATES[rate]
+        or not 0 <= device_id <= 0x7F
+    ):
+        MIDIMessage._raise_valueerror_oor()
+    return SystemExclusive(
+        _UNIVERSAL_REAL_TIME,
+        bytes([device_id])
+        + _FULL_FRAME_SUB_IDS
+        + bytes([rate << 5 | hours, minutes, seconds, frames]),
+    )
+
+
+class MtcReader:
+    """Assembles MIDI Time Code from received messages.
+
+    Pass every received message to :meth:`feed`, anything other than
+    :class:`~adafruit_midi.mtc_quarter_frame.MtcQuarterFrame` or a Full Frame
+    :class:`~adafruit_midi.system_exclusive.SystemExclusive` is ignored.
+
+    A complete timecode is only available after eight consecutive quarter frames
+    have been seen. The value carried by the quarter frames describes the time
+    when the first of them was sent, this is two frames in the past by the time
+    the last one arrives and the reader compensates for that. Between complete
+    sequences the frame count is advanced every four quarter frames.
+    Quarter frames arriving in descending order indicate reverse play.
+    """
+
+    def __init__(self) -> None:
+        self._pieces = bytearray(8)
+        self._last_piece = -1
+        self._sequence_len = 0
+        self.hours = 0
+        """Hours, 0-23"""
+        self.minutes = 0
+        """Minutes, 0-59"""
+        self.seconds = 0
+        """Seconds, 0-59"""
+        self.frames = 0
+        """Frames, 0-29 depending on :attr:`rate`"""
+        self.rate = FPS_25
+        """The SMPTE type, one of ``FPS_24``, ``FPS_25``, ``FPS_30_DROP`` or ``FPS_30``."""
+        self.direction = 0
+        """1 for forward, -1 for reverse, 0 when quarter frames are not running."""
+        self.locked = False
+        """True once a complete timecode has been received."""
+
+    @property
+    def timecode(self) -> Tuple[int, int, int, int]:
+        """The current ``(hours, minutes, seconds, frames)``."""
+        return (self.hours, self.minutes, self.seconds, self.frames)
+
+    @property
+    def fps(self) -> float:
+        """The frame rate in frames per second, 29.97 for drop frame."""
+        return _FRAMES_PER_SECOND[self.rate]
+
+    @property
+    def position(self) -> float:
+        """The current timecode in seconds."""
+        count = timecode_to_frames(self.hours, self.minutes, self.seconds, self.frames, self.rate)
+        return count / _FRAMES_PER_SECOND[self.rate]
+
+    def reset(self) -> None:
+        """Forget any partially assembled timecode and the direction."""
+        self._last_piece = -1
+        self._sequence_len = 0
+        self.direction = 0
+        self.locked = False
+
+    def feed(self, msg: Optional[MIDIMessage]) -> bool:
+        """Process a received message.
+
+        :returns bool: True if the timecode was updated.
+        """
+        if isinstance(msg, MtcQuarterFrame):
+            return self._feed_quarter_frame(msg.type, msg.value)
+        if isinstance(msg, SystemExclusive):
+            return self._feed_full_frame(msg)
+        return False
+
+    def _set(self, timecode: Tuple[int, int, int, int]) -> None:
+        (self.hours, self.minutes, self.seconds, self.frames) = timecode
+
+    def _step(self, delta: int) -> None:
+        count = timecode_to_frames(self.hours, self.minutes, self.seconds, self.frames, self.rate)
+        self._set(frames_to_timecode(count + delta, self.rate))
+
+    def _feed_full_frame(self, msg: SystemExclusive) -> bool:
+        data = msg.data
+        if (
+            msg.manufacturer_id != _UNIVERSAL_REAL_TIME
+            or len(data) != 7
+            or data[1:3] != _FULL_FRAME_SUB_IDS
+        ):
+            return False
+        # A Full Frame is sent when locating so quarter frames are not running
+        self.reset()
+        self.rate = (data[3] >> 5) & 0x03
+        self._set((data[3] & 0x1F, data[4], data[5], data[6]))
+        self.locked = True
+        return True
+
+    def _feed_quarter_frame(self, piece: int, value: int) -> bool:
+        if self._last_piece < 0:
+            direction = 0
+        elif piece == (self._last_piece + 1) & 7:
+            direction = 1
+        elif piece == (self._last_piece - 1) & 7:
+            direction = -1
+        else:
+            # Lost a message, start assembling again
+            direction = 0
+        if direction == 0:
+            self._sequence_len = 0
+        elif direction != self.direction:
+            # The previous piece starts the sequence in the new direction
+            self._sequence_len = 1
+        self.direction = direction
+        self._last_piece = piece
+        self._pieces[piece] = value
+        self._sequence_len += 1
+
+        if self._sequence_len >= 8 and piece == (7 if direction > 0 else 0):
+            pieces = self._pieces
+            self.rate = (pieces[7] >> 1) & 0x03
+            self._set(
+                (
+                    (pieces[7] & 0x01) << 4 | pieces[6],
+                    pieces[5] << 4 | pieces[4],
+                    pieces[3] << 4 | pieces[2],
+                    pieces[1] << 4 | pieces[0],
+                )
+            )
+            self._step(2 * direction)
+            self.locked = True
+            return True
+
+        # The frame changes between piece 3 and 4 in either direction
+        if self.locked and piece == (3 if direction > 0 else 4) and self._sequence_len > 1:
+            self._step(direction)
+            return True
+        return False
+
+
+class MtcGenerator:
+    """Generates MIDI Time Code quarter frames from a timecode source.
+
+    Call :meth:`poll` frequently with the current position of the source in
+    seconds and send every message returned until it returns ``None``.
+    A Full Frame message is returned to relocate receivers when the
+    position jumps backwards or by more than a frame ahead of schedule.
+
+    :param int rate: The SMPTE type, one of ``FPS_24``, ``FPS_25``, ``FPS_30_DROP``
+        or ``FPS_30``, default ``FPS_25``.
+    :param int device_id: The device id used for Full Frame messages, default 0x7F (all).
+    """
+
+    def __init__(self, rate: int = FPS_25, *, device_id: int = 0x7F) -> None:
+        if not 0 <= rate <= 3:
+            MIDIMessage._raise_valueerror_oor()
+        self.rate = rate
+        self.device_id = device_id
+        self._quarter_frames_per_second = 4 * _FRAMES_PER_SECOND[rate]
+        self._next_qf = None
+        self._timecode = (0, 0, 0, 0)
+
+    def _quarter_frame_index(self, position: float) -> int:
+        return int(position * self._quarter_frames_per_second)
+
+    def locate(self, position: float) -> SystemExclusive:
+        """Move to ``position`` seconds and return the Full Frame message for it."""
+        index = self._quarter_frame_index(position)
+        # Quarter frame sequences start on even frames
+        self._next_qf = (index + 7) & ~7
+        return full_frame_message(
+            *frames_to_timecode(index >> 2, self.rate), self.rate, self.device_id
+        )
+
+    def stop(self) -> None:
+        """Stop generating, the next :meth:`poll` will send a Full Frame message."""
+        self._next_qf = None
+
+    def poll(self, position: float) -> Optional[Union[MtcQuarterFrame, SystemExclusive]]:
+        """Return the next message due at ``position`` seconds or None if nothing is due."""
+        index = self._quarter_frame_index(position)
+        next_qf = self._next_qf
+        if next_qf is None or index < next_qf - 8 or index > next_qf + 4:
+            return self.locate(position)
+        if index < next_qf:
+            return None
+
+        piece = next_qf & 7
+        if piece == 0:
+            # Each sequence of eight describes the frame at which it starts
+            self._timecode = frames_to_timecode(next_qf >> 2, self.rate)
+        (hours, minutes, seconds, frames) = self._timecode
+        if piece == 7:
+            value = self.rate << 1 | hours >> 4
+        else:
+            value = (frames, frames, seconds, seconds, minutes, minutes, hours)[piece]
+            value = value >> 4 if piece & 1 else value & 0x0F
+        self._next_qf = next_qf + 1
+        return MtcQuarterFrame(piece, value)
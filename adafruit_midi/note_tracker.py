@@ -0,0 +1,154 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_midi.note_tracker`
+================================================================================
+
+Active note tracking for a fast panic (all notes off).
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+The held notes are stored as a 16 channel by 128 note bitset in a 256 byte
+``bytearray`` so every update is a single bit operation.
+
+"""
+
+try:
+    from typing import Iterator, List, Optional
+except ImportError:
+    pass
+
+from .control_change_values import ALL_NOTES_OFF, ALL_SOUND_OFF
+from .midi_message import MIDIMessage
+from .note_off import NoteOff
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MIDI.git"
+
+
+class NoteTracker:
+    """Tracks which notes are held on each channel.
+
+    Pass messages to :meth:`observe` after they have been received or sent,
+    :meth:`adafruit_midi.MIDI.send` sets the channel on the message as it is sent.
+    A Note On with velocity 0 is treated as a Note Off and the
+    All Notes Off and All Sound Off Control Changes release the channel.
+    """
+
+    def __init__(self) -> None:
+        self._bits = bytearray(16 * 16)
+        self._counts = bytearray(16)
+
+    def note_on(self, note: int, channel: int) -> None:
+        """Mark ``note`` as held on ``channel``."""
+        idx = channel << 4 | note >> 3
+        mask = 1 << (note & 7)
+        if not self._bits[idx] & mask:
+            self._bits[idx] |= mask
+            self._counts[channel] += 1
+
+    def note_off(self, note: int, channel: int) -> None:
+        """Mark ``note`` as released on ``channel``."""
+        idx = channel << 4 | note >> 3
+        mask = 1 << (note & 7)
+        if self._bits[idx] & mask:
+            self._bits[idx] &= ~mask
+            self._counts[channel] -= 1
+
+    def observe(self, msg: Optional[MIDIMessage]) -> None:
+        """Update the held notes from a message, other messages are ignored."""
+        status = msg._STATUS if msg is not None else None
+        if status == 0x90:
+            if msg.velocity:
+                self.note_on(msg.note, msg.channel)
+            else:
+                self.note_off(msg.note, msg.channel)
+        elif status == 0x80:
+            self.note_off(msg.note, msg.channel)
+        elif status == 0xB0 and msg.control in {ALL_NOTES_OFF, ALL_SOUND_OFF}:
+            self.clear(msg.channel)
+
+    def observe_bytes(self, data: bytes) -> None:
+        """Update the held notes from complete MIDI messages in wire format
+        without running status."""
+        idx = 0
+        end = len(data) - 2
+        while idx < end:
+            status = data[idx]
+            command = status & 0xF0
+            if command == 0x90 and data[idx + 2]:
+                self.note_on(data[idx + 1], status & 0x0F)
+            elif command in {0x80, 0x90}:
+                self.note_off(data[idx + 1], status & 0x0F)
+            elif command == 0xB0 and data[idx + 1] in {ALL_NOTES_OFF, ALL_SOUND_OFF}:
+                self.clear(status & 0x0F)
+            idx += 1
+            while idx < end and not data[idx] & 0x80:
+                idx += 1
+
+    def is_active(self, note: int, channel: int) -> bool:
+        """True if ``note`` is held on ``channel``."""
+        return bool(self._bits[channel << 4 | note >> 3] & 1 << (note & 7))
+
+    def count(self, channel: Optional[int] = None) -> int:
+        """The number of held notes on ``channel`` or on all channels."""
+        if channel is None:
+            return sum(self._counts)
+        return self._counts[channel]
+
+    def active_notes(self, channel: int) -> Iterator[int]:
+        """Iterate over the held notes on ``channel`` in ascending order."""
+        if not self._counts[channel]:
+            return
+        base = channel << 4
+        for idx in range(16):
+            bits = self._bits[base + idx]
+            note = idx << 3
+            while bits:
+                if bits & 1:
+                    yield note
+                bits >>= 1
+                note += 1
+
+    def clear(self, channel: Optional[int] = None) -> None:
+        """Forget the held notes on ``channel`` or on all channels."""
+        channels = range(16) if channel is None else (channel,)
+        for chan in channels:
+            if self._counts[chan]:
+                base = chan << 4
+                for idx in range(base, base + 16):
+                    self._bits[idx] = 0
+                self._counts[chan] = 0
+
+    def panic_messages(self, channel: int) -> List[NoteOff]:
+        """Return a :class:`~adafruit_midi.note_off.NoteOff` for every held note
+        on ``channel`` and forget them."""
+        msgs = [NoteOff(note, channel=channel) for note in self.active_notes(channel)]
+        self.clear(channel)
+        return msgs
+
+    def panic_bytes(self) -> bytearray:
+        """Return the wire format Note Offs for every held note on all channels
+        and forget them. Running status is used so each note costs 2 bytes."""
+        data = bytearray()
+        for channel in range(16):
+            if self._counts[channel]:
+                data.append(0x80 | channel)
+                for note in self.active_notes(channel):
+                    data.append(note)
+                    data.append(0)
+        self.clear()
+        return data
+
+    def panic(self, midi) -> None:
+        """Send a Note Off for every held note using ``midi``, an
+        :class:`adafruit_midi.MIDI` object, and forget them."""
+        for channel in range(16):
+            if self._counts[channel]:
+                midi.send(self.panic_messages(channel), channel=channel)
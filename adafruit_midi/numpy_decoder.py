@@ -0,0 +1,186 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_midi.numpy_decoder`
+================================================================================
+
+Vectorised decoding of large captured MIDI byte streams into NumPy structured
+arrays, for offline analysis on a host computer.
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* NumPy, this module can be imported without it but :func:`decode` needs it.
+
+The results are the same as calling
+:meth:`~adafruit_midi.midi_message.MIDIMessage.from_message_bytes` repeatedly
+on the whole stream with all channels, using the message types registered
+(imported) when :func:`decode` is called. Status byte positions and the
+lengths from a status table are found with array operations, the only Python
+loop is over the places where a message contains another status byte,
+e.g. SysEx or a System Real Time byte in the middle of a message.
+
+"""
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from typing import Tuple
+except ImportError:
+    pass
+
+from .midi_message import MIDIMessage
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MIDI.git"
+
+# Values of the kind field
+KIND_MESSAGE = 0
+"""A message of a registered type."""
+KIND_UNKNOWN = 1
+"""A status with no registered type, like :class:`~adafruit_midi.midi_message.MIDIUnknownEvent`."""
+KIND_BAD = 2
+"""A message which could not be parsed, like :class:`~adafruit_midi.midi_message.MIDIBadEvent`."""
+
+MESSAGE_DTYPE = [
+    ("offset", "i8"),
+    ("status", "u1"),
+    ("channel", "i1"),
+    ("data1", "u1"),
+    ("data2", "u1"),
+    ("kind", "u1"),
+]
+"""The fields of the messages array, channel is -1 for messages without one
+and data bytes a message does not have are 0."""
+
+SYSEX_DTYPE = [("offset", "i8"), ("length", "i8")]
+"""The fields of the SysEx array, the range includes the start and end status."""
+
+
+def _status_tables() -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Return the length (-1 variable, 0 unknown), end status and channel
+    flag of each status byte from the registered message types."""
+    lengths = np.zeros(256, dtype=np.int64)
+    end_status = np.zeros(256, dtype=np.int64)
+    channelled = np.zeros(256, dtype=bool)
+    for status in range(0x80, 0x100):
+        for (msg_status, mask), msgclass in MIDIMessage._statusandmask_to_class:
+            if status & mask == msg_status:
+                lengths[status] = msgclass.LENGTH
+                end_status[status] = msgclass.ENDSTATUS or 0
+                channelled[status] = mask == 0xF0
+                break
+    return lengths, end_status, channelled
+
+
+def _candidates(buf: "np.ndarray", lengths: "np.ndarray") -> Tuple["np.ndarray", ...]:
+    """Return the position, status and length of every status byte with the
+    position parsing would continue from and whether the message is incomplete."""
+    size = len(buf)
+    pos = np.flatnonzero(buf >= 0x80)
+    count = len(pos)
+    status = buf[pos].astype(np.int64)
+    length = lengths[status]
+    variable = length < 0
+    consumed_end = pos + np.maximum(length, 1)
+    incomplete = consumed_end > size
+    # Variable length messages end at the next status byte which is consumed
+    # whether or not it is the right end status
+    following = np.minimum(np.arange(1, count + 1), max(count - 1, 0))
+    consumed_end = np.where(variable, pos[following] + 1, consumed_end)
+    is_last = np.zeros(count, dtype=bool)
+    is_last[-1:] = True
+    incomplete = np.where(variable, is_last, incomplete)
+    return pos, status, length, consumed_end, incomplete
+
+
+def _follow_chain(
+    pos: "np.ndarray", consumed_end: "np.ndarray", incomplete: "np.ndarray", size: int
+) -> Tuple["np.ndarray", int]:
+    """Return which status bytes start messages and the number of bytes consumed."""
+    count = len(pos)
+    next_idx = np.searchsorted(pos, consumed_end)
+    on_chain = np.zeros(count, dtype=bool)
+    # Runs of candidates which each continue at the next are marked in one step
+    irregular = np.flatnonzero((next_idx != np.arange(1, count + 1)) | incomplete)
+    idx = 0
+    while idx < count:
+        found = np.searchsorted(irregular, idx)
+        stop = irregular[found] if found < len(irregular) else count
+        on_chain[idx:stop] = True
+        if stop == count:
+            break
+        if incomplete[stop]:
+            return on_chain, int(pos[stop])
+        on_chain[stop] = True
+        idx = next_idx[stop]
+    return on_chain, size
+
+
+def _messages(
+    buf: "np.ndarray",
+    start: "np.ndarray",
+    status: "np.ndarray",
+    length: "np.ndarray",
+    channelled: "np.ndarray",
+) -> "np.ndarray":
+    """Build the messages array from the messages found."""
+    last = len(buf) - 1
+    data1 = np.where(length >= 2, buf[np.minimum(start + 1, last)], 0).astype(np.int64)
+    data2 = np.where(length >= 3, buf[np.minimum(start + 2, last)], 0).astype(np.int64)
+
+    kind = np.where(length == 0, KIND_UNKNOWN, KIND_MESSAGE)
+    # Data bytes must not have the top bit set except for Pitch Bend
+    # which combines the two so only a bad MSB is out of range
+    is_bend = status & 0xF0 == 0xE0
+    bad = np.where(is_bend, data2 >= 0x80, (data1 >= 0x80) | (data2 >= 0x80))
+    kind = np.where((kind == KIND_MESSAGE) & bad, KIND_BAD, kind)
+    # A Pitch Bend LSB with the top bit set carries into the MSB
+    carry = is_bend & (kind == KIND_MESSAGE) & (data1 >= 0x80)
+
+    messages = np.zeros(len(start), dtype=MESSAGE_DTYPE)
+    messages["offset"] = start
+    messages["status"] = status
+    messages["channel"] = np.where(channelled[status] & (kind == KIND_MESSAGE), status & 0x0F, -1)
+    messages["data1"] = np.where(carry, data1 & 0x7F, data1)
+    messages["data2"] = np.where(carry, data2 | 1, data2)
+    messages["kind"] = kind
+    return messages
+
+
+def decode(data: bytes) -> Tuple["np.ndarray", "np.ndarray", int]:
+    """Decode a whole MIDI byte stream.
+
+    :param data: The bytes, any bytes-like object or a ``uint8`` array.
+    :returns: A tuple of the messages in a :data:`MESSAGE_DTYPE` array, the
+        SysEx messages in a :data:`SYSEX_DTYPE` array and the number of bytes
+        consumed. Any bytes after that are an incomplete message.
+    """
+    if np is None:
+        raise ImportError("numpy is required")
+    buf = data if isinstance(data, np.ndarray) else np.frombuffer(data, dtype=np.uint8)
+    lengths, end_status, channelled = _status_tables()
+    pos, status, length, consumed_end, incomplete = _candidates(buf, lengths)
+    on_chain, consumed = _follow_chain(pos, consumed_end, incomplete, len(buf))
+
+    # SysEx, only those with the right end status are messages
+    good_end = np.zeros(len(pos), dtype=bool)
+    good_end[:-1] = status[1:] == end_status[status[:-1]]
+    found = np.flatnonzero(on_chain & (length < 0) & good_end)
+    sysex = np.zeros(len(found), dtype=SYSEX_DTYPE)
+    sysex["offset"] = pos[found]
+    sysex["length"] = consumed_end[found] - pos[found]
+
+    found = np.flatnonzero(on_chain & (length >= 0))
+    messages = _messages(buf, pos[found], status[found], length[found], channelled)
+    return messages, sysex, consumed
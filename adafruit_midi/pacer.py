@@ -0,0 +1,127 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_midi.pacer`
+================================================================================
+
+Output pacing which releases data to a port no faster than the link can
+carry it.
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+Each byte takes 10 bit times on a UART link, start bit, 8 data bits and stop
+bit, which is 320us at the standard 31250 baud. The pacer keeps an estimate
+of when the bytes already written will have left the wire and only writes
+more when that leaves room in the transmit buffer, the rest is queued.
+
+"""
+
+import time
+
+try:
+    from typing import Optional
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MIDI.git"
+
+
+class PacedOutput:
+    """Wraps an output port and writes to it at line rate.
+
+    This implements ``write(buffer, length)`` so it can be used as the
+    ``midi_out`` of an :class:`adafruit_midi.MIDI` object. Data is queued
+    and written as the link allows, call :meth:`poll` frequently.
+
+    :param port: The object which implements ``write(buffer, length)``,
+        e.g. a ``busio.UART``.
+    :param int baud: The link speed in bits per second, default 31250.
+    :param int tx_buffer: The number of bytes which may be written ahead of the
+        wire, at most the size of the port's transmit buffer, default 16.
+    """
+
+    def __init__(self, port, *, baud: int = 31250, tx_buffer: int = 16) -> None:
+        if baud <= 0 or tx_buffer <= 0:
+            raise ValueError("baud and tx_buffer must be positive")
+        self._port = port
+        self.byte_time = 10 / baud
+        """The time in seconds to send one byte."""
+        self.tx_buffer = tx_buffer
+        self._queue = bytearray()
+        self._busy_until = 0.0
+
+    @property
+    def queued(self) -> int:
+        """The number of bytes waiting to be written to the port."""
+        return len(self._queue)
+
+    def in_flight(self, now: Optional[float] = None) -> int:
+        """The estimated number of bytes written to the port which have not yet
+        left the wire.
+
+        :param float now: The current time in seconds, defaults to ``time.monotonic()``.
+        """
+        if now is None:
+            now = time.monotonic()
+        remaining = self._busy_until - now
+        if remaining <= 0:
+            return 0
+        # Round up, a partly sent byte still occupies the wire
+        return int(remaining / self.byte_time + 0.999)
+
+    def backlog(self, now: Optional[float] = None) -> int:
+        """The number of bytes queued or in flight."""
+        return len(self._queue) + self.in_flight(now)
+
+    def backlog_ms(self, now: Optional[float] = None) -> float:
+        """The time in milliseconds until everything written so far has left
+        the wire, i.e. the latency a message sent now would see."""
+        if now is None:
+            now = time.monotonic()
+        busy = max(self._busy_until - now, 0.0)
+        return (busy + len(self._queue) * self.byte_time) * 1000
+
+    def write(self, buf: bytes, length: Optional[int] = None) -> None:
+        """Queue ``length`` bytes of ``buf`` and write what the link allows now."""
+        if length is None:
+            length = len(buf)
+        self._queue.extend(buf[:length] if length != len(buf) else buf)
+        self.poll()
+
+    def poll(self, now: Optional[float] = None) -> int:
+        """Write as much of the queue as fits in the transmit buffer.
+
+        :param float now: The current time in seconds, defaults to ``time.monotonic()``.
+        :returns int: The number of bytes written.
+        """
+        if not self._queue:
+            return 0
+        if now is None:
+            now = time.monotonic()
+        count = min(self.tx_buffer - self.in_flight(now), len(self._queue))
+        if count <= 0:
+            return 0
+        self._release(count, now)
+        return count
+
+    def flush(self, now: Optional[float] = None) -> None:
+        """Write everything queued regardless of the transmit buffer space."""
+        if self._queue:
+            self._release(len(self._queue), time.monotonic() if now is None else now)
+
+    def _release(self, count: int, now: float) -> None:
+        queue = self._queue
+        if count == len(queue):
+            self._port.write(queue, count)
+            self._queue = bytearray()
+        else:
+            self._port.write(queue[:count], count)
+            self._queue = queue[count:]
+        self._busy_until = max(self._busy_until, now) + count * self.byte_time
@@ -49,5 +49,31 @@ class PolyphonicKeyPressure(MIDIMessage):
     def from_bytes(cls, msg_bytes):
         return cls(msg_bytes[1], msg_bytes[2], channel=msg_bytes[0] & cls.CHANNELMASK)
 
+    @classmethod
+    def many(cls, notes, pressures, *, channel=None):
+        """Create a list of Polyphonic Key Pressure messages, the values are validated
+        together which is quicker than creating them one at a time.
+
+        :param notes: The note numbers as ``int`` or ``str``, e.g. ``(60, 64, "G4")``.
+        :param pressures: The pressures, 0-127, as a sequence or one value for all.
+        :param channel: A channel, a sequence of channels or None, default None.
+        """
+        from .message_batch import many
+
+        return many(cls, notes, pressures, channel, True)
+
+    @classmethod
+    def encode_many(cls, notes, pressures, *, channel=0, out=None):
+        """Encode Polyphonic Key Pressure messages straight to their wire format in one
+        buffer without creating message objects, see :meth:`many`.
+
+        :param channel: A channel, a sequence of channels or None for 0, default 0.
+        :param bytearray out: An optional bytearray to append to.
+        :returns bytearray: The encoded messages.
+        """
+        from .message_batch import encode_many
+
+        return encode_many(cls, notes, pressures, channel, out, True)
+
 
 PolyphonicKeyPressure.register_message_type()
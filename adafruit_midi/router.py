@@ -0,0 +1,172 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_midi.router`
+================================================================================
+
+Dispatch received MIDI messages to handlers registered by message type,
+channel and note or controller number.
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+The registrations are compiled into a table indexed by status byte
+(including the channel) so dispatching a message is a single lookup
+rather than a chain of ``isinstance`` tests.
+
+"""
+
+try:
+    from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+except ImportError:
+    pass
+
+from .midi_message import MIDIMessage
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MIDI.git"
+
+
+class MIDIRouter:
+    """Calls handlers for messages received by an :class:`adafruit_midi.MIDI` object.
+
+    Handlers are called with the message as the only argument, in the order
+    they were registered. Messages which match no registration go to the
+    ``default`` handler, this includes
+    :class:`~adafruit_midi.midi_message.MIDIUnknownEvent` and
+    :class:`~adafruit_midi.midi_message.MIDIBadEvent`.
+
+    :param midi: The :class:`adafruit_midi.MIDI` object to receive from.
+    :param default: The handler for unmatched messages, default None.
+    """
+
+    def __init__(self, midi, *, default: Optional[Callable[[MIDIMessage], Any]] = None) -> None:
+        self._midi = midi
+        self.default = default
+        self._routes = []
+        self._table = None
+        self._numbered = None
+
+    def add(
+        self,
+        handler: Callable[[MIDIMessage], Any],
+        message: Optional[Union[type, int]] = None,
+        *,
+        channel: Optional[Union[int, Tuple[int, ...]]] = None,
+        number: Optional[int] = None,
+    ) -> None:
+        """Register a handler.
+
+        :param handler: The function to call with each matching message.
+        :param message: A :class:`~adafruit_midi.midi_message.MIDIMessage` subclass,
+            a status value like 0x90 or None for all messages, default None.
+        :param channel: The channel or a tuple of channels to match
+            or None for all channels, default None.
+        :param int number: The note number for Note On, Note Off and Polyphonic Key
+            Pressure or the controller number for Control Change, default None.
+        :raises ValueError: If ``number`` is given for other messages.
+        """
+        if message is None:
+            status, mask = 0x80, 0x80
+        elif isinstance(message, int):
+            status, mask = message, 0xF0 if message < 0xF0 else 0xFF
+            status &= mask
+        else:
+            status, mask = message._STATUS, message._STATUSMASK
+        if number is not None and not (mask == 0xF0 and 0x80 <= status < 0xC0):
+            raise ValueError("number is only for notes and control changes")
+        if isinstance(channel, int):
+            channel = (channel,)
+        self._routes.append((handler, status, mask, channel, number))
+        self._table = None
+
+    def route(
+        self,
+        message: Optional[Union[type, int]] = None,
+        *,
+        channel: Optional[Union[int, Tuple[int, ...]]] = None,
+        number: Optional[int] = None,
+    ) -> Callable:
+        """A decorator which registers the function with :meth:`add`."""
+
+        def decorator(handler):
+            self.add(handler, message, channel=channel, number=number)
+            return handler
+
+        return decorator
+
+    def remove(self, handler: Callable[[MIDIMessage], Any]) -> None:
+        """Remove every registration of ``handler``."""
+        self._routes = [route for route in self._routes if route[0] is not handler]
+        self._table = None
+
+    def _compile(self) -> None:
+        table = [()] * 256
+        numbered = [None] * 256
+        for status_byte in range(0x80, 0x100):
+            channel = status_byte & 0x0F if status_byte < 0xF0 else None
+            matches = []
+            for handler, status, mask, channels, number in self._routes:
+                if status_byte & mask != status:
+                    continue
+                if channels is not None and channel not in channels:
+                    continue
+                matches.append((handler, number))
+            table[status_byte] = tuple(handler for handler, number in matches if number is None)
+            numbers = {number for handler, number in matches if number is not None}
+            if numbers and 0x80 <= status_byte < 0xC0:
+                numbered[status_byte] = {
+                    num: tuple(handler for handler, number in matches if number in {None, num})
+                    for num in numbers
+                }
+        self._table = table
+        self._numbered = numbered
+
+    def dispatch(self, msg: MIDIMessage) -> bool:
+        """Call the handlers registered for ``msg``.
+
+        :returns bool: True if any handler other than the default was called.
+        """
+        if self._table is None:
+            self._compile()
+        status = msg._STATUS
+        handlers = ()
+        if status is not None:
+            if status < 0xF0:
+                status |= msg.channel
+                numbered = self._numbered[status]
+                if numbered is not None:
+                    number = msg.control if status >= 0xB0 else msg.note
+                    handlers = numbered.get(number, self._table[status])
+                else:
+                    handlers = self._table[status]
+            else:
+                handlers = self._table[status]
+        for handler in handlers:
+            handler(msg)
+        if not handlers and self.default is not None:
+            self.default(msg)
+        return bool(handlers)
+
+    def poll(self, max_messages: Optional[int] = None) -> int:
+        """Receive and dispatch messages until none are left.
+
+        :param int max_messages: The maximum number of messages to process
+            in this call or None for no limit, default None.
+        :returns int: The number of messages dispatched.
+        """
+        receive = self._midi.receive
+        dispatch = self.dispatch
+        count = 0
+        while max_messages is None or count < max_messages:
+            msg = receive()
+            if msg is None:
+                break
+            dispatch(msg)
+            count += 1
+        return count
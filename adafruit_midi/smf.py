@@ -0,0 +1,648 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_midi.smf`
+================================================================================
+
+Standard MIDI File (.mid) reading which streams the events of each track as
+the existing message classes, and writing.
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+Only the chunk positions are kept in memory, each track is read through a
+small buffer as it is iterated so the memory used does not depend on the
+size of the file. Tracks can be iterated at the same time, each keeps its
+own file position. Files can be an open file, a ``mmap`` or bytes.
+The writer buffers its output and writes the chunk lengths when each track
+ends so it does not keep the events either.
+
+"""
+
+from io import BytesIO
+
+try:
+    from heapq import heappop, heappush
+except ImportError:
+    # A sorted list is also a heap, fine for the few tracks of a file
+    def heappush(heap, item):
+        heap.insert(_bisect_right(heap, item), item)
+
+    def heappop(heap):
+        return heap.pop(0)
+
+
+try:
+    from typing import BinaryIO, Iterator, List, Optional, Tuple, Union
+except ImportError:
+    pass
+
+from .channel_pressure import ChannelPressure
+from .control_change import ControlChange
+from .midi_message import MIDIMessage
+from .note_off import NoteOff
+from .note_on import NoteOn
+from .pitch_bend import PitchBend
+from .polyphonic_key_pressure import PolyphonicKeyPressure
+from .program_change import ProgramChange
+from .system_exclusive import SystemExclusive
+from .thru import MESSAGE_LENGTH
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MIDI.git"
+
+# Meta event types
+META_SEQUENCE_NUMBER = 0x00
+META_TEXT = 0x01
+META_COPYRIGHT = 0x02
+META_TRACK_NAME = 0x03
+META_INSTRUMENT_NAME = 0x04
+META_LYRIC = 0x05
+META_MARKER = 0x06
+META_CUE_POINT = 0x07
+META_CHANNEL_PREFIX = 0x20
+META_END_OF_TRACK = 0x2F
+META_TEMPO = 0x51
+META_SMPTE_OFFSET = 0x54
+META_TIME_SIGNATURE = 0x58
+META_KEY_SIGNATURE = 0x59
+META_SEQUENCER_SPECIFIC = 0x7F
+
+# Classes of the channel messages by the top three bits of the status
+_CHANNEL_CLASSES = (
+    NoteOff,
+    NoteOn,
+    PolyphonicKeyPressure,
+    ControlChange,
+    ProgramChange,
+    ChannelPressure,
+    PitchBend,
+)
+
+
+class MetaEvent:
+    """A meta event from a MIDI file, these are not sent to devices.
+
+    :param int meta_type: The type, e.g. :data:`META_TEMPO`.
+    :param bytes data: The data.
+    """
+
+    def __init__(self, meta_type: int, data: bytes) -> None:
+        self.type = meta_type
+        self.data = bytes(data)
+
+    @property
+    def tempo(self) -> Optional[int]:
+        """The microseconds per quarter note of a tempo event, otherwise None."""
+        if self.type != META_TEMPO or len(self.data) != 3:
+            return None
+        return self.data[0] << 16 | self.data[1] << 8 | self.data[2]
+
+    @property
+    def text(self) -> Optional[str]:
+        """The text of a text type event (0x01-0x0F), otherwise None."""
+        if not 0x01 <= self.type <= 0x0F:
+            return None
+        return self.data.decode("latin-1")
+
+    def __repr__(self) -> str:
+        return f"MetaEvent(0x{self.type:02x}, {self.data!r})"
+
+
+class RawEvent:
+    """Bytes from a MIDI file to send as they are: an escape (0xF7) event or
+    a SysEx event which is split into several packets.
+
+    :param bytes data: The bytes in wire format.
+    """
+
+    def __init__(self, data: bytes) -> None:
+        self.data = bytes(data)
+
+    def __repr__(self) -> str:
+        return f"RawEvent({self.data!r})"
+
+
+def read_varint(data: bytes, offset: int = 0) -> Tuple[int, int]:
+    """Decode a variable length quantity.
+
+    :returns: The value and the offset after it.
+    """
+    value = 0
+    for _ in range(4):
+        byte = data[offset]
+        offset += 1
+        value = value << 7 | byte & 0x7F
+        if not byte & 0x80:
+            return value, offset
+    raise ValueError("Variable length value too long")
+
+
+def encode_varint(value: int, out: Optional[bytearray] = None) -> bytearray:
+    """Encode a variable length quantity, 0-0x0FFFFFFF.
+
+    :param bytearray out: An optional bytearray to append to.
+    """
+    if not 0 <= value <= 0x0FFFFFFF:
+        raise ValueError("Variable length value out of range")
+    if out is None:
+        out = bytearray()
+    shift = 21
+    while shift and not value >> shift:
+        shift -= 7
+    while shift:
+        out.append(0x80 | (value >> shift) & 0x7F)
+        shift -= 7
+    out.append(value & 0x7F)
+    return out
+
+
+class _TrackCursor:
+    """Reads one track through its own buffer."""
+
+    def __init__(self, file, position: int, end: int, buffer_size: int) -> None:
+        self._file = file
+        self.position = position
+        self._end = end
+        self._buffer_size = buffer_size
+        self._buf = b""
+        self._idx = 0
+        self.tick = 0
+        self.running_status = 0
+        self._msg = bytearray(3)
+
+    def _fill(self) -> None:
+        remaining = self._end - self.position
+        if remaining <= 0:
+            raise ValueError("Truncated track")
+        self._file.seek(self.position)
+        self._buf = self._file.read(min(self._buffer_size, remaining))
+        self._idx = 0
+        if not self._buf:
+            raise ValueError("Truncated track")
+
+    def read_byte(self) -> int:
+        if self._idx >= len(self._buf):
+            self._fill()
+        byte = self._buf[self._idx]
+        self._idx += 1
+        self.position += 1
+        return byte
+
+    def read(self, length: int) -> bytes:
+        if self._end - self.position < length:
+            raise ValueError("Truncated track")
+        parts = []
+        while length:
+            if self._idx >= len(self._buf):
+                self._fill()
+            part = self._buf[self._idx : self._idx + length]
+            self._idx += len(part)
+            self.position += len(part)
+            length -= len(part)
+            parts.append(part)
+        return parts[0] if len(parts) == 1 else b"".join(parts)
+
+    def read_varint(self) -> int:
+        value = 0
+        for _ in range(4):
+            byte = self.read_byte()
+            value = value << 7 | byte & 0x7F
+            if not byte & 0x80:
+                return value
+        raise ValueError("Variable length value too long")
+
+    def next_event(self) -> Optional[Union[MIDIMessage, MetaEvent, RawEvent]]:
+        """Read the next event and advance the tick, None at the end of the track."""
+        if self.position >= self._end:
+            return None
+        self.tick += self.read_varint()
+        status = self.read_byte()
+        if status < 0xF0:
+            msg = self._msg
+            if status < 0x80:
+                if not self.running_status:
+                    raise ValueError("Data byte without running status")
+                msg[1] = status
+                status = self.running_status
+            else:
+                self.running_status = status
+                msg[1] = self.read_byte()
+            msg[0] = status
+            if MESSAGE_LENGTH[status] == 3:
+                msg[2] = self.read_byte()
+            return _CHANNEL_CLASSES[status >> 4 & 7].from_bytes(msg)
+        # SysEx and meta events cancel running status
+        self.running_status = 0
+        if status == 0xFF:
+            meta_type = self.read_byte()
+            return MetaEvent(meta_type, self.read(self.read_varint()))
+        if status in {0xF0, 0xF7}:
+            data = self.read(self.read_varint())
+            if status == 0xF0 and data[-1:] == b"\xf7":
+                return SystemExclusive.from_bytes(b"\xf0" + data)
+            return RawEvent(b"\xf0" + data if status == 0xF0 else data)
+        raise ValueError("Bad status in track")
+
+
+def _bisect_right(values, value) -> int:
+    """The index after the last item of sorted ``values`` which is <= ``value``."""
+    low, high = 0, len(values)
+    while low < high:
+        mid = (low + high) // 2
+        if value < values[mid]:
+            high = mid
+        else:
+            low = mid + 1
+    return low
+
+
+class TempoMap:
+    """Converts between ticks and seconds through tempo changes, the lookups
+    are binary searches so they take the same time anywhere in a long file.
+
+    :param int ticks_per_quarter: The timing resolution of the file.
+    :param int tempo: The tempo at tick 0 in microseconds per quarter note,
+        default 500000 (120 BPM).
+    :param float ticks_per_second: For SMPTE timing, a fixed rate which
+        tempo changes do not affect, default None.
+    """
+
+    def __init__(
+        self,
+        ticks_per_quarter: Optional[int] = 480,
+        tempo: int = 500000,
+        *,
+        ticks_per_second: Optional[float] = None,
+    ) -> None:
+        self.ticks_per_quarter = ticks_per_quarter
+        self.ticks_per_second = ticks_per_second
+        # Parallel lists of where each tempo starts
+        self._ticks = [0]
+        self._seconds = [0.0]
+        self._tempos = [tempo]
+
+    def __len__(self) -> int:
+        return len(self._ticks)
+
+    def _seconds_per_tick(self, tempo: int) -> float:
+        if self.ticks_per_second:
+            return 1 / self.ticks_per_second
+        return tempo / (1000000 * self.ticks_per_quarter)
+
+    def add(self, tick: int, tempo: int) -> None:
+        """Add a tempo change, changes must be added in time order and a change
+        at the same tick as the last replaces it."""
+        last = self._ticks[-1]
+        if tick < last:
+            raise ValueError("Tempo changes must be in time order")
+        if tick == last:
+            self._tempos[-1] = tempo
+            return
+        self._seconds.append(self.tick_to_seconds(tick))
+        self._ticks.append(tick)
+        self._tempos.append(tempo)
+
+    def tempo_at(self, tick: int) -> int:
+        """The tempo in microseconds per quarter note at a tick."""
+        return self._tempos[max(_bisect_right(self._ticks, tick) - 1, 0)]
+
+    def tick_to_seconds(self, tick: int) -> float:
+        """Convert ticks from the start of the file to seconds."""
+        idx = max(_bisect_right(self._ticks, tick) - 1, 0)
+        return self._seconds[idx] + (tick - self._ticks[idx]) * self._seconds_per_tick(
+            self._tempos[idx]
+        )
+
+    def seconds_to_ticks(self, seconds: float) -> int:
+        """Convert seconds from the start of the file to the nearest tick."""
+        idx = max(_bisect_right(self._seconds, seconds) - 1, 0)
+        return self._ticks[idx] + round(
+            (seconds - self._seconds[idx]) / self._seconds_per_tick(self._tempos[idx])
+        )
+
+
+def merge_tracks(
+    tracks: List[Iterator[Tuple[int, Union[MIDIMessage, MetaEvent, RawEvent]]]],
+) -> Iterator[Tuple[int, int, Union[MIDIMessage, MetaEvent, RawEvent]]]:
+    """Merge the events of tracks into one stream in tick order, reading one
+    event ahead from each track. Events at the same tick are in track order
+    then in their order in the track.
+
+    :param tracks: Iterators of (tick, event) like :meth:`SMFReader.track`.
+    :returns: (tick, track, event) tuples where track is the index in ``tracks``.
+    """
+    heap = []
+    for index, track in enumerate(tracks):
+        for tick, event in track:
+            heappush(heap, (tick, index, event, track))
+            break
+    while heap:
+        tick, index, event, track = heappop(heap)
+        yield tick, index, event
+        # There is only one event from each track in the heap so (tick, index)
+        # is unique and the events and tracks are never compared
+        for next_tick, next_event in track:
+            heappush(heap, (next_tick, index, next_event, track))
+            break
+
+
+class SMFReader:
+    """Reads a Standard MIDI File, format 0, 1 or 2.
+
+    :param file: An open binary file, a ``mmap`` or a bytes-like object.
+    :param int buffer_size: The size of the read buffer for each track, default 256.
+    """
+
+    def __init__(
+        self, file: Union[BinaryIO, bytes, bytearray, memoryview], *, buffer_size: int = 256
+    ) -> None:
+        if isinstance(file, (bytes, bytearray, memoryview)):
+            file = BytesIO(file)
+        self._file = file
+        self.buffer_size = buffer_size
+        file.seek(0)
+        header = file.read(14)
+        if len(header) < 14 or header[:4] != b"MThd":
+            raise ValueError("Not a Standard MIDI File")
+        header_length = int.from_bytes(header[4:8], "big")
+        self.format = int.from_bytes(header[8:10], "big")
+        """The file format, 0, 1 or 2."""
+        division = int.from_bytes(header[12:14], "big")
+        if division & 0x8000:
+            self.ticks_per_quarter = None
+            """The ticks per quarter note or None for SMPTE timing."""
+            self.frames_per_second = 256 - (division >> 8)
+            """The SMPTE frames per second or None, 29 is 30 drop frame."""
+            self.ticks_per_frame = division & 0xFF
+            """The ticks per SMPTE frame or None."""
+        else:
+            self.ticks_per_quarter = division
+            self.frames_per_second = None
+            self.ticks_per_frame = None
+
+        # Only the position of each track is kept, other chunks are skipped
+        self.track_chunks: List[Tuple[int, int]] = []
+        """The (offset, length) of the data of each track chunk."""
+        position = 8 + header_length
+        while True:
+            file.seek(position)
+            chunk = file.read(8)
+            if len(chunk) < 8:
+                break
+            length = int.from_bytes(chunk[4:8], "big")
+            if chunk[:4] == b"MTrk":
+                self.track_chunks.append((position + 8, length))
+            position += 8 + length
+
+    @property
+    def num_tracks(self) -> int:
+        """The number of tracks."""
+        return len(self.track_chunks)
+
+    def _cursor(self, index: int) -> _TrackCursor:
+        offset, length = self.track_chunks[index]
+        return _TrackCursor(self._file, offset, offset + length, self.buffer_size)
+
+    def track(self, index: int) -> Iterator[Tuple[int, Union[MIDIMessage, MetaEvent, RawEvent]]]:
+        """Iterate over the events of a track.
+
+        :returns: (tick, event) tuples where tick is from the start of the track
+            and event is a :class:`~adafruit_midi.midi_message.MIDIMessage`,
+            :class:`MetaEvent` or :class:`RawEvent`. Channel messages have
+            their channel set.
+        """
+        return self._events(self._cursor(index))
+
+    @staticmethod
+    def _events(
+        cursor: _TrackCursor,
+    ) -> Iterator[Tuple[int, Union[MIDIMessage, MetaEvent, RawEvent]]]:
+        while True:
+            event = cursor.next_event()
+            if event is None:
+                return
+            yield cursor.tick, event
+            if isinstance(event, MetaEvent) and event.type == META_END_OF_TRACK:
+                return
+
+    def _tempo_map(self) -> TempoMap:
+        """An empty :class:`TempoMap` with the timing of the file."""
+        if self.ticks_per_quarter is None:
+            fps = 29.97 if self.frames_per_second == 29 else self.frames_per_second
+            return TempoMap(None, ticks_per_second=fps * self.ticks_per_frame)
+        return TempoMap(self.ticks_per_quarter)
+
+    def timeline(
+        self, *, all_events: bool = False
+    ) -> Iterator[Tuple[float, int, Union[MIDIMessage, MetaEvent, RawEvent]]]:
+        """Iterate over the events of every track merged into time order,
+        with :func:`merge_tracks`, for playing a format 0 or 1 file.
+
+        :param bool all_events: Include :class:`MetaEvent` and :class:`RawEvent`
+            events as well as messages, default False.
+        :returns: (seconds, track, event) tuples where seconds is from the
+            start of the file following the tempo changes.
+        """
+        tempo_map = self._tempo_map()
+        for tick, index, event in merge_tracks([self.track(idx) for idx in range(self.num_tracks)]):
+            if isinstance(event, MIDIMessage):
+                yield tempo_map.tick_to_seconds(tick), index, event
+                continue
+            if isinstance(event, MetaEvent) and event.type == META_TEMPO:
+                tempo_map.add(tick, event.tempo)
+            if all_events:
+                yield tempo_map.tick_to_seconds(tick), index, event
+
+    def events(self) -> Iterator[Tuple[int, int, Union[MIDIMessage, MetaEvent, RawEvent]]]:
+        """Iterate over the events of every track, one track after another.
+
+        :returns: (track, tick, event) tuples.
+        """
+        for index in range(self.num_tracks):
+            for tick, event in self.track(index):
+                yield index, tick, event
+
+
+class SMFWriter:
+    """Writes a Standard MIDI File as events are added, the file must be seekable
+    as the chunk lengths are written when each track ends.
+
+    Channel messages use running status and output is buffered so long
+    recordings can be written without keeping them in memory.
+
+    :param file: A binary file open for writing.
+    :param int file_format: The file format, 0 or 1, default 1.
+    :param int ticks_per_quarter: The timing resolution, default 480.
+    :param int tempo: The initial tempo for converting times in seconds to
+        ticks in microseconds per quarter note, default 500000 (120 BPM).
+    :param int buffer_size: Write to the file when this much is buffered, default 512.
+    """
+
+    def __init__(
+        self,
+        file: BinaryIO,
+        *,
+        file_format: int = 1,
+        ticks_per_quarter: int = 480,
+        tempo: int = 500000,
+        buffer_size: int = 512,
+    ) -> None:
+        if file_format not in {0, 1}:
+            raise ValueError("Format must be 0 or 1")
+        if not 0 < ticks_per_quarter < 0x8000:
+            raise ValueError("ticks_per_quarter must be 1-32767")
+        self._file = file
+        self.format = file_format
+        self.ticks_per_quarter = ticks_per_quarter
+        self.buffer_size = buffer_size
+        self.num_tracks = 0
+        self.tempo_map = TempoMap(ticks_per_quarter, tempo)
+        """The :class:`TempoMap` used to convert times in seconds."""
+        self._buf = bytearray()
+        self._track_start = None
+        self._tick = 0
+        self._running_status = 0
+        self._ended = False
+        self._start = file.tell()
+        file.write(
+            b"MThd\x00\x00\x00\x06"
+            + file_format.to_bytes(2, "big")
+            + b"\x00\x00"
+            + ticks_per_quarter.to_bytes(2, "big")
+        )
+
+    def set_tempo(self, tempo: int, seconds: float = 0.0) -> None:
+        """Change the tempo at a time in seconds, this writes a tempo meta event
+        to the current track and changes the conversion of later times.
+
+        :param int tempo: Microseconds per quarter note.
+        """
+        tick = self.tempo_map.seconds_to_ticks(seconds)
+        self.tempo_map.add(tick, tempo)
+        self.write(tick, MetaEvent(META_TEMPO, tempo.to_bytes(3, "big")))
+
+    def start_track(self) -> None:
+        """Start a new track, ending any current one."""
+        if self.format == 0 and self.num_tracks:
+            raise ValueError("A format 0 file has one track")
+        if self._track_start is not None:
+            self.end_track()
+        self._flush()
+        self._track_start = self._file.tell()
+        self._file.write(b"MTrk\x00\x00\x00\x00")
+        self.num_tracks += 1
+        self._tick = 0
+        self._running_status = 0
+        self._ended = False
+
+    def write(
+        self,
+        tick: int,
+        event: Union[MIDIMessage, MetaEvent, RawEvent, bytes],
+        *,
+        channel: Optional[int] = None,
+    ) -> None:
+        """Add an event at a tick from the start of the track, starting a track if
+        there is none. Events must be added in time order.
+
+        :param event: A :class:`~adafruit_midi.midi_message.MIDIMessage`,
+            :class:`MetaEvent`, :class:`RawEvent` or one message in wire format.
+        :param int channel: Set the channel of a message, default None which
+            uses the channel of the message.
+        """
+        if self._track_start is None:
+            self.start_track()
+        if tick < self._tick:
+            raise ValueError("Events must be in time order")
+        if self._ended:
+            raise ValueError("Event after the end of the track")
+        buf = self._buf
+        encode_varint(tick - self._tick, buf)
+        self._tick = tick
+        if isinstance(event, MetaEvent):
+            buf.append(0xFF)
+            buf.append(event.type)
+            encode_varint(len(event.data), buf)
+            buf.extend(event.data)
+            self._running_status = 0
+            self._ended = event.type == META_END_OF_TRACK
+        else:
+            if isinstance(event, MIDIMessage):
+                if channel is not None:
+                    event.channel = channel
+                data = event.__bytes__()
+            else:
+                data = event.data if isinstance(event, RawEvent) else event
+            self._write_data(data, isinstance(event, RawEvent))
+        if len(buf) >= self.buffer_size:
+            self._flush()
+
+    def _write_data(self, data: bytes, raw: bool) -> None:
+        buf = self._buf
+        status = data[0]
+        if status < 0xF0 and not raw:
+            if status != self._running_status:
+                buf.append(status)
+                self._running_status = status
+            buf.extend(data[1:])
+            return
+        self._running_status = 0
+        if status == 0xF0:
+            buf.append(0xF0)
+            encode_varint(len(data) - 1, buf)
+            buf.extend(data[1:])
+        else:
+            # Anything else has to be escaped
+            buf.append(0xF7)
+            encode_varint(len(data), buf)
+            buf.extend(data)
+
+    def write_at(
+        self,
+        seconds: float,
+        event: Union[MIDIMessage, MetaEvent, RawEvent, bytes],
+        *,
+        channel: Optional[int] = None,
+    ) -> None:
+        """Add an event at a time in seconds from the start of the file,
+        see :meth:`write`."""
+        self.write(self.tempo_map.seconds_to_ticks(seconds), event, channel=channel)
+
+    def _flush(self) -> None:
+        if self._buf:
+            self._file.write(self._buf)
+            self._buf = bytearray()
+
+    def end_track(self) -> None:
+        """End the current track and write its length."""
+        if self._track_start is None:
+            return
+        if not self._ended:
+            self.write(self._tick, MetaEvent(META_END_OF_TRACK, b""))
+        self._flush()
+        end = self._file.tell()
+        self._file.seek(self._track_start + 4)
+        self._file.write((end - self._track_start - 8).to_bytes(4, "big"))
+        self._file.seek(end)
+        self._track_start = None
+
+    def close(self) -> None:
+        """End the current track and write the number of tracks, the file is not closed."""
+        self.end_track()
+        end = self._file.tell()
+        self._file.seek(self._start + 10)
+        self._file.write(self.num_tracks.to_bytes(2, "big"))
+        self._file.seek(end)
+        self._file.flush()
+
+    def __enter__(self) -> "SMFWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -0,0 +1,146 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_midi.smf_index`
+================================================================================
+
+Random access into Standard MIDI Files for scrubbing, looping and starting
+playback part way through a file.
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+The tracks are read once to record a checkpoint of the byte offset, tick
+and running status every ``interval`` events and the tempo changes. Seeking
+is a binary search of the checkpoints then decoding at most ``interval``
+events to reach the tick, so it takes the same time anywhere in the file.
+Each checkpoint takes 9 bytes, the offset and tick are 32 bit.
+
+"""
+
+from array import array
+
+try:
+    from typing import Iterator, List, Tuple, Union
+except ImportError:
+    pass
+
+from .midi_message import MIDIMessage
+from .smf import (
+    META_END_OF_TRACK,
+    META_TEMPO,
+    MetaEvent,
+    RawEvent,
+    SMFReader,
+    _bisect_right,
+    merge_tracks,
+)
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MIDI.git"
+
+
+class SeekIndex:
+    """An index of the tracks of a file and its tempo map.
+
+    :param SMFReader reader: The file.
+    :param int interval: The number of events between checkpoints, default 64.
+    """
+
+    def __init__(self, reader: SMFReader, *, interval: int = 64) -> None:
+        if interval < 1:
+            raise ValueError("interval must be at least 1")
+        self._reader = reader
+        self.interval = interval
+        self._positions = []
+        self._ticks = []
+        self._running = []
+        self.end_tick = 0
+        """The tick of the last event in any track."""
+        tempos = []
+        for index in range(reader.num_tracks):
+            self._index_track(index, tempos)
+
+        self.tempo_map = reader._tempo_map()
+        """The :class:`~adafruit_midi.smf.TempoMap` of the tempo changes in every track."""
+        # Tracks are in order, sort them together keeping the order at the same tick
+        tempos.sort(key=lambda change: change[0])
+        for tick, tempo in tempos:
+            self.tempo_map.add(tick, tempo)
+
+    def _index_track(self, index: int, tempos: List[Tuple[int, int]]) -> None:
+        cursor = self._reader._cursor(index)
+        positions = array("I")
+        ticks = array("I")
+        running = bytearray()
+        count = 0
+        while True:
+            if count % self.interval == 0:
+                positions.append(cursor.position)
+                ticks.append(cursor.tick)
+                running.append(cursor.running_status)
+            event = cursor.next_event()
+            if event is None:
+                break
+            count += 1
+            if isinstance(event, MetaEvent):
+                if event.type == META_TEMPO:
+                    tempos.append((cursor.tick, event.tempo))
+                elif event.type == META_END_OF_TRACK:
+                    break
+        self.end_tick = max(self.end_tick, cursor.tick)
+        self._positions.append(positions)
+        self._ticks.append(ticks)
+        self._running.append(running)
+
+    @property
+    def duration(self) -> float:
+        """The time of the last event in seconds."""
+        return self.tempo_map.tick_to_seconds(self.end_tick)
+
+    def track_from(
+        self, index: int, tick: int
+    ) -> Iterator[Tuple[int, Union[MIDIMessage, MetaEvent, RawEvent]]]:
+        """Iterate over the events of a track from a tick, like
+        :meth:`adafruit_midi.smf.SMFReader.track` without the events before it.
+        """
+        ticks = self._ticks[index]
+        # A checkpoint's tick is that of the event before it so start from
+        # the last one before the tick to include every event at the tick
+        idx = max(_bisect_right(ticks, tick - 1) - 1, 0)
+        cursor = self._reader._cursor(index)
+        cursor.position = self._positions[index][idx]
+        cursor.tick = ticks[idx]
+        cursor.running_status = self._running[index][idx]
+        for event_tick, event in SMFReader._events(cursor):
+            if event_tick >= tick:
+                yield event_tick, event
+
+    def tracks_from(
+        self, tick: int
+    ) -> List[Iterator[Tuple[int, Union[MIDIMessage, MetaEvent, RawEvent]]]]:
+        """:meth:`track_from` for every track."""
+        return [self.track_from(index, tick) for index in range(len(self._ticks))]
+
+    def track_from_seconds(
+        self, index: int, seconds: float
+    ) -> Iterator[Tuple[int, Union[MIDIMessage, MetaEvent, RawEvent]]]:
+        """:meth:`track_from` a time in seconds."""
+        return self.track_from(index, self.tempo_map.seconds_to_ticks(seconds))
+
+    def timeline_from(
+        self, seconds: float
+    ) -> Iterator[Tuple[float, int, Union[MIDIMessage, MetaEvent, RawEvent]]]:
+        """The messages of every track from a time in seconds, like
+        :meth:`adafruit_midi.smf.SMFReader.timeline`."""
+        tempo_map = self.tempo_map
+        for tick, index, event in merge_tracks(
+            self.tracks_from(tempo_map.seconds_to_ticks(seconds))
+        ):
+            if isinstance(event, MIDIMessage):
+                yield tempo_map.tick_to_seconds(tick), index, event
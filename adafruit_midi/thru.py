@@ -0,0 +1,203 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_midi.thru`
+================================================================================
+
+MIDI thru and splitter which forwards raw bytes from one input to several
+outputs without decoding them into message objects.
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+Each output has a 256 entry table which maps an incoming status byte to the
+status byte to send, or to 0 to drop the message. This one lookup per message
+does both the filtering and the channel remapping.
+
+"""
+
+try:
+    from typing import List, Optional, Union
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MIDI.git"
+
+# Length including status of each message by status byte, 0 for SysEx
+MESSAGE_LENGTH = bytes(
+    [0] * 0x80
+    + [3] * 0x40  # Note Off, Note On, Polyphonic Key Pressure, Control Change
+    + [2] * 0x20  # Program Change, Channel Pressure
+    + [3] * 0x10  # Pitch Bend
+    + [0, 2, 3, 2, 1, 1, 1, 0]  # System Common, SysEx end is handled separately
+    + [1] * 8  # System Real Time
+)
+
+
+class MIDIThru:
+    """Forwards everything received on one :class:`adafruit_midi.MIDI` object to others.
+
+    Messages are forwarded whole, running status is expanded and System
+    Real Time bytes are forwarded as soon as they are read. SysEx is forwarded
+    as it arrives, it is not buffered. The :attr:`adafruit_midi.MIDI.in_channel`
+    of the input is not applied.
+
+    :param midi_in: The :class:`adafruit_midi.MIDI` object to read from.
+    :param list outputs: The :class:`adafruit_midi.MIDI` objects to write to.
+    :param int read_size: The maximum number of bytes to read per call to
+        :meth:`process`, default 64.
+    """
+
+    def __init__(self, midi_in, outputs: List, *, read_size: int = 64) -> None:
+        self._port_in = midi_in._midi_in
+        self._outputs = list(outputs)
+        self._tables = [bytearray(range(256)) for _ in self._outputs]
+        self._bufs = [bytearray() for _ in self._outputs]
+        self.read_size = read_size
+        self._msg = bytearray(3)
+        self._count = 0
+        self._expected = 0
+        self._running_status = 0
+        self._in_sysex = False
+
+    def _tables_for(self, output: Optional[int]) -> List[bytearray]:
+        return self._tables if output is None else [self._tables[output]]
+
+    @staticmethod
+    def _statuses(message: Union[type, int], channel: Optional[int]) -> range:
+        status = message if isinstance(message, int) else message._STATUS
+        if status >= 0xF0:
+            return range(status, status + 1)
+        status &= 0xF0
+        if channel is not None:
+            return range(status | channel, (status | channel) + 1)
+        return range(status, status + 16)
+
+    def drop(
+        self,
+        message: Union[type, int],
+        *,
+        channel: Optional[int] = None,
+        output: Optional[int] = None,
+    ) -> None:
+        """Stop forwarding a type of message.
+
+        :param message: A :class:`~adafruit_midi.midi_message.MIDIMessage` subclass
+            or a status value like 0x90.
+        :param int channel: Only drop the message on this channel, default None (all).
+        :param int output: The index of the output or None for all outputs, default None.
+        """
+        for table in self._tables_for(output):
+            for status in self._statuses(message, channel):
+                table[status] = 0
+
+    def drop_channel(self, channel: int, *, output: Optional[int] = None) -> None:
+        """Stop forwarding all channel messages for ``channel``."""
+        for table in self._tables_for(output):
+            for status in range(0x80 | channel, 0xF0, 0x10):
+                table[status] = 0
+
+    def remap(self, channel: int, new_channel: int, *, output: Optional[int] = None) -> None:
+        """Send channel messages received on ``channel`` on ``new_channel``,
+        any messages already dropped stay dropped."""
+        if not 0 <= channel <= 15 or not 0 <= new_channel <= 15:
+            raise ValueError("Channel must be 0-15")
+        for table in self._tables_for(output):
+            for status in range(0x80 | channel, 0xF0, 0x10):
+                if table[status]:
+                    table[status] = status & 0xF0 | new_channel
+
+    def reset(self, *, output: Optional[int] = None) -> None:
+        """Forward everything unchanged again."""
+        for table in self._tables_for(output):
+            for status in range(256):
+                table[status] = status
+
+    def process(self) -> int:
+        """Read what is available from the input and forward it.
+
+        :returns int: The number of bytes read.
+        """
+        data = self._port_in.read(self.read_size)
+        if data:
+            self.forward(data)
+        return len(data) if data else 0
+
+    def _emit(self, status_in: int, length: int) -> None:
+        msg = self._msg
+        for table, buf in zip(self._tables, self._bufs):
+            status = table[status_in]
+            if status:
+                buf.append(status)
+                if length > 1:
+                    buf.append(msg[1])
+                    if length > 2:
+                        buf.append(msg[2])
+
+    def forward(self, data: bytes) -> None:
+        """Forward ``data`` as if it had been read from the input,
+        each output gets a single write."""
+        self._frame(data)
+        bufs = self._bufs
+        for idx, output in enumerate(self._outputs):
+            buf = bufs[idx]
+            if buf:
+                output._send(buf, len(buf))
+                bufs[idx] = bytearray()
+
+    def _frame(self, data: bytes) -> None:
+        msg = self._msg
+        tables = self._tables
+        bufs = self._bufs
+        for byte in data:
+            if byte >= 0xF8:
+                # Real time bytes must not disturb a partial message
+                self._emit(byte, 1)
+            elif self._in_sysex and (byte < 0x80 or byte == 0xF7):
+                for table, buf in zip(tables, bufs):
+                    if table[0xF0]:
+                        buf.append(byte)
+                if byte == 0xF7:
+                    self._in_sysex = False
+            elif byte & 0x80:
+                self._in_sysex = False
+                self._count = 0
+                length = MESSAGE_LENGTH[byte]
+                if byte < 0xF0:
+                    self._running_status = byte
+                else:
+                    # System Common messages cancel running status
+                    self._running_status = 0
+                if byte == 0xF7:
+                    # End of a SysEx which was not started
+                    self._expected = 0
+                elif byte == 0xF0:
+                    self._in_sysex = True
+                    self._expected = 0
+                    self._emit(byte, 1)
+                elif length == 1:
+                    self._expected = 0
+                    self._emit(byte, 1)
+                else:
+                    self._expected = length
+                    msg[0] = byte
+                    self._count = 1
+            elif self._expected:
+                if self._count == 0:
+                    if not self._running_status:
+                        continue
+                    msg[0] = self._running_status
+                    self._count = 1
+                msg[self._count] = byte
+                self._count += 1
+                if self._count == self._expected:
+                    self._emit(msg[0], self._count)
+                    self._count = 0
+                    if not self._running_status:
+                        self._expected = 0
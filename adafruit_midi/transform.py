@@ -0,0 +1,278 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_midi.transform`
+================================================================================
+
+Lookup table driven message transformation: filtering, transposition,
+keyboard splits, channel remapping and velocity curves.
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+The rules are compiled into 128 and 256 entry tables which are applied in a
+fixed order: status filter, transposition (by input channel), keyboard split
+(by input channel on the transposed note), channel remap and finally the
+velocity curve (by output channel). Tables are only allocated for channels
+which use them. Changing rules while notes are held can leave them stuck.
+
+"""
+
+try:
+    from typing import Callable, Optional, Sequence, Union
+except ImportError:
+    pass
+
+from .midi_message import MIDIMessage
+from .thru import MESSAGE_LENGTH
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MIDI.git"
+
+# Note table entry for a note which is dropped, e.g. transposed out of range
+_DROP = 0xFF
+
+
+class Transform:
+    """A compiled set of transformation rules.
+
+    The rule methods return the object so they can be chained, e.g.
+    ``Transform().transpose(12, channel=0).split(60, 0, 1, channel=0)``.
+    """
+
+    def __init__(self) -> None:
+        self._status = bytearray(range(256))
+        self._notes = [None] * 16
+        self._semitones = [0] * 16
+        self._split = [None] * 16
+        self._channel = bytearray(range(16))
+        self._velocity = [None] * 16
+        # The parser state of apply() between calls
+        self._msg = bytearray(3)
+        self._count = 0
+        self._expected = 0
+        self._running_status = 0
+        self._in_sysex = False
+
+    @staticmethod
+    def _channels(channel: Optional[int]) -> range:
+        return range(16) if channel is None else range(channel, channel + 1)
+
+    def drop(self, message: Union[type, int], *, channel: Optional[int] = None) -> "Transform":
+        """Drop a type of message.
+
+        :param message: A :class:`~adafruit_midi.midi_message.MIDIMessage` subclass
+            or a status value like 0x90.
+        :param int channel: The input channel or None for all, default None.
+        """
+        status = message if isinstance(message, int) else message._STATUS
+        if status >= 0xF0:
+            self._status[status] = 0
+        else:
+            for chan in self._channels(channel):
+                self._status[status & 0xF0 | chan] = 0
+        return self
+
+    def transpose(self, semitones: int, *, channel: Optional[int] = None) -> "Transform":
+        """Transpose notes, this adds to any earlier transposition and notes
+        moved outside 0-127 are dropped.
+
+        :param int channel: The input channel or None for all, default None.
+        """
+        for chan in self._channels(channel):
+            # The table is rebuilt from the total so a note dropped by one
+            # transposition comes back if a later one moves it into range
+            total = self._semitones[chan] = self._semitones[chan] + semitones
+            if not total:
+                self._notes[chan] = None
+                continue
+            notes = self._notes[chan]
+            if notes is None:
+                notes = self._notes[chan] = bytearray(128)
+            for idx in range(128):
+                note = idx + total
+                notes[idx] = note if 0 <= note <= 127 else _DROP
+        return self
+
+    def split(
+        self,
+        split_note: int,
+        low_channel: int,
+        high_channel: int,
+        *,
+        channel: Optional[int] = None,
+    ) -> "Transform":
+        """Send notes below ``split_note`` to ``low_channel`` and the rest to
+        ``high_channel``. This applies to Note On, Note Off and Polyphonic Key Pressure.
+
+        :param int channel: The input channel or None for all, default None.
+        """
+        for chan in self._channels(channel):
+            self._split[chan] = bytearray(
+                low_channel if note < split_note else high_channel for note in range(128)
+            )
+        return self
+
+    def remap_channel(self, channel: int, new_channel: int) -> "Transform":
+        """Send messages on ``channel``, after any split, on ``new_channel``."""
+        if not 0 <= channel <= 15 or not 0 <= new_channel <= 15:
+            raise ValueError("Channel must be 0-15")
+        self._channel[channel] = new_channel
+        return self
+
+    def velocity_curve(
+        self,
+        curve: Union[Sequence[int], Callable[[int], int]],
+        *,
+        channel: Optional[int] = None,
+    ) -> "Transform":
+        """Apply a velocity curve to Note On messages, this is combined with any
+        existing curve. A velocity of 0 is always kept as 0 and other
+        velocities are kept within 1-127 so Note Ons stay Note Ons.
+
+        :param curve: A function or a sequence of 128 values mapping velocity
+            to new velocity.
+        :param int channel: The output channel or None for all, default None.
+        """
+        if callable(curve):
+            curve = [curve(velocity) for velocity in range(128)]
+        elif len(curve) != 128:
+            raise ValueError("Curve must have 128 values")
+        for chan in self._channels(channel):
+            table = self._velocity[chan]
+            if table is None:
+                table = self._velocity[chan] = bytearray(range(128))
+            for idx in range(1, 128):
+                table[idx] = min(max(int(curve[table[idx]]), 1), 127)
+        return self
+
+    def apply(self, data: bytes, out: Optional[bytearray] = None) -> bytearray:
+        """Transform MIDI bytes.
+
+        Data can be passed as it is read from a port, a message which is split
+        over calls is kept until it is complete.
+
+        :param data: MIDI bytes, running status is expanded.
+        :param bytearray out: An optional bytearray to append the result to.
+        :returns bytearray: The transformed bytes.
+        """
+        if out is None:
+            out = bytearray()
+        status_table = self._status
+        msg = self._msg
+        for byte in data:
+            if byte >= 0xF8:
+                # Real time bytes can be anywhere, even in the middle of a message
+                if status_table[byte]:
+                    out.append(byte)
+            elif self._in_sysex and (byte < 0x80 or byte == 0xF7):
+                # SysEx is only filtered, it is copied as is
+                if status_table[0xF0]:
+                    out.append(byte)
+                if byte == 0xF7:
+                    self._in_sysex = False
+            elif byte & 0x80:
+                self._in_sysex = False
+                self._count = 0
+                length = MESSAGE_LENGTH[byte]
+                # System Common messages cancel running status
+                self._running_status = byte if byte < 0xF0 else 0
+                self._expected = 0
+                if byte == 0xF0:
+                    self._in_sysex = True
+                    if status_table[byte]:
+                        out.append(byte)
+                elif length == 1:
+                    if status_table[byte]:
+                        out.append(byte)
+                elif length:
+                    self._expected = length
+                    msg[0] = byte
+                    self._count = 1
+            elif self._expected:
+                if self._count == 0:
+                    msg[0] = self._running_status
+                    self._count = 1
+                msg[self._count] = byte
+                self._count += 1
+                if self._count == self._expected:
+                    self._emit(msg, out)
+                    self._count = 0
+                    if not self._running_status:
+                        self._expected = 0
+        return out
+
+    def _emit(self, msg: bytearray, out: bytearray) -> None:
+        status = msg[0]
+        if not self._status[status]:
+            return
+        length = self._expected
+        if status >= 0xF0:
+            out.extend(msg[:length])
+        else:
+            self._apply_channel(status, msg[1], msg[2] if length > 2 else 0, out)
+
+    def _apply_channel(self, status: int, data1: int, data2: int, out: bytearray) -> None:
+        command = status & 0xF0
+        channel = status & 0x0F
+        if command < 0xB0:
+            notes = self._notes[channel]
+            if notes is not None:
+                data1 = notes[data1]
+                if data1 == _DROP:
+                    return
+            split = self._split[channel]
+            if split is not None:
+                channel = split[data1]
+        channel = self._channel[channel]
+        if command == 0x90:
+            velocity = self._velocity[channel]
+            if velocity is not None:
+                data2 = velocity[data2]
+        out.append(command | channel)
+        out.append(data1)
+        if MESSAGE_LENGTH[status] == 3:
+            out.append(data2)
+
+    def apply_message(self, msg: MIDIMessage) -> Optional[MIDIMessage]:
+        """Transform a received message object in place.
+
+        As :meth:`adafruit_midi.MIDI.send` sets the channel the result should
+        be sent with ``midi.send(msg, channel=msg.channel)``.
+
+        :returns: The message or None if it was dropped.
+        """
+        status = msg._STATUS
+        if status is None:
+            return msg
+        if status < 0xF0:
+            status |= msg.channel
+        if not self._status[status]:
+            return None
+        if status >= 0xF0:
+            return msg
+        command = status & 0xF0
+        channel = msg.channel
+        if command < 0xB0:
+            note = msg.note
+            notes = self._notes[channel]
+            if notes is not None:
+                note = notes[note]
+                if note == _DROP:
+                    return None
+                msg.note = note
+            split = self._split[channel]
+            if split is not None:
+                channel = split[note]
+        channel = self._channel[channel]
+        if command == 0x90:
+            velocity = self._velocity[channel]
+            if velocity is not None:
+                msg.velocity = velocity[msg.velocity]
+        msg.channel = channel
+        return msg
@@ -0,0 +1,367 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_midi.ump`
+================================================================================
+
+MIDI 2.0 Universal MIDI Packet (UMP) encoder and decoder.
+
+:class:`UmpEncoder` converts a MIDI 1.0 byte stream into UMP words, either as
+MIDI 2.0 Channel Voice messages (64 bit, message type 0x4) with the values
+upscaled to 16 bit velocity and 32 bit controllers or as MIDI 1.0 Channel Voice
+messages in UMP (32 bit, message type 0x2). :class:`UmpDecoder` does the reverse.
+Words are held in ``array("I")`` buffers.
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+Based upon the Universal MIDI Packet (UMP) Format and MIDI 2.0 Protocol
+Specification (M2-104-UM). Controller numbers are translated one to one,
+Bank Select and (N)RPN Control Changes from MIDI 1.0 are not folded into
+their MIDI 2.0 equivalents.
+
+"""
+
+from array import array
+
+try:
+    from typing import Optional
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MIDI.git"
+
+MT_UTILITY = 0x0
+MT_SYSTEM = 0x1
+MT_MIDI1_CHANNEL_VOICE = 0x2
+MT_DATA_64 = 0x3
+MT_MIDI2_CHANNEL_VOICE = 0x4
+MT_DATA_128 = 0x5
+
+# Packet size in 32 bit words for each message type
+WORDS_PER_PACKET = b"\x01\x01\x01\x02\x02\x04\x01\x01\x02\x02\x02\x03\x03\x04\x04\x04"
+
+# SysEx7 status values in the 64 bit data message
+_SYSEX_COMPLETE = 0x0
+_SYSEX_START = 0x1
+_SYSEX_CONTINUE = 0x2
+_SYSEX_END = 0x3
+
+# Length including status for System Common messages indexed by status & 0x07
+_SYSTEM_LENGTH = b"\x00\x02\x03\x02\x01\x01\x01\x00"
+
+# MIDI 2.0 Registered and Assignable (NRPN) Controller statuses
+_RPN = 0x20
+_NRPN = 0x30
+
+
+def scale_up(value: int, src_bits: int, dst_bits: int) -> int:
+    """Upscale ``value`` using the specification's Min-Center-Max algorithm,
+    0 stays at 0, the center value maps to the center and the maximum to the maximum.
+    """
+    scale_bits = dst_bits - src_bits
+    scaled = value << scale_bits
+    if value <= 1 << (src_bits - 1):
+        return scaled
+    repeat_bits = src_bits - 1
+    repeat = value & ((1 << repeat_bits) - 1)
+    if scale_bits > repeat_bits:
+        repeat <<= scale_bits - repeat_bits
+    else:
+        repeat >>= repeat_bits - scale_bits
+    while repeat:
+        scaled |= repeat
+        repeat >>= repeat_bits
+    return scaled
+
+
+def scale_down(value: int, src_bits: int, dst_bits: int) -> int:
+    """Downscale ``value`` by discarding the least significant bits."""
+    return value >> (src_bits - dst_bits)
+
+
+# Precomputed 7 bit upscaling for the per-event hot path
+_VELOCITY_7_TO_16 = array("H", [scale_up(v, 7, 16) for v in range(128)])
+_VALUE_7_TO_32 = array("I", [scale_up(v, 7, 32) for v in range(128)])
+
+
+class UmpEncoder:
+    """Converts a MIDI 1.0 byte stream into Universal MIDI Packet words.
+
+    Messages may be split over several calls to :meth:`encode`, running status
+    is expanded and System Real Time bytes are sent immediately even in the
+    middle of another message. SysEx is sent as 64 bit SysEx7 data messages.
+
+    :param int group: The UMP group, 0-15, default 0.
+    :param bool midi2: Encode Channel Voice messages using the MIDI 2.0 protocol,
+        default True. If False the MIDI 1.0 Channel Voice message type is used.
+    """
+
+    def __init__(self, group: int = 0, *, midi2: bool = True) -> None:
+        if not 0 <= group <= 15:
+            raise ValueError("Group must be 0-15")
+        self.group = group
+        self.midi2 = midi2
+        self._msg = bytearray(3)
+        self._count = 0
+        self._expected = 0
+        self._running_status = 0
+        self._in_sysex = False
+        self._sysex = bytearray(6)
+        self._sysex_count = 0
+        self._sysex_started = False
+
+    def reset(self) -> None:
+        """Discard any partial message and running status."""
+        self._count = 0
+        self._expected = 0
+        self._running_status = 0
+        self._in_sysex = False
+
+    def encode(self, data: bytes, out: Optional[array] = None) -> array:
+        """Encode MIDI 1.0 bytes as UMP words.
+
+        :param data: The MIDI bytes.
+        :param array out: An optional ``array("I")`` to append the words to.
+        :returns array: The words.
+        """
+        if out is None:
+            out = array("I")
+        msg = self._msg
+        for byte in data:
+            if byte >= 0xF8:
+                out.append(MT_SYSTEM << 28 | self.group << 24 | byte << 16)
+            elif byte == 0xF7:
+                if self._in_sysex:
+                    self._sysex_packet(out, True)
+                    self._in_sysex = False
+            elif byte == 0xF0:
+                self._running_status = 0
+                self._expected = 0
+                self._in_sysex = True
+                self._sysex_count = 0
+                self._sysex_started = False
+            elif byte & 0x80:
+                self._in_sysex = False
+                msg[0] = byte
+                self._count = 1
+                if byte < 0xF0:
+                    self._running_status = byte
+                    self._expected = 2 if 0xC0 <= byte < 0xE0 else 3
+                else:
+                    # System Common messages cancel running status
+                    self._running_status = 0
+                    self._expected = _SYSTEM_LENGTH[byte & 0x07]
+                    if self._expected == 1:
+                        self._encode_message(out)
+                        self._expected = 0
+            elif self._in_sysex:
+                if self._sysex_count == 6:
+                    self._sysex_packet(out, False)
+                self._sysex[self._sysex_count] = byte
+                self._sysex_count += 1
+            elif self._expected:
+                if self._count == 0:
+                    if not self._running_status:
+                        continue
+                    msg[0] = self._running_status
+                    self._count = 1
+                msg[self._count] = byte
+                self._count += 1
+                if self._count == self._expected:
+                    self._encode_message(out)
+                    if not self._running_status:
+                        self._expected = 0
+        return out
+
+    def encode_message(self, msg, out: Optional[array] = None) -> array:
+        """Encode a :class:`~adafruit_midi.midi_message.MIDIMessage` as UMP words.
+
+        :param array out: An optional ``array("I")`` to append the words to.
+        """
+        return self.encode(msg.__bytes__(), out)
+
+    def _sysex_packet(self, out: array, last: bool) -> None:
+        if last:
+            status = _SYSEX_END if self._sysex_started else _SYSEX_COMPLETE
+        else:
+            status = _SYSEX_CONTINUE if self._sysex_started else _SYSEX_START
+        count = self._sysex_count
+        sysex = self._sysex
+        for idx in range(count, 6):
+            sysex[idx] = 0
+        out.append(
+            MT_DATA_64 << 28
+            | self.group << 24
+            | status << 20
+            | count << 16
+            | sysex[0] << 8
+            | sysex[1]
+        )
+        out.append(sysex[2] << 24 | sysex[3] << 16 | sysex[4] << 8 | sysex[5])
+        self._sysex_count = 0
+        self._sysex_started = True
+
+    def _encode_message(self, out: array) -> None:
+        msg = self._msg
+        status = msg[0]
+        count = self._count
+        self._count = 0
+        data1 = msg[1] if count > 1 else 0
+        data2 = msg[2] if count > 2 else 0
+        if status >= 0xF0 or not self.midi2:
+            mtype = MT_SYSTEM if status >= 0xF0 else MT_MIDI1_CHANNEL_VOICE
+            out.append(mtype << 28 | self.group << 24 | status << 16 | data1 << 8 | data2)
+            return
+
+        command = status & 0xF0
+        index = 0
+        if command == 0x90 and data2 == 0:
+            # MIDI 1.0 Note On with velocity 0 is a Note Off
+            status &= 0x8F
+            index = data1 << 8
+            data = 0
+        elif command in {0x80, 0x90}:
+            index = data1 << 8
+            data = _VELOCITY_7_TO_16[data2] << 16
+        elif command in {0xA0, 0xB0}:
+            index = data1 << 8
+            data = _VALUE_7_TO_32[data2]
+        elif command == 0xC0:
+            data = data1 << 24
+        elif command == 0xD0:
+            data = _VALUE_7_TO_32[data1]
+        else:
+            data = scale_up(data2 << 7 | data1, 14, 32)
+        out.append(MT_MIDI2_CHANNEL_VOICE << 28 | self.group << 24 | status << 16 | index)
+        out.append(data)
+
+
+class UmpDecoder:
+    """Converts Universal MIDI Packet words into a MIDI 1.0 byte stream.
+
+    MIDI 2.0 Channel Voice values are downscaled, a Program Change with the
+    bank valid flag set produces Bank Select Control Changes first and
+    (N)RPN controllers produce the MIDI 1.0 Control Change sequence.
+    Message types which have no MIDI 1.0 equivalent are skipped.
+
+    :param group: The UMP group to accept, 0-15, or None for all groups, default None.
+    """
+
+    def __init__(self, group: Optional[int] = None) -> None:
+        if group is not None and not 0 <= group <= 15:
+            raise ValueError("Group must be 0-15 or None")
+        self.group = group
+
+    def decode(self, words: array, out: Optional[bytearray] = None) -> bytearray:
+        """Decode UMP words to MIDI 1.0 bytes.
+
+        :param array words: The words, a trailing partial packet is ignored.
+        :param bytearray out: An optional bytearray to append the MIDI bytes to.
+        :returns bytearray: The MIDI bytes.
+        """
+        if out is None:
+            out = bytearray()
+        group = self.group
+        idx = 0
+        end = len(words)
+        while idx < end:
+            word = words[idx]
+            mtype = word >> 28
+            size = WORDS_PER_PACKET[mtype]
+            if idx + size > end:
+                break
+            if group is None or (word >> 24) & 0x0F == group:
+                if mtype in {MT_SYSTEM, MT_MIDI1_CHANNEL_VOICE}:
+                    self._decode_32(word, out)
+                elif mtype == MT_DATA_64:
+                    self._decode_sysex(word, words[idx + 1], out)
+                elif mtype == MT_MIDI2_CHANNEL_VOICE:
+                    self._decode_midi2(word, words[idx + 1], out)
+            idx += size
+        return out
+
+    @staticmethod
+    def _decode_32(word: int, out: bytearray) -> None:
+        status = (word >> 16) & 0xFF
+        if status < 0xF0:
+            length = 2 if 0xC0 <= status < 0xE0 else 3
+        elif status < 0xF8:
+            length = _SYSTEM_LENGTH[status & 0x07]
+        else:
+            length = 1
+        out.append(status)
+        if length > 1:
+            out.append((word >> 8) & 0x7F)
+            if length > 2:
+                out.append(word & 0x7F)
+
+    @staticmethod
+    def _decode_sysex(word0: int, word1: int, out: bytearray) -> None:
+        status = (word0 >> 20) & 0x0F
+        count = min((word0 >> 16) & 0x0F, 6)
+        if status in {_SYSEX_COMPLETE, _SYSEX_START}:
+            out.append(0xF0)
+        for idx in range(count):
+            if idx < 2:
+                out.append((word0 >> (8 - 8 * idx)) & 0x7F)
+            else:
+                out.append((word1 >> (40 - 8 * idx)) & 0x7F)
+        if status in {_SYSEX_COMPLETE, _SYSEX_END}:
+            out.append(0xF7)
+
+    @staticmethod
+    def _decode_midi2(word0: int, data: int, out: bytearray) -> None:
+        status = (word0 >> 16) & 0xFF
+        command = status & 0xF0
+        channel = status & 0x0F
+        index1 = (word0 >> 8) & 0x7F
+        index2 = word0 & 0x7F
+        if command in {0x80, 0x90}:
+            velocity = data >> 25
+            if command == 0x90 and velocity == 0:
+                # A MIDI 1.0 Note On with velocity 0 would be a Note Off
+                velocity = 1
+            out.extend(bytes([status, index1, velocity]))
+        elif command in {0xA0, 0xB0}:
+            out.extend(bytes([status, index1, data >> 25]))
+        elif command == 0xC0:
+            if word0 & 0x01:
+                # The bank is in the data word after the program
+                bank_msb = (data >> 8) & 0x7F
+                bank_lsb = data & 0x7F
+                out.extend(bytes([0xB0 | channel, 0, bank_msb, 0xB0 | channel, 32, bank_lsb]))
+            out.extend(bytes([status, (data >> 24) & 0x7F]))
+        elif command == 0xD0:
+            out.extend(bytes([status, data >> 25]))
+        elif command == 0xE0:
+            value = data >> 18
+            out.extend(bytes([status, value & 0x7F, value >> 7]))
+        elif command in {_RPN, _NRPN}:
+            value = data >> 18
+            cc_status = 0xB0 | channel
+            select = 101 if command == _RPN else 99
+            out.extend(
+                bytes(
+                    [
+                        cc_status,
+                        select,
+                        index1,
+                        cc_status,
+                        select - 1,
+                        index2,
+                        cc_status,
+                        6,
+                        value >> 7,
+                        cc_status,
+                        38,
+                        value & 0x7F,
+                    ]
+                )
+            )
@@ -0,0 +1,251 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_midi.usb_midi_packet`
+================================================================================
+
+USB-MIDI 1.0 event packet encoder and decoder.
+
+USB-MIDI carries MIDI in 4 byte event packets, a header byte holding the
+cable number (high nibble) and the Code Index Number (CIN, low nibble)
+followed by 3 bytes of MIDI data padded with zeros.
+:class:`UsbMidiPacketPort` wraps ports which speak packets so they can be
+used as ``midi_in`` and ``midi_out`` for :class:`adafruit_midi.MIDI`.
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+Based upon the Universal Serial Bus Device Class Definition for MIDI Devices 1.0
+
+"""
+
+try:
+    from typing import BinaryIO, Optional
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MIDI.git"
+
+# Number of MIDI bytes in a packet for each CIN, 0 is for the reserved CINs
+CIN_LENGTH = b"\x00\x00\x02\x03\x03\x01\x02\x03\x03\x03\x03\x03\x02\x02\x03\x01"
+
+CIN_SYSEX = 0x4
+"""SysEx starts or continues"""
+CIN_SYSEX_END_1 = 0x5
+"""Single-byte System Common or SysEx ends with the following single byte"""
+CIN_SINGLE_BYTE = 0xF
+"""Single byte, used for System Real Time messages"""
+
+# Length including status and CIN for System Common messages indexed by status & 0x07
+_SYSTEM_LENGTH = b"\x00\x02\x03\x02\x01\x01\x01\x00"
+_SYSTEM_CIN = b"\x00\x02\x03\x02\x05\x05\x05\x00"
+
+
+class UsbMidiPacketEncoder:
+    """Converts a MIDI byte stream into USB-MIDI event packets.
+
+    Messages may be split over several calls to :meth:`encode`, the partial
+    message is kept until it is complete. Running status is expanded and
+    System Real Time bytes are sent immediately even in the middle of
+    another message.
+
+    :param int cable: The virtual cable number, 0-15, default 0.
+    """
+
+    def __init__(self, cable: int = 0) -> None:
+        if not 0 <= cable <= 15:
+            raise ValueError("Cable must be 0-15")
+        self._header = cable << 4
+        self._msg = bytearray(3)
+        self._count = 0
+        self._expected = 0
+        self._cin = 0
+        self._running_status = 0
+        self._in_sysex = False
+
+    def reset(self) -> None:
+        """Discard any partial message and running status."""
+        self._count = 0
+        self._expected = 0
+        self._running_status = 0
+        self._in_sysex = False
+
+    def _emit(self, out: bytearray, cin: int, count: int) -> None:
+        msg = self._msg
+        out.append(self._header | cin)
+        out.append(msg[0])
+        out.append(msg[1] if count > 1 else 0)
+        out.append(msg[2] if count > 2 else 0)
+        self._count = 0
+
+    def encode(self, data: bytes, out: Optional[bytearray] = None) -> bytearray:
+        """Encode MIDI bytes as packets.
+
+        :param data: The MIDI bytes.
+        :param bytearray out: An optional bytearray to append the packets to.
+        :returns bytearray: The packets, always a multiple of 4 bytes.
+        """
+        if out is None:
+            out = bytearray()
+        msg = self._msg
+        for byte in data:
+            if byte >= 0xF8:
+                # Real time bytes can appear anywhere and use their own packet
+                out.append(self._header | CIN_SINGLE_BYTE)
+                out.append(byte)
+                out.append(0)
+                out.append(0)
+            elif byte == 0xF7:
+                if self._in_sysex:
+                    msg[self._count] = byte
+                    self._emit(out, CIN_SYSEX_END_1 + self._count, self._count + 1)
+                    self._in_sysex = False
+            elif byte == 0xF0:
+                self._running_status = 0
+                self._expected = 0
+                self._in_sysex = True
+                msg[0] = byte
+                self._count = 1
+            elif byte & 0x80:
+                self._in_sysex = False
+                msg[0] = byte
+                self._count = 1
+                if byte < 0xF0:
+                    self._running_status = byte
+                    self._expected = 2 if 0xC0 <= byte < 0xE0 else 3
+                    self._cin = byte >> 4
+                else:
+                    # System Common messages cancel running status
+                    self._running_status = 0
+                    self._expected = _SYSTEM_LENGTH[byte & 0x07]
+                    self._cin = _SYSTEM_CIN[byte & 0x07]
+                    if self._expected == 1:
+                        self._emit(out, self._cin, 1)
+                        self._expected = 0
+            elif self._in_sysex:
+                msg[self._count] = byte
+                self._count += 1
+                if self._count == 3:
+                    self._emit(out, CIN_SYSEX, 3)
+            elif self._expected:
+                if self._count == 0:
+                    if not self._running_status:
+                        continue
+                    msg[0] = self._running_status
+                    self._count = 1
+                msg[self._count] = byte
+                self._count += 1
+                if self._count == self._expected:
+                    self._emit(out, self._cin, self._count)
+                    if not self._running_status:
+                        self._expected = 0
+        return out
+
+    def encode_message(self, msg, out: Optional[bytearray] = None) -> bytearray:
+        """Encode a :class:`~adafruit_midi.midi_message.MIDIMessage` as packets.
+
+        :param bytearray out: An optional bytearray to append the packets to.
+        """
+        return self.encode(msg.__bytes__(), out)
+
+
+class UsbMidiPacketDecoder:
+    """Converts USB-MIDI event packets into a MIDI byte stream.
+
+    A trailing partial packet is kept until the rest of it arrives.
+
+    :param cable: The virtual cable number to accept, 0-15, or None for all cables,
+        default None.
+    """
+
+    def __init__(self, cable: Optional[int] = None) -> None:
+        if cable is not None and not 0 <= cable <= 15:
+            raise ValueError("Cable must be 0-15 or None")
+        self.cable = cable
+        self._partial = bytearray()
+
+    def reset(self) -> None:
+        """Discard any partial packet."""
+        self._partial = bytearray()
+
+    def decode(self, packets: bytes, out: Optional[bytearray] = None) -> bytearray:
+        """Decode packets to MIDI bytes.
+
+        :param packets: The packet bytes, these need not be a multiple of 4.
+        :param bytearray out: An optional bytearray to append the MIDI bytes to.
+        :returns bytearray: The MIDI bytes.
+        """
+        if out is None:
+            out = bytearray()
+        if self._partial:
+            self._partial.extend(packets)
+            packets = self._partial
+            self._partial = bytearray()
+        cable = self.cable
+        end = len(packets) - len(packets) % 4
+        for idx in range(0, end, 4):
+            header = packets[idx]
+            if cable is not None and header >> 4 != cable:
+                continue
+            length = CIN_LENGTH[header & 0x0F]
+            if length:
+                out.append(packets[idx + 1])
+                if length > 1:
+                    out.append(packets[idx + 2])
+                    if length > 2:
+                        out.append(packets[idx + 3])
+        if end != len(packets):
+            self._partial.extend(packets[end:])
+        return out
+
+
+class UsbMidiPacketPort:
+    """An adapter which makes ports carrying USB-MIDI event packets usable as
+    ``midi_in`` and ``midi_out`` for :class:`adafruit_midi.MIDI`.
+
+    :param packets_in: an object which implements ``read(length)`` returning
+        packet bytes, default None.
+    :param packets_out: an object which implements ``write(buffer, length)``
+        accepting packet bytes, default None.
+    :param int cable: The virtual cable number used for output, default 0.
+    :param in_cable: The virtual cable number accepted on input or None for all,
+        default None.
+    """
+
+    def __init__(
+        self,
+        packets_in: Optional[BinaryIO] = None,
+        packets_out: Optional[BinaryIO] = None,
+        *,
+        cable: int = 0,
+        in_cable: Optional[int] = None,
+    ) -> None:
+        self._packets_in = packets_in
+        self._packets_out = packets_out
+        self._encoder = UsbMidiPacketEncoder(cable)
+        self._decoder = UsbMidiPacketDecoder(in_cable)
+        self._in_buf = bytearray()
+
+    def read(self, length: int) -> bytes:
+        """Read up to ``length`` MIDI bytes decoded from the packet input."""
+        if len(self._in_buf) < length:
+            # Each packet carries at most 3 MIDI bytes
+            wanted = (length - len(self._in_buf) + 2) // 3 * 4
+            packets = self._packets_in.read(wanted)
+            if packets:
+                self._decoder.decode(packets, self._in_buf)
+        data = bytes(self._in_buf[:length])
+        self._in_buf = self._in_buf[length:]
+        return data
+
+    def write(self, buf: bytes, length: int) -> None:
+        """Write the first ``length`` MIDI bytes of ``buf`` as packets."""
+        packets = self._encoder.encode(buf[:length] if length != len(buf) else buf)
+        if packets:
+            self._packets_out.write(packets, len(packets))
@@ -0,0 +1,308 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Host side performance benchmarks for adafruit_midi.
+
+Measures messages per second and memory allocated for parsing, encoding,
+sending and receiving using in memory ports like the unit tests do.
+This needs CPython, the results are written as JSON so they can be
+compared between releases, e.g.
+
+    python benchmarks/midi_benchmark.py --output results.json
+    python benchmarks/midi_benchmark.py --quick
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+# Benchmark the source tree rather than any installed copy
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import adafruit_midi
+from adafruit_midi.channel_pressure import ChannelPressure
+from adafruit_midi.control_change import ControlChange
+from adafruit_midi.midi_message import MIDIMessage
+from adafruit_midi.note_off import NoteOff
+from adafruit_midi.note_on import NoteOn
+from adafruit_midi.pitch_bend import PitchBend
+from adafruit_midi.polyphonic_key_pressure import PolyphonicKeyPressure
+from adafruit_midi.program_change import ProgramChange
+from adafruit_midi.system_exclusive import SystemExclusive
+from adafruit_midi.timing_clock import TimingClock
+
+ALL_CHANNELS = tuple(range(16))
+
+MESSAGES = {
+    "NoteOn": NoteOn(60, 100),
+    "NoteOff": NoteOff(60, 0),
+    "ControlChange": ControlChange(7, 100),
+    "PitchBend": PitchBend(8192),
+    "ChannelPressure": ChannelPressure(64),
+    "PolyphonicKeyPressure": PolyphonicKeyPressure(60, 64),
+    "ProgramChange": ProgramChange(5),
+    "TimingClock": TimingClock(),
+}
+
+SYSEX_SIZES = (16, 256, 4096)
+IN_BUF_SIZES = (3, 30, 64, 256)
+READ_SIZES = (1, 3, 16, 64)
+
+
+class SinkPort:
+    """An output port which discards what is written."""
+
+    def write(self, buffer, length):
+        pass
+
+
+class ChunkedPort:
+    """An input port which returns ``data`` at most ``chunk`` bytes at a time."""
+
+    def __init__(self, data, chunk):
+        self.data = bytes(data)
+        self.chunk = chunk
+        self.pos = 0
+
+    def rewind(self):
+        self.pos = 0
+
+    def read(self, length):
+        start = self.pos
+        self.pos = min(start + min(length, self.chunk), len(self.data))
+        return self.data[start : self.pos]
+
+
+def measure(func, iterations, repeat):
+    """Return the best time in seconds for ``iterations`` calls of ``func``,
+    and the peak and retained bytes allocated by one more run of them."""
+    func()  # warm up any caches and lazy imports
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+    for _ in range(iterations):
+        func()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak - base, current - base
+
+
+def result(name, group, seconds, peak, retained, messages, nbytes):
+    return {
+        "name": name,
+        "group": group,
+        "seconds": seconds,
+        "messages": messages,
+        "messages_per_second": messages / seconds if seconds else None,
+        "bytes_per_second": nbytes / seconds if seconds else None,
+        "peak_alloc_bytes": peak,
+        "retained_bytes": retained,
+    }
+
+
+def bench_parse(iterations, repeat):
+    results = []
+    for name, msg in MESSAGES.items():
+        msg.channel = 0
+        data = msg.__bytes__()
+        seconds, peak, retained = measure(
+            lambda data=data: MIDIMessage.from_message_bytes(data, ALL_CHANNELS),
+            iterations,
+            repeat,
+        )
+        results.append(
+            result(
+                name,
+                "from_message_bytes",
+                seconds,
+                peak,
+                retained,
+                iterations,
+                iterations * len(data),
+            )
+        )
+    return results
+
+
+def bench_encode(iterations, repeat):
+    results = []
+    midi = adafruit_midi.MIDI(midi_out=SinkPort())
+    for name, msg in MESSAGES.items():
+        msg.channel = 0
+        length = len(msg.__bytes__())
+        seconds, peak, retained = measure(msg.__bytes__, iterations, repeat)
+        results.append(
+            result(name, "__bytes__", seconds, peak, retained, iterations, iterations * length)
+        )
+        seconds, peak, retained = measure(lambda msg=msg: midi.send(msg), iterations, repeat)
+        results.append(
+            result(name, "send", seconds, peak, retained, iterations, iterations * length)
+        )
+    return results
+
+
+def bench_batch(iterations, repeat):
+    """Compare encoding a chord one message at a time with encode_many."""
+    notes = (48, 52, 55, 60, 64, 67)
+    velocities = (100,) * len(notes)
+    chord_bytes = len(notes) * 3
+
+    def per_message():
+        data = bytearray()
+        for note, velocity in zip(notes, velocities):
+            data.extend(NoteOn(note, velocity, channel=0).__bytes__())
+        return data
+
+    results = []
+    for name, func in (
+        ("per_message", per_message),
+        ("encode_many", lambda: NoteOn.encode_many(notes, velocities)),
+        ("many", lambda: NoteOn.many(notes, velocities, channel=0)),
+    ):
+        seconds, peak, retained = measure(func, iterations, repeat)
+        results.append(
+            result(
+                name,
+                "chord",
+                seconds,
+                peak,
+                retained,
+                iterations * len(notes),
+                iterations * chord_bytes,
+            )
+        )
+    return results
+
+
+def stream(count):
+    """A mix of channel messages and clocks like a played keyboard."""
+    data = bytearray()
+    msgs = (NoteOn(60, 100), ControlChange(1, 64), NoteOff(60, 0), PitchBend(9000), TimingClock())
+    for idx in range(count):
+        msg = msgs[idx % len(msgs)]
+        if not isinstance(msg, TimingClock):
+            msg.channel = idx % 16
+        data.extend(msg.__bytes__())
+    return data
+
+
+def receive_all(midi, port, count):
+    port.rewind()
+    received = 0
+    # Bound the loop in case a configuration cannot parse the stream
+    for _ in range(len(port.data) * 2 + count):
+        if midi.receive() is not None:
+            received += 1
+            if received == count:
+                break
+    return received
+
+
+def bench_receive(count, repeat):
+    results = []
+    data = stream(count)
+    for in_buf_size in IN_BUF_SIZES:
+        for read_size in READ_SIZES:
+            port = ChunkedPort(data, read_size)
+            midi = adafruit_midi.MIDI(midi_in=port, in_buf_size=in_buf_size)
+            received = receive_all(midi, port, count)
+            seconds, peak, retained = measure(lambda: receive_all(midi, port, count), 1, repeat)
+            results.append(
+                result(
+                    f"in_buf_size={in_buf_size},read_size={read_size}",
+                    "receive",
+                    seconds,
+                    peak,
+                    retained,
+                    received,
+                    len(data),
+                )
+            )
+    return results
+
+
+def bench_sysex(iterations, repeat):
+    results = []
+    midi_out = adafruit_midi.MIDI(midi_out=SinkPort())
+    for size in SYSEX_SIZES:
+        msg = SystemExclusive([0x7D], bytes(idx & 0x7F for idx in range(size)))
+        data = msg.__bytes__()
+        seconds, peak, retained = measure(lambda msg=msg: midi_out.send(msg), iterations, repeat)
+        results.append(
+            result(
+                f"size={size}",
+                "sysex_send",
+                seconds,
+                peak,
+                retained,
+                iterations,
+                iterations * len(data),
+            )
+        )
+        port = ChunkedPort(data, 64)
+        midi_in = adafruit_midi.MIDI(midi_in=port, in_buf_size=len(data) + 64)
+        seconds, peak, retained = measure(
+            lambda midi_in=midi_in, port=port: receive_all(midi_in, port, 1), iterations, repeat
+        )
+        results.append(
+            result(
+                f"size={size}",
+                "sysex_receive",
+                seconds,
+                peak,
+                retained,
+                iterations,
+                iterations * len(data),
+            )
+        )
+    return results
+
+
+def run(quick=False):
+    """Run every benchmark and return the results as a dict."""
+    iterations = 200 if quick else 5000
+    repeat = 1 if quick else 5
+    results = []
+    results += bench_parse(iterations, repeat)
+    results += bench_encode(iterations, repeat)
+    # A chord takes a few microseconds so more are needed for a stable comparison
+    results += bench_batch(2000 if quick else 20000, repeat)
+    results += bench_receive(100 if quick else 2000, repeat)
+    results += bench_sysex(max(iterations // 50, 2), repeat)
+    return {
+        "version": adafruit_midi.__version__,
+        "python": platform.python_implementation() + " " + platform.python_version(),
+        "platform": platform.platform(),
+        "quick": quick,
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", help="write the JSON results to this file")
+    parser.add_argument("--quick", action="store_true", help="fewer iterations for a smoke test")
+    args = parser.parse_args()
+    report = run(args.quick)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            output.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
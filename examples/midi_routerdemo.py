@@ -0,0 +1,58 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# midi_routerdemo - the midi_inoutdemo chord player using a MIDIRouter
+
+import usb_midi
+
+import adafruit_midi
+from adafruit_midi.midi_message import MIDIUnknownEvent
+from adafruit_midi.note_off import NoteOff
+from adafruit_midi.note_on import NoteOn
+from adafruit_midi.router import MIDIRouter
+
+midi = adafruit_midi.MIDI(
+    midi_in=usb_midi.ports[0],
+    midi_out=usb_midi.ports[1],
+    in_channel=(1, 2, 3),
+    out_channel=0,
+)
+
+major_chord = [0, 4, 7]
+
+
+# Any other known event is forwarded
+def forward(msg):
+    if isinstance(msg, MIDIUnknownEvent):
+        # Message are only known if they are imported
+        print("Unknown MIDI event status ", msg.status)
+    else:
+        midi.send(msg)
+
+
+router = MIDIRouter(midi, default=forward)
+
+
+@router.route(NoteOn)
+def note_on(msg):
+    for offset in major_chord:
+        new_note = msg.note + offset
+        if 0 <= new_note <= 127:
+            if msg.velocity != 0:
+                midi.send(NoteOn(new_note, msg.velocity))
+            else:
+                midi.send(NoteOff(new_note, 0x00))
+
+
+@router.route(NoteOff)
+def note_off(msg):
+    for offset in major_chord:
+        new_note = msg.note + offset
+        if 0 <= new_note <= 127:
+            midi.send(NoteOff(new_note, 0x00))
+
+
+print("Midi Router Demo")
+
+while True:
+    router.poll()
@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: MIT
 
 import os
+import subprocess
 import unittest
 
 verbose = int(os.getenv("TESTVERBOSE", "2"))
@@ -19,8 +20,10 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 import adafruit_midi
 
 # Full monty
+from adafruit_midi.control_change import ControlChange
 from adafruit_midi.note_off import NoteOff
 from adafruit_midi.note_on import NoteOn
+from adafruit_midi.polyphonic_key_pressure import PolyphonicKeyPressure
 from adafruit_midi.system_exclusive import SystemExclusive
 
 
@@ -390,5 +393,71 @@ class Test_MIDIMessage_NoteOff_constructor(unittest.TestCase):
             NoteOff("CC4", 0x7F)
 
 
+class Test_MIDIMessage_batch(unittest.TestCase):
+    def test_encode_many(self):
+        notes = (60, "E4", 67)
+        expected = b"".join(bytes(NoteOn(note, 100, channel=2)) for note in notes)
+        self.assertEqual(NoteOn.encode_many(notes, 100, channel=2), expected)
+        self.assertEqual(
+            ControlChange.encode_many([1, 7], [64, 100], channel=[0, 15]),
+            bytes([0xB0, 1, 64, 0xBF, 7, 100]),
+        )
+        out = bytearray(b"\xf8")
+        self.assertIs(NoteOff.encode_many([60], out=out), out)
+        self.assertEqual(out, bytes([0xF8, 0x80, 60, 0]))
+        self.assertEqual(PolyphonicKeyPressure.encode_many([], []), b"")
+        self.assertEqual(NoteOn.encode_many([60], channel=None), bytes([0x90, 60, 127]))
+
+    def test_many(self):
+        msgs = NoteOn.many(["C4", 64, 67], [10, 20, 30], channel=[0, 1, 2])
+        self.assertEqual([type(msg) for msg in msgs], [NoteOn] * 3)
+        self.assertEqual(
+            [(msg.note, msg.velocity, msg.channel) for msg in msgs],
+            [(60, 10, 0), (64, 20, 1), (67, 30, 2)],
+        )
+        msgs = ControlChange.many([1, 2], 5)
+        self.assertEqual(
+            [(msg.control, msg.value, msg.channel) for msg in msgs], [(1, 5, None), (2, 5, None)]
+        )
+
+    def test_validation(self):
+        with self.assertRaises(ValueError):
+            NoteOn.encode_many([60, 128])
+        with self.assertRaises(ValueError):
+            NoteOn.many([60, 61], [1, -1])
+        with self.assertRaises(ValueError):
+            ControlChange.encode_many([1], [2], channel=16)
+        with self.assertRaises(ValueError):
+            PolyphonicKeyPressure.encode_many([60, 61], [1])
+
+
+class Test_MIDIMessage_lazy_registration(unittest.TestCase):
+    # A fresh interpreter is needed as this process has already imported the messages
+    script = """
+import sys
+sys.path.insert(0, sys.argv[1])
+from adafruit_midi.midi_message import MIDIMessage, MIDIUnknownEvent
+data = bytes([0xE3, 0x00, 0x40, 0xF8, 0xF4])
+msg, end, _ = MIDIMessage.from_message_bytes(data, 3)
+assert isinstance(msg, MIDIUnknownEvent)
+MIDIMessage.enable_lazy_registration()
+assert "adafruit_midi.pitch_bend" not in sys.modules
+msg, end, _ = MIDIMessage.from_message_bytes(data, 3)
+assert type(msg).__name__ == "PitchBend" and msg.pitch_bend == 8192 and end == 3
+msg, end, _ = MIDIMessage.from_message_bytes(data[end:], 3)
+assert type(msg).__name__ == "TimingClock"
+msg, end, _ = MIDIMessage.from_message_bytes(data[4:], 3)
+assert isinstance(msg, MIDIUnknownEvent) and msg.status == 0xF4
+assert "adafruit_midi.note_on" not in sys.modules
+"""
+
+    def test_imports_on_first_use(self):
+        root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+        result = subprocess.run(
+            [sys.executable, "-c", self.script, root], capture_output=True, check=False, text=True
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=verbose)
@@ -0,0 +1,76 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+verbose = int(os.getenv("TESTVERBOSE", "2"))
+
+import sys
+
+# Borrowing the dhalbert/tannewt technique from adafruit/Adafruit_CircuitPython_Motor
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from adafruit_midi.batch import BatchProcessor, find_files, main
+from adafruit_midi.note_on import NoteOn
+from adafruit_midi.smf import SMFWriter
+
+
+def count_notes(path, reader):
+    return sum(1 for _, _, event in reader.timeline() if isinstance(event, NoteOn))
+
+
+class Test_BatchProcessor(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.paths = []
+        for idx in range(12):
+            path = os.path.join(self.tempdir.name, f"song{idx:02}.mid")
+            with open(path, "wb") as file, SMFWriter(file) as writer:
+                for tick in range(idx):
+                    writer.write(tick * 10, NoteOn(60, 100), channel=0)
+            self.paths.append(path)
+        self.bad = os.path.join(self.tempdir.name, "sub", "bad.MID")
+        os.mkdir(os.path.dirname(self.bad))
+        with open(self.bad, "wb") as file:
+            file.write(b"RIFF not a MIDI file")
+        with open(os.path.join(self.tempdir.name, "notes.txt"), "w") as file:
+            file.write("not listed")
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_ordered_results(self):
+        paths = self.paths + [self.bad]
+        for workers in (0, 2):
+            with self.subTest(workers=workers):
+                processor = BatchProcessor(count_notes, workers=workers, ahead=1)
+                results = list(processor.run(paths))
+                self.assertEqual([path for path, _, _ in results], paths)
+                self.assertEqual([result for _, result, _ in results[:-1]], list(range(12)))
+                self.assertIsInstance(results[-1][2], ValueError)
+                stats = processor.stats
+                self.assertEqual((stats.files, stats.errors), (13, 1))
+                self.assertEqual(stats.bytes, sum(os.path.getsize(path) for path in paths))
+                self.assertIn("13 files (1 errors)", str(stats))
+
+    def test_find_files(self):
+        self.assertEqual(list(find_files([self.tempdir.name])), self.paths + [self.bad])
+        self.assertEqual(list(find_files(["missing.mid"])), ["missing.mid"])
+
+    def test_main(self):
+        out = io.StringIO()
+        err = io.StringIO()
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            status = main(["test_batch:count_notes", self.paths[3], "--workers", "0"])
+        self.assertEqual(status, 0)
+        self.assertEqual(out.getvalue(), f"{self.paths[3]}\t3\n")
+        self.assertIn("1 files (0 errors)", err.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=verbose)
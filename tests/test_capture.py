@@ -0,0 +1,152 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import io
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+verbose = int(os.getenv("TESTVERBOSE", "2"))
+
+import sys
+
+# Borrowing the dhalbert/tannewt technique from adafruit/Adafruit_CircuitPython_Motor
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import adafruit_midi
+from adafruit_midi.capture import CapturePort, CaptureReader, CaptureWriter, ReplayPort
+from adafruit_midi.note_on import NoteOn
+from adafruit_midi.system_exclusive import SystemExclusive
+from adafruit_midi.timing_clock import TimingClock
+
+# (seconds, data) as read from a port, a Note On is split over reads
+READS = [(1000.0 + idx * 0.25, bytes((0x90, 60 + idx % 12, 100))) for idx in range(40)]
+READS[10:10] = [(1002.5, b"\xf0\x7d\x01\x02\xf7\x90\x3c"), (1002.5, b"\x64\xf8")]
+
+
+def capture(reads, index_interval=4, close=True):
+    file = io.BytesIO()
+    writer = CaptureWriter(file, buffer_size=32, index_interval=index_interval)
+    for now, data in reads:
+        writer.record(data, now)
+    writer.record(b"", 2000.0)
+    if close:
+        writer.close()
+    else:
+        writer.flush()
+    return file.getvalue()
+
+
+def relative(reads):
+    return [(round(now - reads[0][0], 6), data) for now, data in reads]
+
+
+class Test_Capture(unittest.TestCase):
+    def test_round_trip(self):
+        for index_interval in (1, 4, 1000):
+            for close in (True, False):
+                with self.subTest(index_interval=index_interval, close=close):
+                    reader = CaptureReader(capture(READS, index_interval, close))
+                    self.assertEqual(list(reader.records()), relative(READS))
+                    self.assertEqual(reader.start, 1000.0)
+                    self.assertAlmostEqual(reader.duration, 39 * 0.25)
+
+    def test_records_from(self):
+        reader = CaptureReader(capture(READS))
+        expected = relative(READS)
+        for start in (0.0, 0.1, 2.5, 2.6, 9.75, 20.0):
+            with self.subTest(start=start):
+                self.assertEqual(
+                    list(reader.records(start)),
+                    [(seconds, data) for seconds, data in expected if seconds >= start],
+                )
+
+    def test_truncated(self):
+        data = capture(READS, close=False)
+        # A read cut off part way through is ignored
+        reader = CaptureReader(data[:-2])
+        self.assertEqual(list(reader.records()), relative(READS)[:-1])
+        with self.assertRaises(ValueError):
+            CaptureReader(b"MThd")
+
+    def test_data_like_trailer(self):
+        # An unclosed log whose data ends like the trailer of a closed one
+        for tail in (b"MIDX", b"\x00" * 8 + b"MIDCAPIX", b"\x09" + bytes(7) + b"MIDCAPIX"):
+            with self.subTest(tail=tail):
+                reads = [(1.0, bytes([0x90, 60, 100])), (2.0, tail)]
+                reader = CaptureReader(capture(reads, close=False))
+                self.assertEqual(list(reader.records()), relative(reads))
+
+    def test_corrupt_index(self):
+        data = bytearray(capture(READS))
+        # An index offset past the trailer falls back to scanning the log,
+        # which then reads the index as data
+        data[-16:-8] = (len(data)).to_bytes(8, "little")
+        reader = CaptureReader(bytes(data))
+        self.assertEqual(list(reader.records())[: len(READS)], relative(READS))
+
+    def test_messages(self):
+        reader = CaptureReader(capture(READS))
+        messages = list(reader.messages())
+        self.assertEqual(len(messages), 43)
+        self.assertIsInstance(messages[10][1], SystemExclusive)
+        self.assertEqual(messages[10][1].data, b"\x01\x02")
+        self.assertEqual(messages[11][0], 2.5)
+        self.assertEqual(bytes(messages[11][1]), bytes(NoteOn(60, 100, channel=0)))
+        self.assertIsInstance(messages[12][1], TimingClock)
+        # Only the messages without a channel
+        self.assertEqual(len(list(reader.messages(channel=1))), 2)
+
+    def test_capture_port_and_mmap(self):
+        reads = [data for _, data in READS]
+        port = type("Port", (), {"read": lambda self, length: reads.pop(0) if reads else b""})()
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, "capture.bin")
+            with open(path, "wb") as file, CaptureWriter(file) as writer:
+                midi = adafruit_midi.MIDI(midi_in=CapturePort(port, writer))
+                received = []
+                for tick in range(50):
+                    with patch("adafruit_midi.capture.time.monotonic", return_value=tick * 0.5):
+                        received.append(midi.receive())
+            self.assertEqual(writer.records, 42)
+            with CaptureReader(path) as reader:
+                self.assertEqual(
+                    [data for _, data in reader.records()], [data for _, data in READS]
+                )
+                self.assertAlmostEqual(reader.duration, 41 * 0.5)
+                replayed = [bytes(msg) for _, msg in reader.messages()]
+        self.assertEqual(replayed, [bytes(msg) for msg in received if msg is not None])
+
+
+class Test_ReplayPort(unittest.TestCase):
+    def test_real_time(self):
+        reader = CaptureReader(capture(READS))
+        port = ReplayPort(reader, speed=2.0, start=2.5)
+        self.assertEqual(
+            port.read(30, now=50.0), b"\xf0\x7d\x01\x02\xf7\x90\x3c\x64\xf8\x90\x46\x64"
+        )
+        self.assertEqual(port.read(30, now=50.1), b"")
+        # The next read is 0.25 seconds later which is 0.125 at double speed
+        self.assertEqual(port.read(2, now=50.125), b"\x90\x47")
+        self.assertEqual(port.read(30, now=50.125), b"\x64")
+        self.assertFalse(port.done)
+        self.assertEqual(len(port.read(1000, now=100.0)), 28 * 3)
+        self.assertTrue(port.done)
+
+    def test_through_midi(self):
+        reader = CaptureReader(capture(READS))
+        port = ReplayPort(reader, speed=0)
+        midi = adafruit_midi.MIDI(midi_in=port, in_buf_size=8)
+        received = []
+        while not port.done or midi._in_buf:
+            msg = midi.receive()
+            if msg is not None:
+                received.append(bytes(msg))
+        self.assertEqual(received, [bytes(msg) for _, msg in reader.messages()])
+        self.assertEqual(received[0], bytes(NoteOn(60, 100, channel=0)))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=verbose)
@@ -0,0 +1,168 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import io
+import os
+import random
+import unittest
+
+verbose = int(os.getenv("TESTVERBOSE", "2"))
+
+import sys
+
+# Borrowing the dhalbert/tannewt technique from adafruit/Adafruit_CircuitPython_Motor
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from adafruit_midi import control_change_values as ccv
+from adafruit_midi.channel_pressure import ChannelPressure
+from adafruit_midi.chase import Chase, ChaseState
+from adafruit_midi.control_change import ControlChange
+from adafruit_midi.note_on import NoteOn
+from adafruit_midi.pitch_bend import PitchBend
+from adafruit_midi.program_change import ProgramChange
+from adafruit_midi.smf import SMFReader, SMFWriter
+
+
+def wire(msgs):
+    return [bytes(msg) for msg in msgs]
+
+
+def random_events(count, seed=1):
+    rng = random.Random(seed)
+    controls = [0, 1, 7, 10, 33, 64, ccv.RPN_MSB, ccv.RPN_LSB, ccv.DATA_ENTRY, 121]
+    events = []
+    for idx in range(count):
+        channel = rng.randrange(3)
+        kind = rng.randrange(5)
+        if kind == 0:
+            msg = ProgramChange(rng.randrange(128), channel=channel)
+        elif kind == 1:
+            msg = PitchBend(rng.randrange(16384), channel=channel)
+        elif kind == 2:
+            msg = NoteOn(rng.randrange(128), 100, channel=channel)
+        elif kind == 3:
+            msg = ChannelPressure(rng.randrange(128), channel=channel)
+        else:
+            msg = ControlChange(rng.choice(controls), rng.randrange(128), channel=channel)
+        events.append((idx // 2, msg))
+    return events
+
+
+class Test_ChaseState(unittest.TestCase):
+    def test_messages(self):
+        state = ChaseState()
+        for msg in (
+            ControlChange(ccv.VOLUME, 90, channel=2),
+            ProgramChange(5, channel=2),
+            ControlChange(ccv.BANK_SELECT, 1, channel=2),
+            ControlChange(ccv.VOLUME, 100, channel=2),
+            ControlChange(ccv.ALL_NOTES_OFF, 0, channel=2),
+            PitchBend(9000, channel=2),
+            ControlChange(ccv.RPN_MSB, 0, channel=2),
+            ControlChange(ccv.RPN_LSB, 0, channel=2),
+            ControlChange(ccv.DATA_ENTRY, 12, channel=2),
+            NoteOn(60, 100, channel=2),
+        ):
+            state.observe(msg)
+        self.assertEqual(state.program(2), 5)
+        self.assertEqual(state.pitch_bend(2), 9000)
+        self.assertIsNone(state.program(0))
+        self.assertEqual(state.messages(0), [])
+        self.assertEqual(
+            wire(state.messages()),
+            wire(
+                [
+                    ControlChange(ccv.BANK_SELECT, 1, channel=2),
+                    ProgramChange(5, channel=2),
+                    ControlChange(ccv.VOLUME, 100, channel=2),
+                    ControlChange(ccv.RPN_MSB, 0, channel=2),
+                    ControlChange(ccv.RPN_LSB, 0, channel=2),
+                    ControlChange(ccv.DATA_ENTRY, 12, channel=2),
+                    ControlChange(ccv.DATA_ENTRY_LSB, 0, channel=2),
+                    PitchBend(9000, channel=2),
+                ]
+            ),
+        )
+        # Reset All Controllers keeps the volume and bank and deselects the parameter
+        state.observe(ControlChange(ccv.MOD_WHEEL, 10, channel=2))
+        state.observe(ControlChange(ccv.ALL_CONTROLLERS_OFF, 0, channel=2))
+        self.assertIsNone(state.pitch_bend(2))
+        self.assertEqual(
+            [msg.control for msg in state.messages(2) if isinstance(msg, ControlChange)],
+            [
+                ccv.BANK_SELECT,
+                ccv.VOLUME,
+                ccv.RPN_MSB,
+                ccv.RPN_LSB,
+                ccv.DATA_ENTRY,
+                ccv.DATA_ENTRY_LSB,
+                ccv.RPN_MSB,
+                ccv.RPN_LSB,
+            ],
+        )
+
+    def test_parameter_selection(self):
+        state = ChaseState()
+        for control, value in (
+            (ccv.NRPN_MSB, 1),
+            (ccv.NRPN_LSB, 2),
+            (ccv.DATA_ENTRY, 3),
+            (ccv.RPN_MSB, 127),
+            (ccv.RPN_LSB, 127),
+        ):
+            state.apply(0xB0, control, value)
+        # The parameter is deselected after setting it
+        self.assertEqual(
+            [(msg.control, msg.value) for msg in state.messages(0)],
+            [
+                (ccv.NRPN_MSB, 1),
+                (ccv.NRPN_LSB, 2),
+                (ccv.DATA_ENTRY, 3),
+                (ccv.DATA_ENTRY_LSB, 0),
+                (ccv.RPN_MSB, 127),
+                (ccv.RPN_LSB, 127),
+            ],
+        )
+
+
+class Test_Chase(unittest.TestCase):
+    def test_matches_replay(self):
+        events = random_events(500)
+        for interval in (1, 7, 256, 1000):
+            chase = Chase(events, interval=interval)
+            self.assertEqual(len(chase), sum(1 for _, msg in events if msg._STATUS != 0x90))
+            for time in (-1, 0, 1, 17, 100, 249, 250):
+                with self.subTest(interval=interval, time=time):
+                    state = ChaseState()
+                    for event_time, msg in events:
+                        if event_time < time:
+                            state.observe(msg)
+                    messages = chase.messages_at(time)
+                    self.assertEqual(wire(messages), wire(state.messages()))
+                    # Sending the messages gives the same state
+                    resent = ChaseState()
+                    for msg in messages:
+                        resent.observe(msg)
+                    self.assertEqual(wire(resent.messages()), wire(messages))
+
+    def test_from_reader(self):
+        file = io.BytesIO()
+        with SMFWriter(file, ticks_per_quarter=100) as writer:
+            writer.write(0, ProgramChange(10), channel=0)
+            writer.write(100, ProgramChange(20), channel=0)
+            writer.start_track()
+            writer.write(50, ControlChange(ccv.VOLUME, 64), channel=1)
+        chase = Chase.from_reader(SMFReader(file.getvalue()))
+        self.assertEqual(wire(chase.messages_at(0.0)), [])
+        self.assertEqual(
+            wire(chase.messages_at(0.5)),
+            wire([ProgramChange(10, channel=0), ControlChange(ccv.VOLUME, 64, channel=1)]),
+        )
+        self.assertEqual(
+            wire(chase.messages_at(0.6, channel=0)), wire([ProgramChange(20, channel=0)])
+        )
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=verbose)
@@ -0,0 +1,88 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import os
+import unittest
+from unittest.mock import Mock
+
+verbose = int(os.getenv("TESTVERBOSE", "2"))
+
+import sys
+
+# Borrowing the dhalbert/tannewt technique from adafruit/Adafruit_CircuitPython_Motor
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import adafruit_midi
+from adafruit_midi.channel_pressure import ChannelPressure
+from adafruit_midi.coalescer import MIDICoalescer
+from adafruit_midi.control_change import ControlChange
+from adafruit_midi.note_on import NoteOn
+from adafruit_midi.pitch_bend import PitchBend
+from adafruit_midi.timing_clock import TimingClock
+
+
+def MIDI_mocked_out():
+    sent = bytearray()
+
+    def write(buffer, length):
+        sent.extend(buffer[:length])
+
+    mockedportout = Mock()
+    mockedportout.write = write
+    return adafruit_midi.MIDI(midi_out=mockedportout), sent
+
+
+class Test_MIDICoalescer(unittest.TestCase):
+    def test_last_value_wins(self):
+        midi, sent = MIDI_mocked_out()
+        coalescer = MIDICoalescer(midi, bytes_per_second=None)
+        for value in range(100):
+            coalescer.send(ControlChange(7, value))
+            coalescer.send(PitchBend(value * 100), channel=1)
+        coalescer.send(ControlChange(10, 5))
+        self.assertEqual(coalescer.pending, 3)
+        self.assertEqual(sent, b"")
+        coalescer.poll(0.0)
+        self.assertEqual(sent, bytes([0xB0, 7, 99, 0xE1, 9900 & 0x7F, 9900 >> 7, 0xB0, 10, 5]))
+        self.assertEqual(coalescer.pending, 0)
+
+    def test_rate_limit(self):
+        midi, sent = MIDI_mocked_out()
+        coalescer = MIDICoalescer(midi, bytes_per_second=3000, burst_bytes=6)
+        for control in range(4):
+            coalescer.send(ControlChange(control, 1))
+        coalescer.send(ChannelPressure(3))
+        self.assertEqual(coalescer.poll(0.0), 6)
+        self.assertEqual(coalescer.poll(0.001), 3)
+        self.assertEqual(coalescer.poll(0.001), 0)
+        self.assertEqual(coalescer.poll(1.0), 5)
+        self.assertEqual(len(sent), 14)
+
+    def test_notes_pass_in_order(self):
+        midi, sent = MIDI_mocked_out()
+        coalescer = MIDICoalescer(midi, bytes_per_second=None)
+        coalescer.send(ControlChange(64, 127), channel=0)
+        coalescer.send(ControlChange(1, 64), channel=1)
+        coalescer.send(NoteOn(60, 100), channel=0)
+        coalescer.send(TimingClock())
+        self.assertEqual(sent, bytes([0xB0, 64, 127, 0x90, 60, 100, 0xF8]))
+        coalescer.flush()
+        self.assertEqual(sent[-3:], bytes([0xB1, 1, 64]))
+
+    def test_min_delta(self):
+        midi, sent = MIDI_mocked_out()
+        coalescer = MIDICoalescer(midi, bytes_per_second=None, min_delta=4)
+        coalescer.send(ControlChange(1, 50))
+        coalescer.flush()
+        coalescer.send(ControlChange(1, 52))
+        self.assertEqual(coalescer.pending, 0)
+        coalescer.send(ControlChange(1, 54))
+        self.assertEqual(coalescer.pending, 1)
+        coalescer.flush()
+        coalescer.send(ControlChange(1, 127))
+        self.assertEqual(coalescer.pending, 1)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=verbose)
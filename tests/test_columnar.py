@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import os
+import unittest
+
+verbose = int(os.getenv("TESTVERBOSE", "2"))
+
+import sys
+
+# Borrowing the dhalbert/tannewt technique from adafruit/Adafruit_CircuitPython_Motor
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from adafruit_midi.columnar import MessageColumns, np
+from adafruit_midi.control_change import ControlChange
+from adafruit_midi.midi_message import MIDIUnknownEvent
+from adafruit_midi.mtc_quarter_frame import MtcQuarterFrame
+from adafruit_midi.note_on import NoteOn
+from adafruit_midi.pitch_bend import PitchBend
+from adafruit_midi.program_change import ProgramChange
+from adafruit_midi.system_exclusive import SystemExclusive
+from adafruit_midi.timing_clock import TimingClock
+
+
+def sample_messages():
+    return [
+        NoteOn(60, 100, channel=1),
+        PitchBend(12345, channel=2),
+        ProgramChange(7, channel=15),
+        SystemExclusive([0x7D], b"\x01\x02\x03"),
+        TimingClock(),
+        MtcQuarterFrame(3, 9),
+        ControlChange(64, 127, channel=0),
+    ]
+
+
+def wire(msgs):
+    return b"".join(msg.__bytes__() for msg in msgs)
+
+
+class Test_MessageColumns(unittest.TestCase):
+    def test_columns(self):
+        columns = MessageColumns.from_messages(sample_messages())
+        self.assertEqual(len(columns), 7)
+        self.assertEqual(list(columns.status), [0x90, 0xE0, 0xC0, 0xF0, 0xF8, 0xF1, 0xB0])
+        self.assertEqual(list(columns.channel), [1, 2, 15, -1, -1, -1, 0])
+        self.assertEqual(list(columns.data1), [60, 12345 & 0x7F, 7, 0, 0, 0x39, 64])
+        self.assertEqual(list(columns.data2), [100, 12345 >> 7, 0, 0, 0, 0, 127])
+        self.assertEqual(columns.sysex, [b"\xf0\x7d\x01\x02\x03\xf7"])
+        self.assertIsNone(columns.time)
+
+    def test_round_trip(self):
+        msgs = sample_messages()
+        columns = MessageColumns.from_messages(msgs)
+        self.assertEqual(columns.encode(), wire(msgs))
+        self.assertEqual(wire(columns.messages()), wire(msgs))
+        self.assertEqual(MessageColumns.from_bytes(wire(msgs)).encode(), wire(msgs))
+        out = bytearray(b"\xfa")
+        self.assertIs(columns.encode(out), out)
+
+    def test_from_bytes_skips_unknown(self):
+        data = bytes([0xF4, 0x90, 0x30, 0x40, 0x10, 0xF9])
+        columns = MessageColumns.from_bytes(data)
+        self.assertEqual(columns.encode(), bytes([0x90, 0x30, 0x40]))
+        columns.append(MIDIUnknownEvent(0xF5))
+        self.assertEqual(len(columns), 1)
+
+    def test_timestamps(self):
+        columns = MessageColumns.from_messages(sample_messages(), [0.5 * idx for idx in range(7)])
+        self.assertEqual(list(columns.time), [0.0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0])
+        with self.assertRaises(ValueError):
+            columns.append(NoteOn(60), 4.0)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_numpy(self):
+        msgs = sample_messages()
+        columns = MessageColumns.from_messages(msgs, range(7))
+        array = columns.to_numpy()
+        self.assertEqual(list(array["time"]), list(range(7)))
+        self.assertEqual(list(array["channel"]), [1, 2, 15, -1, -1, -1, 0])
+        copy = MessageColumns.from_numpy(array, columns.sysex)
+        self.assertEqual(copy.encode(), wire(msgs))
+        self.assertEqual(list(copy.time), list(range(7)))
+        untimed = MessageColumns.from_messages(msgs).to_numpy()
+        self.assertNotIn("time", untimed.dtype.names)
+        copy = MessageColumns.from_numpy(untimed, columns.sysex)
+        self.assertIsNone(copy.time)
+        self.assertEqual(copy.encode(), wire(msgs))
+        with self.assertRaises(ValueError):
+            MessageColumns.from_numpy(array)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=verbose)
@@ -0,0 +1,98 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import os
+import unittest
+
+verbose = int(os.getenv("TESTVERBOSE", "2"))
+
+import sys
+
+# Borrowing the dhalbert/tannewt technique from adafruit/Adafruit_CircuitPython_Motor
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from adafruit_midi import control_change_values as ccv
+from adafruit_midi.control_change import ControlChange
+from adafruit_midi.controller_state import CC, CC_14BIT, NRPN, RPN, ControllerState
+from adafruit_midi.note_on import NoteOn
+
+
+class Test_ControllerState(unittest.TestCase):
+    def test_7bit(self):
+        state = ControllerState()
+        self.assertEqual(
+            state.observe(ControlChange(ccv.SUSTAIN_PEDAL, 127, channel=3)),
+            (CC, 3, ccv.SUSTAIN_PEDAL, 127),
+        )
+        self.assertEqual(state.value(ccv.SUSTAIN_PEDAL, 3), 127)
+        self.assertEqual(state.value(ccv.SUSTAIN_PEDAL, 2), 0)
+        self.assertIsNone(state.observe(NoteOn(60, channel=3)))
+        self.assertIsNone(state.observe(None))
+
+    def test_14bit(self):
+        state = ControllerState()
+        self.assertEqual(
+            state.observe(ControlChange(ccv.MOD_WHEEL, 0x40, channel=0)),
+            (CC_14BIT, 0, ccv.MOD_WHEEL, 0x2000),
+        )
+        self.assertEqual(
+            state.observe(ControlChange(ccv.MOD_WHEEL + 32, 0x11, channel=0)),
+            (CC_14BIT, 0, ccv.MOD_WHEEL, 0x2011),
+        )
+        self.assertEqual(state.value14(ccv.MOD_WHEEL, 0), 0x2011)
+        # new MSB clears the LSB
+        state.observe(ControlChange(ccv.MOD_WHEEL, 0x41, channel=0))
+        self.assertEqual(state.value14(ccv.MOD_WHEEL, 0), 0x41 << 7)
+
+    def test_rpn(self):
+        state = ControllerState()
+        self.assertIsNone(state.control_change(ccv.RPN_MSB, 0, 1))
+        self.assertIsNone(state.control_change(ccv.RPN_LSB, 0, 1))
+        self.assertEqual(state.control_change(ccv.DATA_ENTRY, 12, 1), (RPN, 1, 0, 12 << 7))
+        self.assertEqual(state.control_change(ccv.DATA_ENTRY_LSB, 50, 1), (RPN, 1, 0, 12 << 7 | 50))
+        self.assertEqual(state.rpn(0, 1), 12 << 7 | 50)
+        self.assertEqual(state.control_change(ccv.DATA_INCREMENT, 0, 1), (RPN, 1, 0, 12 << 7 | 51))
+        self.assertIsNone(state.rpn(0, 0))
+
+        # null RPN means data entry is a plain controller again
+        state.control_change(ccv.RPN_MSB, 127, 1)
+        state.control_change(ccv.RPN_LSB, 127, 1)
+        self.assertEqual(state.control_change(ccv.DATA_ENTRY, 3, 1), (CC_14BIT, 1, 6, 3 << 7))
+        self.assertEqual(state.rpn(0, 1), 12 << 7 | 51)
+
+    def test_nrpn(self):
+        state = ControllerState()
+        state.control_change(ccv.NRPN_MSB, 1, 9)
+        state.control_change(ccv.NRPN_LSB, 2, 9)
+        self.assertEqual(state.control_change(ccv.DATA_ENTRY, 100, 9), (NRPN, 9, 130, 100 << 7))
+        self.assertEqual(state.nrpn(130, 9), 100 << 7)
+        self.assertIsNone(state.rpn(130, 9))
+        state.control_change(ccv.ALL_CONTROLLERS_OFF, 0, 9)
+        self.assertEqual(state.control_change(ccv.DATA_ENTRY, 1, 9)[0], CC_14BIT)
+
+    def test_reset(self):
+        state = ControllerState()
+        state.control_change(ccv.VOLUME, 100, 0)
+        state.control_change(ccv.VOLUME, 100, 1)
+        state.reset(0)
+        self.assertEqual(state.value(ccv.VOLUME, 0), 0)
+        self.assertEqual(state.value(ccv.VOLUME, 1), 100)
+
+    def test_copy_and_parameters(self):
+        state = ControllerState()
+        for control, value in ((ccv.NRPN_MSB, 0), (ccv.NRPN_LSB, 5), (ccv.DATA_ENTRY, 7)):
+            state.control_change(control, value, 4)
+        for control, value in ((ccv.RPN_MSB, 0), (ccv.RPN_LSB, 2), (ccv.DATA_ENTRY, 64)):
+            state.control_change(control, value, 4)
+        copy = state.copy()
+        state.control_change(ccv.DATA_ENTRY, 1, 4)
+        self.assertEqual(copy.selected(4), (RPN, 2))
+        self.assertIsNone(copy.selected(0))
+        self.assertEqual(copy.parameters(4), [(RPN, 2, 64 << 7), (NRPN, 5, 7 << 7)])
+        self.assertEqual(copy.parameters(0), [])
+        self.assertEqual(state.rpn(2, 4), 1 << 7)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=verbose)
@@ -0,0 +1,210 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+# Memory regression tests, these measure with tracemalloc on CPython which
+# does not give the same numbers as a board but does show when usage grows.
+# The budgets are about 12% above the measured values to allow for
+# differences between CPython versions, if a change legitimately needs more
+# raise the budget in the same change.
+
+import os
+import pkgutil
+import subprocess
+import tracemalloc
+import unittest
+
+verbose = int(os.getenv("TESTVERBOSE", "2"))
+
+import sys
+
+# Borrowing the dhalbert/tannewt technique from adafruit/Adafruit_CircuitPython_Motor
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import adafruit_midi
+from adafruit_midi.channel_pressure import ChannelPressure
+from adafruit_midi.control_change import ControlChange
+from adafruit_midi.mtc_quarter_frame import MtcQuarterFrame
+from adafruit_midi.note_off import NoteOff
+from adafruit_midi.note_on import NoteOn
+from adafruit_midi.pitch_bend import PitchBend
+from adafruit_midi.polyphonic_key_pressure import PolyphonicKeyPressure
+from adafruit_midi.program_change import ProgramChange
+from adafruit_midi.start import Start
+from adafruit_midi.system_exclusive import SystemExclusive
+from adafruit_midi.timing_clock import TimingClock
+
+# Bytes allocated by importing each submodule after the package itself,
+# except midi_message which the package imports
+IMPORT_BUDGET = {
+    "active_sensing": 6000,
+    "batch": 247000,
+    "capture": 60000,
+    "channel_pressure": 10000,
+    "chase": 109000,
+    "coalescer": 27000,
+    "columnar": 55000,
+    "control_change": 13000,
+    "control_change_values": 6000,
+    "controller_state": 33000,
+    "merger": 45000,
+    "message_batch": 15000,
+    "midi_continue": 6000,
+    "midi_message": 111000,
+    "midi_reset": 6000,
+    "mtc": 57000,
+    "mtc_quarter_frame": 11000,
+    "note_off": 13000,
+    "note_on": 14000,
+    "note_tracker": 42000,
+    "numpy_decoder": 22000,
+    "pacer": 21000,
+    "pitch_bend": 10000,
+    "polyphonic_key_pressure": 13000,
+    "program_change": 10000,
+    "router": 24000,
+    "smf": 215000,
+    "smf_index": 234000,
+    "start": 6000,
+    "stop": 6000,
+    "system_exclusive": 10000,
+    "thru": 27000,
+    "timing_clock": 7000,
+    "transform": 54000,
+    "ump": 41000,
+    "usb_midi_packet": 35000,
+}
+# The package itself, which includes midi_message
+PACKAGE_IMPORT_BUDGET = 111000
+
+INSTANCE_BUDGET = 300
+
+_IMPORT_SCRIPT = """
+import sys, tracemalloc, importlib
+sys.path.insert(0, sys.argv[1])
+# Warm up the import machinery and the standard library the package uses
+import array, json, os, time, typing, unittest
+try:
+    import numpy
+except ImportError:
+    pass
+# Always compile the package from source as loading bytecode allocates
+# differently depending on what wrote it, e.g. compileall or an import
+sys.dont_write_bytecode = True
+sys.pycache_prefix = os.devnull
+if sys.argv[3] == "1":
+    import adafruit_midi
+tracemalloc.start()
+importlib.import_module(sys.argv[2])
+print(tracemalloc.get_traced_memory()[0])
+"""
+
+
+def import_footprint(module):
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    # The package imports midi_message so both are measured from a bare interpreter
+    after_package = "0" if module in {"adafruit_midi", "adafruit_midi.midi_message"} else "1"
+    output = subprocess.run(
+        [sys.executable, "-c", _IMPORT_SCRIPT, root, module, after_package],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return int(output.stdout)
+
+
+def allocations(func, count):
+    """Return the (retained, peak) bytes allocated by calling ``func`` ``count`` times."""
+    func()  # warm up any caches
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    for _ in range(count):
+        func()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current - base, peak - base
+
+
+def MIDI_mocked_both_loopback():
+    usb_data = bytearray()
+
+    def write(buffer, length):
+        usb_data.extend(buffer[0:length])
+
+    def read(length):
+        nonlocal usb_data
+        poppedbytes = usb_data[0:length]
+        usb_data = usb_data[len(poppedbytes) :]
+        return bytes(poppedbytes)
+
+    # Plain objects rather than Mock, which allocates on every call
+    class Port:
+        pass
+
+    port = Port()
+    port.read = read
+    port.write = write
+    return adafruit_midi.MIDI(midi_in=port, midi_out=port)
+
+
+class Test_ImportFootprint(unittest.TestCase):
+    def test_every_submodule_has_a_budget(self):
+        modules = {info.name for info in pkgutil.iter_modules(adafruit_midi.__path__)}
+        self.assertEqual(modules, set(IMPORT_BUDGET))
+
+    def test_package(self):
+        self.assertLessEqual(import_footprint("adafruit_midi"), PACKAGE_IMPORT_BUDGET)
+
+    def test_submodules(self):
+        for name, budget in IMPORT_BUDGET.items():
+            with self.subTest(module=name):
+                self.assertLessEqual(import_footprint("adafruit_midi." + name), budget)
+
+
+class Test_InstanceSize(unittest.TestCase):
+    def test_messages(self):
+        makers = (
+            lambda: NoteOn(60, 100),
+            lambda: NoteOff(60, 0),
+            lambda: ControlChange(1, 64),
+            lambda: PitchBend(8192),
+            lambda: ChannelPressure(64),
+            lambda: PolyphonicKeyPressure(60, 64),
+            lambda: ProgramChange(1),
+            lambda: MtcQuarterFrame(1, 2),
+            lambda: SystemExclusive([0x7D], b"data"),
+            TimingClock,
+            Start,
+        )
+        for maker in makers:
+            instances = []
+            retained, _ = allocations(lambda maker=maker: instances.append(maker()), 100)
+            with self.subTest(message=type(instances[0]).__name__):
+                self.assertLessEqual(retained / 100, INSTANCE_BUDGET)
+
+
+class Test_SteadyState(unittest.TestCase):
+    def test_send(self):
+        midi = MIDI_mocked_both_loopback()
+        midi._midi_out.write = lambda buffer, length: None
+        msg = NoteOn(60, 100)
+        retained, peak = allocations(lambda: midi.send(msg), 100)
+        self.assertLessEqual(retained, 0)
+        self.assertLessEqual(peak, 200)
+
+    def test_send_receive(self):
+        midi = MIDI_mocked_both_loopback()
+        msg = ControlChange(1, 64)
+
+        def loop():
+            midi.send(msg)
+            self.assertIsInstance(midi.receive(), ControlChange)
+
+        retained, peak = allocations(loop, 100)
+        # Allow for the buffers being reallocated at a different size
+        self.assertLessEqual(retained, 200)
+        self.assertLessEqual(peak, 1000)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=verbose)
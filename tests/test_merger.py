@@ -0,0 +1,91 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import os
+import unittest
+from unittest.mock import Mock
+
+verbose = int(os.getenv("TESTVERBOSE", "2"))
+
+import sys
+
+# Borrowing the dhalbert/tannewt technique from adafruit/Adafruit_CircuitPython_Motor
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import adafruit_midi
+from adafruit_midi.merger import MIDIMerger
+
+
+def MIDI_mocked_in(*chunks):
+    chunks = list(chunks)
+
+    def read(length):
+        if not chunks:
+            return b""
+        return bytes(chunks.pop(0))
+
+    mockedportin = Mock()
+    mockedportin.read = read
+    return adafruit_midi.MIDI(midi_in=mockedportin)
+
+
+def MIDI_mocked_out():
+    writes = []
+
+    def write(buffer, length):
+        writes.append(bytes(buffer[:length]))
+
+    mockedportout = Mock()
+    mockedportout.write = write
+    return adafruit_midi.MIDI(midi_out=mockedportout), writes
+
+
+class Test_MIDIMerger(unittest.TestCase):
+    def test_whole_messages(self):
+        in1 = MIDI_mocked_in([0x90, 60], [100, 61, 100])
+        in2 = MIDI_mocked_in([0x91, 40, 50, 0xF8], [0xC1])
+        out, writes = MIDI_mocked_out()
+        merger = MIDIMerger([in1, in2], out)
+        merger.process()
+        merger.process()
+        self.assertEqual(writes[0], bytes([0xF8, 0x91, 40, 50]))
+        # running status from input 1 is expanded
+        self.assertEqual(writes[1], bytes([0x90, 60, 100, 0x90, 61, 100]))
+        self.assertEqual(merger.process(), 0)
+
+    def test_sysex_not_split(self):
+        in1 = MIDI_mocked_in([0xF0, 1, 2], [3, 0xF8, 4], [0xF7, 0x80, 1, 2])
+        in2 = MIDI_mocked_in([0xB0, 7, 100], [0xB0, 7, 101], [])
+        out, writes = MIDI_mocked_out()
+        merger = MIDIMerger([in1, in2], out)
+        for unused in range(4):
+            merger.process()
+        merged = b"".join(writes)
+        sysex_start = merged.index(0xF0)
+        sysex_end = merged.index(0xF7)
+        self.assertEqual(
+            merged[sysex_start : sysex_end + 1].replace(b"\xf8", b""),
+            bytes([0xF0, 1, 2, 3, 4, 0xF7]),
+        )
+        self.assertEqual(merged.count(bytes([0xB0, 7])), 2)
+        self.assertEqual(merged.replace(b"\xf8", b"").count(0x80), 1)
+
+    def test_interrupted_sysex(self):
+        in1 = MIDI_mocked_in([0xF0, 1, 0x90, 60, 100])
+        out, writes = MIDI_mocked_out()
+        MIDIMerger([in1], out).process()
+        self.assertEqual(writes, [bytes([0xF0, 1, 0xF7, 0x90, 60, 100])])
+
+    def test_fair_start(self):
+        in1 = MIDI_mocked_in([0xC0, 1], [0xC0, 2])
+        in2 = MIDI_mocked_in([0xC1, 1], [0xC1, 2])
+        out, writes = MIDI_mocked_out()
+        merger = MIDIMerger([in1, in2], out)
+        merger.process()
+        merger.process()
+        self.assertEqual(writes, [bytes([0xC0, 1, 0xC1, 1]), bytes([0xC1, 2, 0xC0, 2])])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=verbose)
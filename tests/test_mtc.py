@@ -0,0 +1,155 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import os
+import unittest
+
+verbose = int(os.getenv("TESTVERBOSE", "2"))
+
+import sys
+
+# Borrowing the dhalbert/tannewt technique from adafruit/Adafruit_CircuitPython_Motor
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from adafruit_midi import mtc
+from adafruit_midi.midi_message import MIDIMessage
+from adafruit_midi.mtc_quarter_frame import MtcQuarterFrame
+from adafruit_midi.note_on import NoteOn
+from adafruit_midi.system_exclusive import SystemExclusive
+
+
+def quarter_frames(hours, minutes, seconds, frames, rate):
+    values = [
+        frames & 0x0F,
+        frames >> 4,
+        seconds & 0x0F,
+        seconds >> 4,
+        minutes & 0x0F,
+        minutes >> 4,
+        hours & 0x0F,
+        rate << 1 | hours >> 4,
+    ]
+    return [MtcQuarterFrame(piece, value) for piece, value in enumerate(values)]
+
+
+class Test_MTC_conversion(unittest.TestCase):
+    def test_round_trip(self):
+        for rate in range(4):
+            for count in (0, 1, 1799, 1800, 17981, 17982, 17983, 107892, 2073599):
+                timecode = mtc.frames_to_timecode(count, rate)
+                self.assertEqual(mtc.timecode_to_frames(*timecode, rate), count)
+
+    def test_drop_frame(self):
+        # 00:00:59:29 is followed by 00:01:00:02 in drop frame
+        count = mtc.timecode_to_frames(0, 0, 59, 29, mtc.FPS_30_DROP)
+        self.assertEqual(mtc.frames_to_timecode(count + 1, mtc.FPS_30_DROP), (0, 1, 0, 2))
+        # but not for every tenth minute
+        count = mtc.timecode_to_frames(0, 9, 59, 29, mtc.FPS_30_DROP)
+        self.assertEqual(mtc.frames_to_timecode(count + 1, mtc.FPS_30_DROP), (0, 10, 0, 0))
+
+    def test_wrap(self):
+        self.assertEqual(mtc.frames_to_timecode(-1, mtc.FPS_25), (23, 59, 59, 24))
+
+
+class Test_MtcReader(unittest.TestCase):
+    def test_forward(self):
+        reader = mtc.MtcReader()
+        results = [reader.feed(msg) for msg in quarter_frames(1, 2, 3, 4, mtc.FPS_30)]
+        self.assertEqual(results, [False] * 7 + [True])
+        self.assertTrue(reader.locked)
+        self.assertEqual(reader.direction, 1)
+        self.assertEqual(reader.rate, mtc.FPS_30)
+        # two frame latency compensation
+        self.assertEqual(reader.timecode, (1, 2, 3, 6))
+
+        # frame advances on the fourth quarter frame of the next sequence
+        next_sequence = quarter_frames(1, 2, 3, 6, mtc.FPS_30)
+        for msg in next_sequence[:4]:
+            reader.feed(msg)
+        self.assertEqual(reader.timecode, (1, 2, 3, 7))
+        for msg in next_sequence[4:]:
+            reader.feed(msg)
+        self.assertEqual(reader.timecode, (1, 2, 3, 8))
+
+    def test_reverse(self):
+        reader = mtc.MtcReader()
+        for msg in reversed(quarter_frames(0, 10, 0, 5, mtc.FPS_25)):
+            reader.feed(msg)
+        self.assertEqual(reader.direction, -1)
+        self.assertEqual(reader.timecode, (0, 10, 0, 3))
+
+    def test_dropped_quarter_frame(self):
+        reader = mtc.MtcReader()
+        msgs = quarter_frames(0, 0, 1, 0, mtc.FPS_24)
+        for msg in msgs[:3] + msgs[4:]:
+            reader.feed(msg)
+        self.assertFalse(reader.locked)
+
+    def test_full_frame(self):
+        reader = mtc.MtcReader()
+        sysex = MIDIMessage.from_message_bytes(
+            bytes([0xF0, 0x7F, 0x7F, 0x01, 0x01, 0x20 | 0x0A, 0x0B, 0x0C, 0x0D, 0xF7]), 0
+        )[0]
+        self.assertTrue(reader.feed(sysex))
+        self.assertEqual(reader.rate, mtc.FPS_25)
+        self.assertEqual(reader.timecode, (10, 11, 12, 13))
+        self.assertTrue(reader.locked)
+
+    def test_full_frame_message(self):
+        reader = mtc.MtcReader()
+        self.assertTrue(reader.feed(mtc.full_frame_message(1, 2, 3, 23, mtc.FPS_24)))
+        self.assertEqual(reader.timecode, (1, 2, 3, 23))
+        for args, kwargs in (
+            ((1, 2, 3, 24, mtc.FPS_24), {}),
+            ((1, 2, 3, 25, mtc.FPS_25), {}),
+            ((1, 2, 3, 30, mtc.FPS_30), {}),
+            ((1, 2, 3, 4, 4), {}),
+            ((1, 2, 3, 4), {"device_id": 0x80}),
+            ((1, 2, 3, 4), {"device_id": -1}),
+        ):
+            with self.subTest(args=args, kwargs=kwargs), self.assertRaises(ValueError):
+                mtc.full_frame_message(*args, **kwargs)
+
+    def test_ignores_others(self):
+        reader = mtc.MtcReader()
+        self.assertFalse(reader.feed(NoteOn(60, channel=0)))
+        self.assertFalse(reader.feed(SystemExclusive([0x01], [0x01, 0x01])))
+        self.assertFalse(reader.feed(None))
+
+
+class Test_MtcGenerator(unittest.TestCase):
+    def test_generator_to_reader(self):
+        generator = mtc.MtcGenerator(mtc.FPS_25)
+        reader = mtc.MtcReader()
+        first = generator.poll(10.0)
+        self.assertIsInstance(first, SystemExclusive)
+        reader.feed(first)
+        self.assertEqual(reader.timecode, (0, 0, 10, 0))
+
+        position = 10.0
+        sent = []
+        while position < 10.2:
+            msg = generator.poll(position)
+            while msg is not None:
+                sent.append(msg)
+                reader.feed(msg)
+                msg = generator.poll(position)
+            position += 0.001
+        self.assertTrue(all(isinstance(msg, MtcQuarterFrame) for msg in sent))
+        self.assertEqual([msg.type for msg in sent[:8]], list(range(8)))
+        # 0.2 seconds at 25 fps is 5 frames or 20 quarter frames
+        self.assertEqual(len(sent), 20)
+        self.assertEqual(reader.timecode, (0, 0, 10, 5))
+
+    def test_relocate(self):
+        generator = mtc.MtcGenerator(mtc.FPS_24)
+        generator.poll(0.0)
+        self.assertIsInstance(generator.poll(0.0), MtcQuarterFrame)
+        self.assertIsInstance(generator.poll(60.0), SystemExclusive)
+        generator.stop()
+        self.assertIsInstance(generator.poll(60.0), SystemExclusive)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=verbose)
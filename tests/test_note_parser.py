@@ -15,7 +15,7 @@ import sys
 # Borrowing the dhalbert/tannewt technique from adafruit/Adafruit_CircuitPython_Motor
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from adafruit_midi.midi_message import note_parser
+from adafruit_midi.midi_message import note_name, note_parser
 
 
 class Test_note_parser(unittest.TestCase):
@@ -69,6 +69,40 @@ class Test_note_parser(unittest.TestCase):
             with self.assertRaises(ValueError):
                 note_parser(text_note)
 
+    def test_middle_c_octave(self):
+        self.assertEqual(note_parser("C3", middle_c_octave=3), 60)
+        self.assertEqual(note_parser("C-2", middle_c_octave=3), 0)
+        self.assertEqual(note_parser("C3"), 48)
+        self.assertEqual(note_parser(60, middle_c_octave=3), 60)
+
+    def test_cached_errors(self):
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                note_parser("X4")
+
+
+class Test_note_name(unittest.TestCase):
+    def test_names(self):
+        self.assertEqual(note_name(60), "C4")
+        self.assertEqual(note_name(61), "C#4")
+        self.assertEqual(note_name(61, flats=True), "Db4")
+        self.assertEqual(note_name(0), "C-1")
+        self.assertEqual(note_name(127), "G9")
+        self.assertEqual(note_name(60, middle_c_octave=3), "C3")
+        self.assertEqual(note_name(0, middle_c_octave=3), "C-2")
+
+    def test_round_trip(self):
+        for flats in (False, True):
+            for octave in (3, 4, 5):
+                for note in range(128):
+                    name = note_name(note, flats=flats, middle_c_octave=octave)
+                    self.assertEqual(note_parser(name, middle_c_octave=octave), note)
+
+    def test_out_of_range(self):
+        for note in (-1, 128):
+            with self.assertRaises(ValueError):
+                note_name(note)
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=verbose)
@@ -0,0 +1,89 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import os
+import unittest
+from unittest.mock import Mock
+
+verbose = int(os.getenv("TESTVERBOSE", "2"))
+
+import sys
+
+# Borrowing the dhalbert/tannewt technique from adafruit/Adafruit_CircuitPython_Motor
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import adafruit_midi
+from adafruit_midi.control_change import ControlChange
+from adafruit_midi.control_change_values import ALL_NOTES_OFF
+from adafruit_midi.note_off import NoteOff
+from adafruit_midi.note_on import NoteOn
+from adafruit_midi.note_tracker import NoteTracker
+from adafruit_midi.pitch_bend import PitchBend
+
+
+class Test_NoteTracker(unittest.TestCase):
+    def test_on_off(self):
+        tracker = NoteTracker()
+        tracker.observe(NoteOn(60, 100, channel=0))
+        tracker.observe(NoteOn(60, 100, channel=0))
+        tracker.observe(NoteOn(127, 100, channel=15))
+        tracker.observe(PitchBend(8192, channel=0))
+        tracker.observe(None)
+        self.assertTrue(tracker.is_active(60, 0))
+        self.assertTrue(tracker.is_active(127, 15))
+        self.assertFalse(tracker.is_active(60, 1))
+        self.assertEqual(tracker.count(), 2)
+        self.assertEqual(tracker.count(0), 1)
+
+        tracker.observe(NoteOn(60, 0, channel=0))
+        self.assertFalse(tracker.is_active(60, 0))
+        tracker.observe(NoteOff(127, channel=15))
+        tracker.observe(NoteOff(127, channel=15))
+        self.assertEqual(tracker.count(), 0)
+
+    def test_all_notes_off(self):
+        tracker = NoteTracker()
+        for note in (1, 2, 3):
+            tracker.observe(NoteOn(note, channel=4))
+        tracker.observe(NoteOn(1, channel=5))
+        tracker.observe(ControlChange(ALL_NOTES_OFF, 0, channel=4))
+        self.assertEqual(tracker.count(4), 0)
+        self.assertEqual(tracker.count(5), 1)
+
+    def test_observe_bytes(self):
+        tracker = NoteTracker()
+        tracker.observe_bytes(bytes([0x93, 60, 100, 0xC0, 5, 0x93, 61, 100, 0x93, 60, 0]))
+        self.assertEqual(list(tracker.active_notes(3)), [61])
+
+    def test_panic_bytes(self):
+        tracker = NoteTracker()
+        for note in (0, 9, 64, 127):
+            tracker.note_on(note, 2)
+        tracker.note_on(7, 0)
+        self.assertEqual(
+            tracker.panic_bytes(),
+            bytes([0x80, 7, 0, 0x82, 0, 0, 9, 0, 64, 0, 127, 0]),
+        )
+        self.assertEqual(tracker.count(), 0)
+
+    def test_panic(self):
+        sent = bytearray()
+
+        def write(buffer, length):
+            sent.extend(buffer[:length])
+
+        port = Mock()
+        port.write = write
+        midi = adafruit_midi.MIDI(midi_out=port)
+        tracker = NoteTracker()
+        tracker.note_on(60, 1)
+        tracker.note_on(62, 1)
+        tracker.note_on(30, 9)
+        tracker.panic(midi)
+        self.assertEqual(sent, bytes([0x81, 60, 0, 0x81, 62, 0, 0x89, 30, 0]))
+        self.assertEqual(tracker.count(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=verbose)
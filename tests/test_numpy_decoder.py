@@ -0,0 +1,134 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import os
+import random
+import unittest
+
+verbose = int(os.getenv("TESTVERBOSE", "2"))
+
+import sys
+
+# Borrowing the dhalbert/tannewt technique from adafruit/Adafruit_CircuitPython_Motor
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# Full monty
+from adafruit_midi.active_sensing import ActiveSensing
+from adafruit_midi.channel_pressure import ChannelPressure
+from adafruit_midi.control_change import ControlChange
+from adafruit_midi.midi_continue import Continue
+from adafruit_midi.midi_message import MIDIBadEvent, MIDIMessage, MIDIUnknownEvent
+from adafruit_midi.midi_reset import Reset
+from adafruit_midi.mtc_quarter_frame import MtcQuarterFrame
+from adafruit_midi.note_off import NoteOff
+from adafruit_midi.note_on import NoteOn
+from adafruit_midi.numpy_decoder import KIND_BAD, KIND_MESSAGE, KIND_UNKNOWN, decode, np
+from adafruit_midi.pitch_bend import PitchBend
+from adafruit_midi.polyphonic_key_pressure import PolyphonicKeyPressure
+from adafruit_midi.program_change import ProgramChange
+from adafruit_midi.start import Start
+from adafruit_midi.stop import Stop
+from adafruit_midi.system_exclusive import SystemExclusive
+from adafruit_midi.timing_clock import TimingClock
+
+ALL_CHANNELS = tuple(range(16))
+
+
+def reference_decode(data):
+    """Decode with the pure Python parser into the same form as decode(),
+    the SysEx messages are given by where they end."""
+    messages = []
+    sysex_ends = []
+    offset = 0
+    while offset < len(data):
+        msg, endplusone, _ = MIDIMessage.from_message_bytes(data[offset:], ALL_CHANNELS)
+        if msg is None and endplusone == 0:
+            break
+        end = offset + endplusone
+        offset = end
+        if msg is None:
+            continue
+        if isinstance(msg, SystemExclusive):
+            sysex_ends.append(end)
+            continue
+        if isinstance(msg, MIDIUnknownEvent):
+            raw, kind = bytes([msg.status]), KIND_UNKNOWN
+        elif isinstance(msg, MIDIBadEvent):
+            raw, kind = msg.data, KIND_BAD
+        else:
+            raw, kind = msg.__bytes__(), KIND_MESSAGE
+        start = end - len(raw)
+        raw += bytes(2)
+        channel = -1 if msg.channel is None else msg.channel
+        messages.append((start, raw[0], channel, raw[1], raw[2], kind))
+    return messages, sysex_ends
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class Test_decode(unittest.TestCase):
+    def check(self, data):
+        messages, sysex, _ = decode(bytes(data))
+        rows = [tuple(int(value) for value in row) for row in messages]
+        sysex_ends = [int(row["offset"] + row["length"]) for row in sysex]
+        self.assertEqual((rows, sysex_ends), reference_decode(bytes(data)))
+
+    def test_messages(self):
+        msgs = [
+            NoteOn(60, 100, channel=3),
+            NoteOff(60, 0, channel=3),
+            ControlChange(7, 127, channel=15),
+            PitchBend(16383, channel=1),
+            ChannelPressure(5),
+            PolyphonicKeyPressure(64, 3),
+            ProgramChange(9, channel=9),
+            MtcQuarterFrame(7, 15),
+            SystemExclusive([0x7D], b"\x01\x02"),
+            TimingClock(),
+            Start(),
+            Stop(),
+            Continue(),
+            ActiveSensing(),
+            Reset(),
+        ]
+        data = bytearray()
+        for msg in msgs:
+            if msg.channel is None and msg._STATUSMASK == 0xF0:
+                msg.channel = 0
+            data.extend(msg.__bytes__())
+        messages, sysex, consumed = decode(bytes(data))
+        self.assertEqual(consumed, len(data))
+        self.assertEqual(len(messages), len(msgs) - 1)
+        self.assertEqual(list(sysex[0]), [21, 5])
+        self.assertEqual(messages[0]["channel"], 3)
+        self.assertEqual(messages[7]["channel"], -1)
+        self.check(data)
+
+    def test_awkward(self):
+        # From the parser tests: partial SysEx, unknown statuses, real time
+        # bytes inside messages, running status and bad termination
+        vectors = [
+            [0x01, 0x02, 0x03, 0x04, 0xF7, 0x90, 0x30, 0x32],
+            [0xF3, 0x10, 0xF3, 0x20, 0xF4, 0xF5, 0x90, 0x48, 0x7F],
+            [0x90, 0x30, 0xF8, 0x7F, 0x90, 0x31, 0x40, 0x32, 0x40],
+            [0xF0, 0x7D, 0x01, 0x90, 0x30, 0x40, 0xF0, 0x00, 0xF7, 0xE0, 0xFF, 0x01],
+            [0xE0, 0x01, 0x90, 0xB0, 0x40],
+            [0xF0, 0x01, 0x02],
+            [],
+        ]
+        for vector in vectors:
+            with self.subTest(vector=vector):
+                self.check(vector)
+        messages, _, consumed = decode(bytes([0xF8, 0x90, 0x40]))
+        self.assertEqual(consumed, 1)
+        self.assertEqual(len(messages), 1)
+
+    def test_random(self):
+        rng = random.Random(42)
+        for _ in range(50):
+            data = bytes(rng.choice((rng.randrange(256), rng.randrange(128))) for _ in range(300))
+            self.check(data)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=verbose)
@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import os
+import unittest
+from unittest.mock import Mock, patch
+
+verbose = int(os.getenv("TESTVERBOSE", "2"))
+
+import sys
+
+# Borrowing the dhalbert/tannewt technique from adafruit/Adafruit_CircuitPython_Motor
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import adafruit_midi
+from adafruit_midi.note_on import NoteOn
+from adafruit_midi.pacer import PacedOutput
+
+
+def mocked_port():
+    writes = []
+    port = Mock()
+    port.write = lambda buffer, length: writes.append(bytes(buffer[:length]))
+    return port, writes
+
+
+class Test_PacedOutput(unittest.TestCase):
+    def test_release_at_line_rate(self):
+        port, writes = mocked_port()
+        paced = PacedOutput(port, tx_buffer=6)
+        midi = adafruit_midi.MIDI(midi_out=paced)
+        with patch("adafruit_midi.pacer.time.monotonic", return_value=100.0):
+            midi.send([NoteOn(note, 100) for note in range(60, 64)])
+        self.assertEqual(writes, [bytes([0x90, 60, 100, 0x90, 61, 100])])
+        self.assertEqual(paced.queued, 6)
+        self.assertEqual(paced.backlog(100.0), 12)
+        self.assertAlmostEqual(paced.backlog_ms(100.0), 12 * 0.32)
+
+        # Nothing has left the wire yet
+        self.assertEqual(paced.poll(100.0), 0)
+        # One 3 byte message later there is room for 3 more
+        self.assertEqual(paced.poll(100.00096), 3)
+        self.assertEqual(paced.in_flight(100.00096), 6)
+        self.assertEqual(paced.poll(101.0), 3)
+        self.assertEqual(paced.queued, 0)
+        self.assertEqual(b"".join(writes)[-3:], bytes([0x90, 63, 100]))
+        self.assertEqual(paced.backlog(102.0), 0)
+        self.assertEqual(paced.backlog_ms(102.0), 0.0)
+
+    def test_flush_and_baud(self):
+        port, writes = mocked_port()
+        paced = PacedOutput(port, baud=1000, tx_buffer=1)
+        self.assertAlmostEqual(paced.byte_time, 0.01)
+        with patch("adafruit_midi.pacer.time.monotonic", return_value=5.0):
+            paced.write(b"\xf0\x01\x02\x03\xf7", 5)
+        self.assertEqual(paced.queued, 4)
+        paced.flush(5.0)
+        self.assertEqual(b"".join(writes), b"\xf0\x01\x02\x03\xf7")
+        self.assertAlmostEqual(paced.backlog_ms(5.0), 50.0)
+        self.assertEqual(paced.in_flight(5.025), 3)
+
+    def test_bad_args(self):
+        with self.assertRaises(ValueError):
+            PacedOutput(Mock(), baud=0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=verbose)
@@ -0,0 +1,109 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import os
+import unittest
+from unittest.mock import Mock
+
+verbose = int(os.getenv("TESTVERBOSE", "2"))
+
+import sys
+
+# Borrowing the dhalbert/tannewt technique from adafruit/Adafruit_CircuitPython_Motor
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import adafruit_midi
+from adafruit_midi.control_change import ControlChange
+from adafruit_midi.midi_message import MIDIUnknownEvent
+from adafruit_midi.note_off import NoteOff
+from adafruit_midi.note_on import NoteOn
+from adafruit_midi.pitch_bend import PitchBend
+from adafruit_midi.router import MIDIRouter
+from adafruit_midi.timing_clock import TimingClock
+
+
+def MIDI_mocked_receive(data):
+    usb_data = bytearray(data)
+
+    def read(length):
+        nonlocal usb_data
+        poppedbytes = usb_data[0:length]
+        usb_data = usb_data[len(poppedbytes) :]
+        return bytes(poppedbytes)
+
+    mockedportin = Mock()
+    mockedportin.read = read
+    return adafruit_midi.MIDI(midi_in=mockedportin)
+
+
+class Test_MIDIRouter(unittest.TestCase):
+    def test_dispatch(self):
+        calls = []
+        router = MIDIRouter(None, default=lambda msg: calls.append(("default", msg)))
+
+        @router.route(NoteOn)
+        def any_note(msg):
+            calls.append(("note", msg.note))
+
+        @router.route(NoteOn, channel=2, number=60)
+        def middle_c(msg):
+            calls.append(("middle_c", msg.channel))
+
+        router.add(lambda msg: calls.append(("cc", msg.value)), 0xB0, channel=(0, 1))
+        router.add(lambda msg: calls.append(("clock", None)), TimingClock)
+
+        self.assertTrue(router.dispatch(NoteOn(60, channel=2)))
+        self.assertTrue(router.dispatch(NoteOn(61, channel=2)))
+        self.assertTrue(router.dispatch(NoteOn(60, channel=3)))
+        self.assertTrue(router.dispatch(ControlChange(7, 100, channel=1)))
+        self.assertFalse(router.dispatch(ControlChange(7, 100, channel=2)))
+        self.assertTrue(router.dispatch(TimingClock()))
+        unknown = MIDIUnknownEvent(0xF4)
+        self.assertFalse(router.dispatch(unknown))
+        self.assertEqual(
+            calls,
+            [
+                ("note", 60),
+                ("middle_c", 2),
+                ("note", 61),
+                ("note", 60),
+                ("cc", 100),
+                ("default", calls[5][1]),
+                ("clock", None),
+                ("default", unknown),
+            ],
+        )
+
+    def test_all_messages_and_remove(self):
+        calls = []
+        router = MIDIRouter(None)
+        handler = router.route()(calls.append)
+        router.dispatch(NoteOff(1, channel=0))
+        router.dispatch(TimingClock())
+        self.assertEqual(len(calls), 2)
+        router.remove(handler)
+        self.assertFalse(router.dispatch(TimingClock()))
+
+    def test_number_without_one(self):
+        router = MIDIRouter(None)
+        for message in (PitchBend, TimingClock, 0xD0, None):
+            with self.subTest(message=message), self.assertRaises(ValueError):
+                router.add(print, message, number=5)
+        router.add(print, 0xA0, number=5)
+
+    def test_poll(self):
+        midi = MIDI_mocked_receive(
+            bytes([0x90, 60, 100, 0xF8, 0x80, 60, 0, 0x90, 62, 100, 0xB0, 1, 2])
+        )
+        notes = []
+        router = MIDIRouter(midi)
+        router.add(lambda msg: notes.append(msg.note), NoteOn)
+        self.assertEqual(router.poll(max_messages=3), 3)
+        self.assertEqual(router.poll(), 2)
+        self.assertEqual(router.poll(), 0)
+        self.assertEqual(notes, [60, 62])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=verbose)
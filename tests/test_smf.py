@@ -0,0 +1,313 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import io
+import os
+import unittest
+
+verbose = int(os.getenv("TESTVERBOSE", "2"))
+
+import sys
+
+# Borrowing the dhalbert/tannewt technique from adafruit/Adafruit_CircuitPython_Motor
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from adafruit_midi.control_change import ControlChange
+from adafruit_midi.note_off import NoteOff
+from adafruit_midi.note_on import NoteOn
+from adafruit_midi.pitch_bend import PitchBend
+from adafruit_midi.smf import (
+    META_END_OF_TRACK,
+    META_TEMPO,
+    MetaEvent,
+    RawEvent,
+    SMFReader,
+    SMFWriter,
+    TempoMap,
+    encode_varint,
+    merge_tracks,
+    read_varint,
+)
+from adafruit_midi.system_exclusive import SystemExclusive
+
+
+def chunk(name, data):
+    return name + len(data).to_bytes(4, "big") + bytes(data)
+
+
+def smf(tracks, file_format=1, division=96):
+    header = chunk(
+        b"MThd",
+        file_format.to_bytes(2, "big")
+        + len(tracks).to_bytes(2, "big")
+        + division.to_bytes(2, "big"),
+    )
+    return header + b"".join(chunk(b"MTrk", track) for track in tracks)
+
+
+END = [0x00, 0xFF, 0x2F, 0x00]
+
+TRACK0 = [
+    0x00,
+    0xFF,
+    0x51,
+    0x03,
+    0x07,
+    0xA1,
+    0x20,  # tempo 500000
+    0x00,
+    0xFF,
+    0x03,
+    0x04,
+    ord("T"),
+    ord("e"),
+    ord("s"),
+    ord("t"),
+    0x81,
+    0x00,
+    0xF0,
+    0x03,
+    0x7D,
+    0x01,
+    0xF7,  # SysEx at 128
+    0x00,
+    0xF7,
+    0x02,
+    0xF8,
+    0xFA,  # escape
+] + END
+TRACK1 = (
+    [
+        0x00,
+        0x91,
+        0x3C,
+        0x64,
+        0x10,
+        0x40,
+        0x50,  # running status
+        0x20,
+        0xE1,
+        0x00,
+        0x40,
+        0x08,
+        0xB1,
+        0x07,
+        0x7F,
+        0x83,
+        0x60,
+        0x81,
+        0x3C,
+        0x00,
+    ]
+    + END
+    + [0x00, 0x90, 0x01, 0x02]
+)  # after the end of track
+
+
+class Test_varint(unittest.TestCase):
+    def test_round_trip(self):
+        for value, encoded in (
+            (0, b"\x00"),
+            (0x40, b"\x40"),
+            (0x7F, b"\x7f"),
+            (0x80, b"\x81\x00"),
+            (0x2000, b"\xc0\x00"),
+            (0x1FFFFF, b"\xff\xff\x7f"),
+            (0x0FFFFFFF, b"\xff\xff\xff\x7f"),
+        ):
+            self.assertEqual(encode_varint(value), encoded)
+            self.assertEqual(read_varint(b"\x00" + encoded, 1), (value, 1 + len(encoded)))
+        with self.assertRaises(ValueError):
+            encode_varint(0x10000000)
+        with self.assertRaises(ValueError):
+            read_varint(b"\xff\xff\xff\xff\x7f")
+
+
+class Test_SMFReader(unittest.TestCase):
+    def test_header(self):
+        reader = SMFReader(smf([TRACK0, TRACK1], division=480))
+        self.assertEqual(reader.format, 1)
+        self.assertEqual(reader.num_tracks, 2)
+        self.assertEqual(reader.ticks_per_quarter, 480)
+        self.assertIsNone(reader.frames_per_second)
+        reader = SMFReader(smf([END], 0, 0xE728))
+        self.assertIsNone(reader.ticks_per_quarter)
+        self.assertEqual((reader.frames_per_second, reader.ticks_per_frame), (25, 40))
+        with self.assertRaises(ValueError):
+            SMFReader(b"RIFF" + bytes(20))
+
+    def test_meta_and_sysex(self):
+        events = list(SMFReader(smf([TRACK0, TRACK1])).track(0))
+        self.assertEqual([tick for tick, _ in events], [0, 0, 128, 128, 128])
+        self.assertIsInstance(events[0][1], MetaEvent)
+        self.assertEqual(events[0][1].type, META_TEMPO)
+        self.assertEqual(events[0][1].tempo, 500000)
+        self.assertEqual(events[1][1].text, "Test")
+        self.assertIsInstance(events[2][1], SystemExclusive)
+        self.assertEqual(events[2][1].__bytes__(), b"\xf0\x7d\x01\xf7")
+        self.assertIsInstance(events[3][1], RawEvent)
+        self.assertEqual(events[3][1].data, b"\xf8\xfa")
+        self.assertEqual(events[4][1].type, META_END_OF_TRACK)
+
+    def test_channel_messages(self):
+        # A tiny buffer exercises refilling in the middle of events
+        reader = SMFReader(io.BytesIO(smf([TRACK0, TRACK1])), buffer_size=3)
+        events = list(reader.track(1))
+        self.assertEqual([tick for tick, _ in events], [0, 16, 48, 56, 536, 536])
+        msgs = [event for _, event in events]
+        self.assertIsInstance(msgs[0], NoteOn)
+        self.assertEqual((msgs[1].note, msgs[1].velocity, msgs[1].channel), (0x40, 0x50, 1))
+        self.assertIsInstance(msgs[2], PitchBend)
+        self.assertEqual(msgs[2].pitch_bend, 8192)
+        self.assertIsInstance(msgs[3], ControlChange)
+        self.assertIsInstance(msgs[4], NoteOff)
+
+    def test_interleaved_tracks(self):
+        reader = SMFReader(smf([TRACK0, TRACK1]))
+        first, second = reader.track(0), reader.track(1)
+        merged = []
+        for pair in zip(first, second):
+            merged.extend(pair)
+        self.assertEqual(len(merged), 10)
+        self.assertEqual(len(list(reader.events())), 11)
+
+    def test_alien_chunks_and_errors(self):
+        data = smf([TRACK1])
+        data = data[:14] + chunk(b"XFIH", b"\x01\x02") + data[14:]
+        self.assertEqual(SMFReader(data).num_tracks, 1)
+        with self.assertRaises(ValueError):
+            list(SMFReader(smf([[0x00, 0x3C, 0x40]])).track(0))
+        with self.assertRaises(ValueError):
+            list(SMFReader(smf([[0x00, 0x90, 0x3C]])).track(0))
+        with self.assertRaises(ValueError):
+            list(SMFReader(smf([[0x00, 0xF8]])).track(0))
+
+
+class Test_SMFWriter(unittest.TestCase):
+    def test_round_trip(self):
+        file = io.BytesIO()
+        with SMFWriter(file, ticks_per_quarter=96, buffer_size=4) as writer:
+            writer.write(0, MetaEvent(META_TEMPO, b"\x07\xa1\x20"))
+            writer.write(128, SystemExclusive([0x7D], [0x01]))
+            writer.write(128, RawEvent(b"\xf8\xfa"))
+            writer.start_track()
+            writer.write(0, NoteOn(60, 100), channel=1)
+            writer.write(16, NoteOn(64, 80), channel=1)
+            writer.write(48, PitchBend(8192), channel=1)
+            writer.write(56, ControlChange(7, 127), channel=1)
+            writer.write(536, bytes((0x81, 0x3C, 0x00)))
+        self.assertEqual(file.getvalue(), smf([TRACK0[:7] + TRACK0[15:], TRACK1[:-4]]))
+        self.assertEqual(writer.num_tracks, 2)
+
+    def test_running_status(self):
+        file = io.BytesIO()
+        with SMFWriter(file, file_format=0) as writer:
+            for note in range(10):
+                writer.write(note, NoteOn(note, 100), channel=0)
+            writer.write(10, MetaEvent(META_TEMPO, bytes(3)))
+            writer.write(10, NoteOff(0, 0), channel=0)
+            with self.assertRaises(ValueError):
+                writer.start_track()
+        track = list(SMFReader(file.getvalue()).track(0))
+        self.assertEqual(len(track), 13)
+        # The status is only written for the first note and after the meta event
+        self.assertEqual(len(file.getvalue()), 22 + 4 + 9 * 3 + 7 + 4 + 4)
+        self.assertEqual(track[12][1].type, META_END_OF_TRACK)
+
+    def test_errors(self):
+        writer = SMFWriter(io.BytesIO())
+        writer.write(10, NoteOn(60, 100), channel=0)
+        with self.assertRaises(ValueError):
+            writer.write(9, NoteOff(60, 0), channel=0)
+        writer.write(20, MetaEvent(META_END_OF_TRACK, b""))
+        with self.assertRaises(ValueError):
+            writer.write(20, NoteOff(60, 0), channel=0)
+        with self.assertRaises(ValueError):
+            SMFWriter(io.BytesIO(), file_format=2)
+
+    def test_seconds(self):
+        file = io.BytesIO()
+        with SMFWriter(file, ticks_per_quarter=480) as writer:
+            self.assertEqual(writer.tempo_map.seconds_to_ticks(1.0), 960)
+            writer.set_tempo(250000, 1.0)
+            self.assertEqual(writer.tempo_map.seconds_to_ticks(0.5), 480)
+            self.assertEqual(writer.tempo_map.seconds_to_ticks(2.0), 960 + 1920)
+            writer.start_track()
+            writer.write_at(1.5, NoteOn(60, 100), channel=0)
+        events = list(SMFReader(file.getvalue()).events())
+        self.assertEqual(events[0][:2], (0, 960))
+        self.assertEqual(events[0][2].tempo, 250000)
+        self.assertEqual(events[2][:2], (1, 960 + 960))
+        with self.assertRaises(ValueError):
+            writer.set_tempo(500000, 0.5)
+
+
+class Test_merge(unittest.TestCase):
+    def test_stable_order(self):
+        tracks = [
+            iter([(0, "a0"), (10, "a1"), (10, "a2"), (30, "a3")]),
+            iter([]),
+            iter([(0, "c0"), (10, "c1"), (20, "c2")]),
+            iter([(10, "d0"), (10, "d1")]),
+        ]
+        self.assertEqual(
+            [(tick, index, event) for tick, index, event in merge_tracks(tracks)],
+            [
+                (0, 0, "a0"),
+                (0, 2, "c0"),
+                (10, 0, "a1"),
+                (10, 0, "a2"),
+                (10, 2, "c1"),
+                (10, 3, "d0"),
+                (10, 3, "d1"),
+                (20, 2, "c2"),
+                (30, 0, "a3"),
+            ],
+        )
+
+    def test_timeline(self):
+        file = io.BytesIO()
+        with SMFWriter(file, ticks_per_quarter=100) as writer:
+            writer.write(200, MetaEvent(META_TEMPO, (1000000).to_bytes(3, "big")))
+            writer.write(300, RawEvent(b"\xfa"))
+            writer.start_track()
+            for tick in range(0, 400, 50):
+                writer.write(tick, NoteOn(60, 100), channel=0)
+            writer.start_track()
+            writer.write(200, NoteOff(60, 0), channel=1)
+        reader = SMFReader(file.getvalue())
+        timeline = list(reader.timeline())
+        self.assertEqual(len(timeline), 9)
+        self.assertEqual(
+            [seconds for seconds, _, _ in timeline],
+            [0.0, 0.25, 0.5, 0.75, 1.0, 1.0, 1.5, 2.0, 2.5],
+        )
+        # The tempo change in track 0 is before the note at the same tick
+        self.assertEqual(timeline[5][1], 2)
+        self.assertIsInstance(timeline[5][2], NoteOff)
+        every = list(reader.timeline(all_events=True))
+        self.assertEqual(len(every), 9 + 5)
+        self.assertEqual(every[4][2].tempo, 1000000)
+
+
+class Test_TempoMap(unittest.TestCase):
+    def test_conversion(self):
+        tempo_map = TempoMap(100)
+        tempo_map.add(200, 1000000)
+        tempo_map.add(200, 250000)
+        tempo_map.add(400, 500000)
+        self.assertEqual(len(tempo_map), 3)
+        for tick, seconds in ((0, 0.0), (100, 0.5), (200, 1.0), (300, 1.25), (500, 2.0)):
+            self.assertAlmostEqual(tempo_map.tick_to_seconds(tick), seconds)
+            self.assertEqual(tempo_map.seconds_to_ticks(seconds), tick)
+        self.assertEqual(tempo_map.tempo_at(399), 250000)
+        with self.assertRaises(ValueError):
+            tempo_map.add(300, 500000)
+        smpte = TempoMap(None, ticks_per_second=1000)
+        smpte.add(100, 250000)
+        self.assertAlmostEqual(smpte.tick_to_seconds(1500), 1.5)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=verbose)
@@ -0,0 +1,89 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import io
+import os
+import unittest
+
+verbose = int(os.getenv("TESTVERBOSE", "2"))
+
+import sys
+
+# Borrowing the dhalbert/tannewt technique from adafruit/Adafruit_CircuitPython_Motor
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from adafruit_midi.control_change import ControlChange
+from adafruit_midi.note_off import NoteOff
+from adafruit_midi.note_on import NoteOn
+from adafruit_midi.smf import META_TEMPO, MetaEvent, SMFReader, SMFWriter
+from adafruit_midi.smf_index import SeekIndex
+
+
+def song():
+    file = io.BytesIO()
+    with SMFWriter(file, ticks_per_quarter=96) as writer:
+        writer.set_tempo(500000)
+        writer.write(960, MetaEvent(META_TEMPO, (250000).to_bytes(3, "big")))
+        writer.start_track()
+        for beat in range(100):
+            note = 36 + beat % 48
+            # Several events on the same tick and a tempo change in this track
+            writer.write(beat * 24, NoteOn(note, 100), channel=0)
+            writer.write(beat * 24, ControlChange(1, beat), channel=0)
+            writer.write(beat * 24 + 12, NoteOff(note, 0), channel=0)
+            if beat == 50:
+                writer.write(beat * 24 + 12, MetaEvent(META_TEMPO, (1000000).to_bytes(3, "big")))
+    return SMFReader(file.getvalue(), buffer_size=16)
+
+
+def summary(events):
+    return [(tick, bytes(event)) for tick, event in events if not isinstance(event, MetaEvent)]
+
+
+class Test_SeekIndex(unittest.TestCase):
+    def test_track_from(self):
+        reader = song()
+        full = list(reader.track(1))
+        for interval in (1, 3, 64, 1000):
+            index = SeekIndex(reader, interval=interval)
+            self.assertEqual(index.end_tick, 99 * 24 + 12)
+            for tick in (0, 1, 12, 24, 25, 600, 1212, 2388, 2400):
+                with self.subTest(interval=interval, tick=tick):
+                    self.assertEqual(
+                        summary(index.track_from(1, tick)),
+                        summary(event for event in full if event[0] >= tick),
+                    )
+
+    def test_tempo_map(self):
+        index = SeekIndex(song(), interval=8)
+        tempo_map = index.tempo_map
+        self.assertEqual(len(tempo_map), 3)
+        self.assertEqual(tempo_map.tempo_at(959), 500000)
+        self.assertEqual(tempo_map.tempo_at(960), 250000)
+        self.assertEqual(tempo_map.tempo_at(1212), 1000000)
+        # 10 beats at 120 then 2.625 at 240 and the rest at 60
+        self.assertAlmostEqual(tempo_map.tick_to_seconds(1212), 5 + 2.625 * 0.25)
+        self.assertAlmostEqual(index.duration, 5.65625 + 1176 / 96)
+        self.assertEqual(tempo_map.seconds_to_ticks(5.65625), 1212)
+        events = list(index.track_from_seconds(1, 5.0))
+        self.assertEqual(events[0][0], 960)
+        self.assertEqual(len(index.tracks_from(0)), 2)
+
+    def test_timeline_from(self):
+        reader = song()
+        index = SeekIndex(reader, interval=16)
+        full = list(reader.timeline())
+        for seconds in (0.0, 4.9, 5.0, 6.0, 17.9, 30.0):
+            with self.subTest(seconds=seconds):
+                expected = [
+                    (time, bytes(event)) for time, _, event in full if time >= seconds - 1e-9
+                ]
+                self.assertEqual(
+                    [(time, bytes(event)) for time, _, event in index.timeline_from(seconds)],
+                    expected,
+                )
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=verbose)
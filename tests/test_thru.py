@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import os
+import unittest
+from unittest.mock import Mock
+
+verbose = int(os.getenv("TESTVERBOSE", "2"))
+
+import sys
+
+# Borrowing the dhalbert/tannewt technique from adafruit/Adafruit_CircuitPython_Motor
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import adafruit_midi
+from adafruit_midi.note_on import NoteOn
+from adafruit_midi.system_exclusive import SystemExclusive
+from adafruit_midi.thru import MIDIThru
+from adafruit_midi.timing_clock import TimingClock
+
+
+def MIDI_mocked_in(data):
+    usb_data = bytearray(data)
+
+    def read(length):
+        nonlocal usb_data
+        poppedbytes = usb_data[0:length]
+        usb_data = usb_data[len(poppedbytes) :]
+        return bytes(poppedbytes)
+
+    mockedportin = Mock()
+    mockedportin.read = read
+    return adafruit_midi.MIDI(midi_in=mockedportin)
+
+
+def MIDI_mocked_out():
+    sent = bytearray()
+    writes = []
+
+    def write(buffer, length):
+        writes.append(length)
+        sent.extend(buffer[:length])
+
+    mockedportout = Mock()
+    mockedportout.write = write
+    return adafruit_midi.MIDI(midi_out=mockedportout), sent, writes
+
+
+class Test_MIDIThru(unittest.TestCase):
+    def test_forward_all(self):
+        data = bytes([0x90, 60, 100, 61, 0xF8, 100, 0xC3, 1, 0xF0, 1, 2, 0xF8, 3, 0xF7, 0xF1, 5])
+        midi_in = MIDI_mocked_in(data)
+        out1, sent1, writes1 = MIDI_mocked_out()
+        out2, sent2, unused = MIDI_mocked_out()
+        thru = MIDIThru(midi_in, [out1, out2])
+        self.assertEqual(thru.process(), len(data))
+        self.assertEqual(thru.process(), 0)
+        expected = bytes(
+            [0x90, 60, 100, 0xF8, 0x90, 61, 100, 0xC3, 1] + [0xF0, 1, 2, 0xF8, 3, 0xF7, 0xF1, 5]
+        )
+        self.assertEqual(sent1, expected)
+        self.assertEqual(sent2, expected)
+        self.assertEqual(writes1, [len(expected)])
+
+    def test_split_messages(self):
+        thru_in = MIDI_mocked_in(b"")
+        out, sent, unused = MIDI_mocked_out()
+        thru = MIDIThru(thru_in, [out])
+        thru.forward(bytes([0xB0, 7]))
+        self.assertEqual(sent, b"")
+        thru.forward(bytes([100, 0xF7, 0x00]))
+        self.assertEqual(sent, bytes([0xB0, 7, 100]))
+
+    def test_filter_and_remap(self):
+        out1, sent1, unused = MIDI_mocked_out()
+        out2, sent2, unused = MIDI_mocked_out()
+        thru = MIDIThru(MIDI_mocked_in(b""), [out1, out2])
+        thru.drop(TimingClock)
+        thru.drop(SystemExclusive, output=1)
+        thru.drop(NoteOn, channel=1, output=0)
+        thru.remap(0, 9, output=1)
+        thru.drop_channel(2, output=1)
+        thru.forward(bytes([0x90, 1, 2, 0x91, 3, 4, 0xF8, 0xF0, 5, 0xF7, 0xB0, 6, 7, 0xE2, 0, 64]))
+        self.assertEqual(sent1, bytes([0x90, 1, 2, 0xF0, 5, 0xF7, 0xB0, 6, 7, 0xE2, 0, 64]))
+        self.assertEqual(sent2, bytes([0x99, 1, 2, 0x91, 3, 4, 0xB9, 6, 7]))
+
+        thru.reset()
+        thru.forward(bytes([0xF8]))
+        self.assertEqual(sent2[-1], 0xF8)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=verbose)
@@ -0,0 +1,109 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import os
+import unittest
+
+verbose = int(os.getenv("TESTVERBOSE", "2"))
+
+import sys
+
+# Borrowing the dhalbert/tannewt technique from adafruit/Adafruit_CircuitPython_Motor
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from adafruit_midi.control_change import ControlChange
+from adafruit_midi.note_off import NoteOff
+from adafruit_midi.note_on import NoteOn
+from adafruit_midi.pitch_bend import PitchBend
+from adafruit_midi.timing_clock import TimingClock
+from adafruit_midi.transform import Transform
+
+
+class Test_Transform_apply(unittest.TestCase):
+    def test_identity(self):
+        data = bytes([0x90, 60, 100, 0xF8, 0xC1, 5, 0xF0, 1, 2, 0xF7, 0xE2, 0, 64, 0xF2, 1, 2])
+        self.assertEqual(Transform().apply(data), data)
+
+    def test_running_status(self):
+        transform = Transform().transpose(1)
+        self.assertEqual(
+            transform.apply(bytes([0x90, 60, 100, 0xF8, 62, 0])),
+            bytes([0x90, 61, 100, 0xF8, 0x90, 63, 0]),
+        )
+
+    def test_real_time_inside_message(self):
+        transform = Transform().transpose(1)
+        self.assertEqual(
+            transform.apply(bytes([0x90, 60, 0xF8, 100, 0xC0, 0xFE, 5])),
+            bytes([0xF8, 0x90, 61, 100, 0xFE, 0xC0, 5]),
+        )
+        self.assertEqual(
+            Transform().drop(TimingClock).apply(bytes([0xB0, 0xF8, 7, 0xF8, 1])),
+            bytes([0xB0, 7, 1]),
+        )
+
+    def test_split_over_calls(self):
+        transform = Transform().transpose(2)
+        self.assertEqual(transform.apply(b"\x90\x3c"), b"")
+        self.assertEqual(transform.apply(b"\x64\x3e"), bytes([0x90, 62, 100]))
+        self.assertEqual(transform.apply(b"\x00\xf0\x01"), bytes([0x90, 64, 0, 0xF0, 1]))
+        self.assertEqual(transform.apply(b"\x02\xf7\xe0\x00"), bytes([2, 0xF7]))
+        self.assertEqual(transform.apply(b"\x40"), bytes([0xE0, 0, 64]))
+
+    def test_transpose_out_of_range(self):
+        transform = Transform().transpose(12, channel=0).transpose(-1, channel=0)
+        self.assertEqual(
+            transform.apply(bytes([0x90, 60, 100, 0x90, 120, 100, 0x91, 120, 100])),
+            bytes([0x90, 71, 100, 0x91, 120, 100]),
+        )
+
+    def test_transpose_back(self):
+        transform = Transform().transpose(12).transpose(-12)
+        data = bytes([0x90, 0, 100, 0x90, 120, 100, 0x80, 127, 0])
+        self.assertEqual(transform.apply(data), data)
+        self.assertEqual(
+            transform.transpose(200).transpose(-201).apply(data[3:6]), bytes([0x90, 119, 100])
+        )
+
+    def test_split_and_remap(self):
+        transform = Transform().split(60, 2, 3, channel=0).remap_channel(3, 9)
+        self.assertEqual(
+            transform.apply(bytes([0x90, 59, 1, 0x80, 60, 0, 0xB0, 7, 1, 0xB3, 7, 1])),
+            bytes([0x92, 59, 1, 0x89, 60, 0, 0xB0, 7, 1, 0xB9, 7, 1]),
+        )
+
+    def test_velocity_curve(self):
+        transform = Transform().velocity_curve(lambda v: v // 2, channel=1).remap_channel(0, 1)
+        self.assertEqual(
+            transform.apply(bytes([0x90, 60, 100, 0x90, 60, 1, 0x90, 60, 0, 0x80, 60, 100])),
+            bytes([0x91, 60, 50, 0x91, 60, 1, 0x91, 60, 0, 0x81, 60, 100]),
+        )
+        with self.assertRaises(ValueError):
+            Transform().velocity_curve([1, 2, 3])
+
+    def test_drop(self):
+        transform = Transform().drop(TimingClock).drop(PitchBend, channel=0)
+        self.assertEqual(
+            transform.apply(bytes([0xF8, 0xE0, 0, 64, 0xE1, 0, 64])), bytes([0xE1, 0, 64])
+        )
+
+
+class Test_Transform_apply_message(unittest.TestCase):
+    def test_note(self):
+        transform = Transform().transpose(-12).split(48, 4, 5).velocity_curve([127] * 128)
+        msg = transform.apply_message(NoteOn(60, 10, channel=0))
+        self.assertEqual((msg.note, msg.velocity, msg.channel), (48, 127, 5))
+        msg = transform.apply_message(NoteOff(59, channel=0))
+        self.assertEqual((msg.note, msg.channel), (47, 4))
+        self.assertIsNone(transform.apply_message(NoteOn(5, 10, channel=0)))
+
+    def test_other(self):
+        transform = Transform().remap_channel(0, 6).drop(TimingClock)
+        msg = transform.apply_message(ControlChange(1, 2, channel=0))
+        self.assertEqual(msg.channel, 6)
+        self.assertIsNone(transform.apply_message(TimingClock()))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=verbose)
@@ -0,0 +1,113 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import os
+import unittest
+from array import array
+
+verbose = int(os.getenv("TESTVERBOSE", "2"))
+
+import sys
+
+# Borrowing the dhalbert/tannewt technique from adafruit/Adafruit_CircuitPython_Motor
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from adafruit_midi.control_change import ControlChange
+from adafruit_midi.note_on import NoteOn
+from adafruit_midi.ump import UmpDecoder, UmpEncoder, scale_up
+
+
+class Test_scaling(unittest.TestCase):
+    def test_min_center_max(self):
+        self.assertEqual(scale_up(0, 7, 16), 0)
+        self.assertEqual(scale_up(64, 7, 16), 0x8000)
+        self.assertEqual(scale_up(127, 7, 16), 0xFFFF)
+        self.assertEqual(scale_up(127, 7, 32), 0xFFFFFFFF)
+        self.assertEqual(scale_up(0x2000, 14, 32), 0x80000000)
+        self.assertEqual(scale_up(0x3FFF, 14, 32), 0xFFFFFFFF)
+
+    def test_monotonic(self):
+        values = [scale_up(v, 7, 32) for v in range(128)]
+        self.assertEqual(values, sorted(values))
+
+
+class Test_UmpEncoder(unittest.TestCase):
+    def test_midi2_note_on(self):
+        words = UmpEncoder(group=1).encode(bytes([0x93, 60, 127]))
+        self.assertEqual(list(words), [0x41933C00, 0xFFFF0000])
+
+    def test_midi2_note_on_velocity_zero(self):
+        words = UmpEncoder().encode(bytes([0x90, 60, 0]))
+        self.assertEqual(list(words), [0x40803C00, 0x00000000])
+
+    def test_midi2_controllers(self):
+        words = UmpEncoder().encode(bytes([0xB2, 7, 64, 0xE0, 0x00, 0x40, 0xC5, 10, 0xD1, 127]))
+        self.assertEqual(
+            list(words),
+            [0x40B20700, 0x80000000, 0x40E00000, 0x80000000]
+            + [0x40C50000, 0x0A000000, 0x40D10000, 0xFFFFFFFF],
+        )
+
+    def test_midi1_protocol(self):
+        words = UmpEncoder(midi2=False).encode(bytes([0x90, 60, 100, 61, 101]))
+        self.assertEqual(list(words), [0x2090 << 16 | 60 << 8 | 100, 0x2090 << 16 | 61 << 8 | 101])
+
+    def test_system(self):
+        words = UmpEncoder().encode(bytes([0xF8, 0xF2, 0x01, 0x02, 0xF6]))
+        self.assertEqual(list(words), [0x10F80000, 0x10F20102, 0x10F60000])
+
+    def test_sysex(self):
+        encoder = UmpEncoder()
+        words = encoder.encode(bytes([0xF0, 1, 2, 3, 0xF7]))
+        self.assertEqual(list(words), [0x30030102, 0x03000000])
+        words = encoder.encode(bytes([0xF0] + list(range(1, 14)) + [0xF7]))
+        self.assertEqual(
+            list(words),
+            [0x30160102, 0x03040506, 0x30260708, 0x090A0B0C, 0x30310D00, 0x00000000],
+        )
+
+    def test_encode_message(self):
+        words = array("I")
+        encoder = UmpEncoder()
+        encoder.encode_message(NoteOn(60, 64, channel=0), words)
+        encoder.encode_message(ControlChange(1, 0, channel=0), words)
+        self.assertEqual(list(words), [0x40903C00, 0x80000000, 0x40B00100, 0x00000000])
+
+
+class Test_UmpDecoder(unittest.TestCase):
+    def test_round_trip(self):
+        stream = bytes(
+            [0x90, 60, 100, 0x80, 60, 0, 0xA1, 61, 33, 0xB2, 7, 99]
+            + [0xC3, 5, 0xD4, 17, 0xE5, 0x12, 0x34, 0xF8, 0xF3, 0x02]
+            + [0xF0]
+            + list(range(20))
+            + [0xF7]
+        )
+        for midi2 in (True, False):
+            words = UmpEncoder(midi2=midi2).encode(stream)
+            self.assertEqual(UmpDecoder().decode(words), stream)
+
+    def test_note_on_minimum_velocity(self):
+        self.assertEqual(
+            UmpDecoder().decode(array("I", [0x40903C00, 0x00010000])), bytes([0x90, 60, 1])
+        )
+
+    def test_program_change_bank(self):
+        out = UmpDecoder().decode(array("I", [0x40C20001, 0x05000307]))
+        self.assertEqual(out, bytes([0xB2, 0, 3, 0xB2, 32, 7, 0xC2, 5]))
+        # Without the bank valid flag the bank is ignored
+        out = UmpDecoder().decode(array("I", [0x40C20000, 0x05000307]))
+        self.assertEqual(out, bytes([0xC2, 5]))
+
+    def test_rpn(self):
+        out = UmpDecoder().decode(array("I", [0x40200000, 0x80000000]))
+        self.assertEqual(out, bytes([0xB0, 101, 0, 0xB0, 100, 0, 0xB0, 6, 64, 0xB0, 38, 0]))
+
+    def test_group_filter_and_skip(self):
+        words = array("I", [0x00000000, 0x41903C00, 0xFFFF0000, 0xF0000000, 0, 0, 0, 0x20903C40])
+        self.assertEqual(UmpDecoder(group=0).decode(words), bytes([0x90, 60, 0x40]))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=verbose)
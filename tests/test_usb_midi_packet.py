@@ -0,0 +1,135 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import os
+import unittest
+from unittest.mock import Mock
+
+verbose = int(os.getenv("TESTVERBOSE", "2"))
+
+import sys
+
+# Borrowing the dhalbert/tannewt technique from adafruit/Adafruit_CircuitPython_Motor
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import adafruit_midi
+from adafruit_midi.note_on import NoteOn
+from adafruit_midi.system_exclusive import SystemExclusive
+from adafruit_midi.usb_midi_packet import (
+    UsbMidiPacketDecoder,
+    UsbMidiPacketEncoder,
+    UsbMidiPacketPort,
+)
+
+
+class Test_UsbMidiPacketEncoder(unittest.TestCase):
+    def test_channel_messages(self):
+        encoder = UsbMidiPacketEncoder(cable=1)
+        packets = encoder.encode(bytes([0x91, 0x3C, 0x7F, 0xC2, 0x05]))
+        self.assertEqual(packets, bytes([0x19, 0x91, 0x3C, 0x7F, 0x1C, 0xC2, 0x05, 0x00]))
+
+    def test_running_status_and_split(self):
+        encoder = UsbMidiPacketEncoder()
+        packets = encoder.encode(bytes([0x90, 0x3C]))
+        self.assertEqual(packets, b"")
+        packets = encoder.encode(bytes([0x7F, 0x3E, 0x00]))
+        self.assertEqual(packets, bytes([0x09, 0x90, 0x3C, 0x7F, 0x09, 0x90, 0x3E, 0x00]))
+
+    def test_realtime_inside_message(self):
+        encoder = UsbMidiPacketEncoder()
+        packets = encoder.encode(bytes([0xB0, 0x07, 0xF8, 0x64]))
+        self.assertEqual(packets, bytes([0x0F, 0xF8, 0x00, 0x00, 0x0B, 0xB0, 0x07, 0x64]))
+
+    def test_system_common(self):
+        encoder = UsbMidiPacketEncoder()
+        packets = encoder.encode(bytes([0xF1, 0x23, 0xF2, 0x01, 0x02, 0xF6]))
+        self.assertEqual(
+            packets,
+            bytes([0x02, 0xF1, 0x23, 0x00, 0x03, 0xF2, 0x01, 0x02, 0x05, 0xF6, 0x00, 0x00]),
+        )
+
+    def test_sysex(self):
+        encoder = UsbMidiPacketEncoder()
+        for data, last in (
+            ([], [0x06, 0xF0, 0xF7, 0x00]),
+            ([0x01], [0x07, 0xF0, 0x01, 0xF7]),
+            ([0x01, 0x02], [0x04, 0xF0, 0x01, 0x02, 0x05, 0xF7, 0x00, 0x00]),
+            ([0x01, 0x02, 0x03], [0x04, 0xF0, 0x01, 0x02, 0x06, 0x03, 0xF7, 0x00]),
+        ):
+            packets = encoder.encode(bytes([0xF0] + data + [0xF7]))
+            self.assertEqual(packets, bytes(last))
+
+    def test_encode_message(self):
+        encoder = UsbMidiPacketEncoder()
+        out = bytearray()
+        encoder.encode_message(NoteOn(60, 100, channel=3), out)
+        self.assertEqual(out, bytes([0x09, 0x93, 60, 100]))
+
+    def test_bad_cable(self):
+        with self.assertRaises(ValueError):
+            UsbMidiPacketEncoder(16)
+
+
+class Test_UsbMidiPacketDecoder(unittest.TestCase):
+    def test_round_trip(self):
+        stream = bytes(
+            [0x90, 0x3C, 0x7F, 0xF8, 0xC0, 0x01]
+            + [0xF0, 0x7D, 0x01, 0x02, 0x03, 0x04, 0xF7]
+            + [0xF3, 0x02, 0xE5, 0x00, 0x40]
+        )
+        packets = UsbMidiPacketEncoder().encode(stream)
+        self.assertEqual(len(packets) % 4, 0)
+        self.assertEqual(UsbMidiPacketDecoder().decode(packets), stream)
+
+    def test_partial_packets(self):
+        packets = UsbMidiPacketEncoder().encode(bytes([0x90, 0x3C, 0x7F, 0x80, 0x3C, 0x00]))
+        decoder = UsbMidiPacketDecoder()
+        out = bytearray()
+        for idx in range(len(packets)):
+            decoder.decode(packets[idx : idx + 1], out)
+        self.assertEqual(out, bytes([0x90, 0x3C, 0x7F, 0x80, 0x3C, 0x00]))
+
+    def test_cable_filter(self):
+        packets = bytes([0x09, 0x90, 0x3C, 0x7F, 0x19, 0x91, 0x3D, 0x7F, 0x00, 0x00, 0x00, 0x00])
+        self.assertEqual(UsbMidiPacketDecoder(1).decode(packets), bytes([0x91, 0x3D, 0x7F]))
+
+
+class Test_UsbMidiPacketPort(unittest.TestCase):
+    def test_midi_loopback(self):
+        wire = bytearray()
+
+        def write(buffer, length):
+            wire.extend(buffer[:length])
+
+        def read(length):
+            nonlocal wire
+            popped = wire[:length]
+            wire = wire[length:]
+            return bytes(popped)
+
+        packets_out = Mock()
+        packets_out.write = write
+        packets_in = Mock()
+        packets_in.read = read
+        port = UsbMidiPacketPort(packets_in, packets_out, cable=2)
+        midi = adafruit_midi.MIDI(midi_in=port, midi_out=port, in_buf_size=10)
+
+        midi.send(NoteOn(60, 100), channel=4)
+        midi.send(SystemExclusive([0x7D], [0x01, 0x02, 0x03]))
+        self.assertEqual(wire[:4], bytes([0x29, 0x94, 60, 100]))
+        self.assertTrue(all(wire[idx] >> 4 == 2 for idx in range(0, len(wire), 4)))
+
+        msgs = []
+        for unused in range(10):
+            msg = midi.receive()
+            if msg is not None:
+                msgs.append(msg)
+        self.assertIsInstance(msgs[0], NoteOn)
+        self.assertEqual((msgs[0].note, msgs[0].velocity, msgs[0].channel), (60, 100, 4))
+        self.assertIsInstance(msgs[1], SystemExclusive)
+        self.assertEqual(msgs[1].data, bytes([0x01, 0x02, 0x03]))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=verbose)